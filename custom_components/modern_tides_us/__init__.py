@@ -3,6 +3,7 @@ Custom component for Modern Tides US integration with Home Assistant.
 For more details about this component, please refer to the documentation at
 https://github.com/andrewyoung918/Modern-tides-us
 """
+import asyncio
 import logging
 from datetime import timedelta
 import os
@@ -36,14 +37,37 @@ from .const import (
     CONF_STATION_ID,
     CONF_STATION_NAME,
     CONF_STATIONS,
+    CONF_IMAGE_FORMAT,
+    CONF_NOW_MARKER,
     CONF_UPDATE_INTERVAL,
+    DATA_RENDER_ENGINE,
+    DEFAULT_IMAGE_FORMAT,
+    DEFAULT_NOW_MARKER,
     DOMAIN,
+    EXPORT_ARTIFACTS,
     INTERVALS,
+    LONG_PLOT_DAYS,
+    LONG_RANGE_FETCH_DAYS,
+    NOW_MARKER_ANIMATED,
     PLATFORMS,
-    PLOT_DAYS_TO_GENERATE
+    PLOT_DAYS_TO_GENERATE,
+    PRECOMPRESS_ARTIFACTS,
+    RENDER_TIMEOUT
 )
+from .artifacts import ARTIFACT_CALENDAR, ARTIFACT_PLOT, ARTIFACT_TABLE
+from .envelope import TideEnvelope
 from .tide_api import TideApiClient
-from .plot_manager import TidePlotManager, TideTableManager
+from .plot_manager import (
+    THEME_DARK,
+    THEME_LIGHT,
+    TideCalendarManager,
+    TideEnvelopePlotManager,
+    TidePlotManager,
+    TideTableManager,
+)
+from .render_engine import RenderEngine
+from .store import StationStore
+from .views import TideImageView, TideSeriesView
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,11 +90,17 @@ class TideDataCoordinator(DataUpdateCoordinator):
         self,
         hass: HomeAssistant,
         station: dict,
+        render_engine: RenderEngine,
     ):
         """Initialize coordinator."""
         self.station_id = station[CONF_STATION_ID]
         self.station_name = station[CONF_STATION_NAME]
         self.api_client = TideApiClient()
+        self.render_engine = render_engine
+        # Station coordinates, looked up once from NOAA station metadata
+        self.station_location = None
+        # Format the station's cameras serve (SVG or PNG)
+        self.image_format = station.get(CONF_IMAGE_FORMAT, DEFAULT_IMAGE_FORMAT)
         
         # Convert update interval string to minutes
         update_interval_str = station.get(CONF_UPDATE_INTERVAL, "1h")
@@ -82,8 +112,10 @@ class TideDataCoordinator(DataUpdateCoordinator):
 
         # Initialize plot managers for tide charts (light and dark mode) for multiple days
         safe_name = self.station_name.lower().replace(" ", "_").replace("-", "_")
-        
-        # Create plot managers for each day configuration
+        animate_now_marker = station.get(CONF_NOW_MARKER, DEFAULT_NOW_MARKER) == NOW_MARKER_ANIMATED
+
+        # Create plot managers for each day configuration. Each manager lays
+        # a plot out once and stamps both the light and dark files from it.
         self.plot_managers = {}
         
         for days in PLOT_DAYS_TO_GENERATE:
@@ -94,56 +126,64 @@ class TideDataCoordinator(DataUpdateCoordinator):
             else:
                 filename_suffix = f"_{days}d"
             
-            # Light mode plot manager
-            plot_filename_light = hass.config.path("www", f"{DOMAIN}_{safe_name}_plot{filename_suffix}.svg")
-            light_manager = TidePlotManager(
+            self.plot_managers[days] = TidePlotManager(
                 name=self.station_name,
-                filename=plot_filename_light,
+                filenames={
+                    THEME_LIGHT: hass.config.path("www", f"{DOMAIN}_{safe_name}_plot{filename_suffix}.svg"),
+                    THEME_DARK: hass.config.path("www", f"{DOMAIN}_{safe_name}_plot{filename_suffix}_dark.svg"),
+                },
                 transparent_background=False,
-                dark_mode=False,
-                plot_days=days
+                plot_days=days,
+                animate_now_marker=animate_now_marker,
+                precompress=PRECOMPRESS_ARTIFACTS,
+                artifact_id=(self.station_id, ARTIFACT_PLOT, days),
+                export=EXPORT_ARTIFACTS
             )
-            
-            # Dark mode plot manager
-            plot_filename_dark = hass.config.path("www", f"{DOMAIN}_{safe_name}_plot{filename_suffix}_dark.svg")
-            dark_manager = TidePlotManager(
+
+        # Long-horizon plots, drawn from the min/max envelope below
+        for days in LONG_PLOT_DAYS:
+            self.plot_managers[days] = TideEnvelopePlotManager(
                 name=self.station_name,
-                filename=plot_filename_dark,
-                transparent_background=False,
-                dark_mode=True,
-                plot_days=days
+                filenames={
+                    THEME_LIGHT: hass.config.path("www", f"{DOMAIN}_{safe_name}_plot_{days}d.svg"),
+                    THEME_DARK: hass.config.path("www", f"{DOMAIN}_{safe_name}_plot_{days}d_dark.svg"),
+                },
+                plot_days=days,
+                precompress=PRECOMPRESS_ARTIFACTS,
+                artifact_id=(self.station_id, ARTIFACT_PLOT, days),
+                export=EXPORT_ARTIFACTS
             )
-            
-            self.plot_managers[days] = {
-                'light': light_manager,
-                'dark': dark_manager
-            }
+
+        # Hourly min/max envelope of the long horizon; kept across updates so
+        # that each update only fetches the days that came into range
+        self.envelope = TideEnvelope()
 
         # Create table managers for 3, 5, 7 day schedules
         self.table_managers = {}
         for table_days in [3, 5, 7]:
-            # Light mode table manager
-            table_filename_light = hass.config.path("www", f"{DOMAIN}_{safe_name}_table_{table_days}d.svg")
-            light_table_manager = TideTableManager(
+            self.table_managers[table_days] = TideTableManager(
                 name=self.station_name,
-                filename=table_filename_light,
-                dark_mode=False,
-                table_days=table_days
+                filenames={
+                    THEME_LIGHT: hass.config.path("www", f"{DOMAIN}_{safe_name}_table_{table_days}d.svg"),
+                    THEME_DARK: hass.config.path("www", f"{DOMAIN}_{safe_name}_table_{table_days}d_dark.svg"),
+                },
+                table_days=table_days,
+                precompress=PRECOMPRESS_ARTIFACTS,
+                artifact_id=(self.station_id, ARTIFACT_TABLE, table_days),
+                export=EXPORT_ARTIFACTS
             )
 
-            # Dark mode table manager
-            table_filename_dark = hass.config.path("www", f"{DOMAIN}_{safe_name}_table_{table_days}d_dark.svg")
-            dark_table_manager = TideTableManager(
-                name=self.station_name,
-                filename=table_filename_dark,
-                dark_mode=True,
-                table_days=table_days
-            )
-
-            self.table_managers[table_days] = {
-                'light': light_table_manager,
-                'dark': dark_table_manager
-            }
+        # Month-at-a-glance calendar drawn from the monthly high/low events
+        self.calendar_manager = TideCalendarManager(
+            name=self.station_name,
+            filenames={
+                THEME_LIGHT: hass.config.path("www", f"{DOMAIN}_{safe_name}_calendar.svg"),
+                THEME_DARK: hass.config.path("www", f"{DOMAIN}_{safe_name}_calendar_dark.svg"),
+            },
+            precompress=PRECOMPRESS_ARTIFACTS,
+            artifact_id=(self.station_id, ARTIFACT_CALENDAR, None),
+            export=EXPORT_ARTIFACTS
+        )
 
         super().__init__(
             hass,
@@ -177,284 +217,191 @@ class TideDataCoordinator(DataUpdateCoordinator):
                         })
                         _LOGGER.debug("Got data for station %s, date %s", self.station_id, date_str)
                 
-                # For backwards compatibility, use the first day as "daily_data"
-                daily_data = all_daily_data[0]['data'] if all_daily_data else {}
-                
-                # Log the data structure for debugging
-                _LOGGER.debug("Daily data for station %s: %s", self.station_id, daily_data)
-                
                 # Get current month data for trend analysis
                 current_month = datetime.datetime.now().strftime("%Y%m")
                 monthly_data = await self.hass.async_add_executor_job(
                     self.api_client.get_monthly_tides, self.station_id, current_month
                 )
-                
-                # Combine data
-                data = {
-                    "daily": daily_data,
-                    "monthly": monthly_data,
-                    "all_daily_data": all_daily_data,  # Include all days for multi-day plots
-                    "station_id": self.station_id,
-                    "station_name": self.station_name
-                }
-                
-                # Process data to extract current tide height and next events
-                if daily_data and "mareas" in daily_data and "datos" in daily_data["mareas"]:
-                    if "marea" in daily_data["mareas"]["datos"]:
-                        # Current API format has data in 'datos.marea'
-                        data.update(self._process_tide_data(daily_data["mareas"]["datos"]["marea"]))
-                    else:
-                        _LOGGER.error("Unexpected data format: 'marea' key not found in 'datos'")
-                else:
-                    _LOGGER.error("No valid tide data found for station %s", self.station_id)
-                
-                # Generate tide plots for all day configurations
-                # Each plot is generated independently to prevent one failure from breaking all plots
-                if daily_data:
-                    for days in PLOT_DAYS_TO_GENERATE:
-                        try:
-                            # Create data subset for this day range
-                            days_data = {
-                                **data,
-                                "plot_days": days,
-                                "all_daily_data": all_daily_data[:days]  # Only include days up to this range
-                            }
-
-                            # Generate light mode plot
-                            try:
-                                await self.hass.async_add_executor_job(
-                                    self.plot_managers[days]['light'].generate_tide_plot, days_data
-                                )
-                                _LOGGER.debug("Generated %d-day light plot for station %s", days, self.station_id)
-                            except Exception as light_err:
-                                _LOGGER.warning("Failed to generate %d-day light plot for station %s: %s",
-                                              days, self.station_id, light_err)
-
-                            # Generate dark mode plot
-                            try:
-                                await self.hass.async_add_executor_job(
-                                    self.plot_managers[days]['dark'].generate_tide_plot, days_data
-                                )
-                                _LOGGER.debug("Generated %d-day dark plot for station %s", days, self.station_id)
-                            except Exception as dark_err:
-                                _LOGGER.warning("Failed to generate %d-day dark plot for station %s: %s",
-                                              days, self.station_id, dark_err)
-
-                        except Exception as plot_err:
-                            _LOGGER.warning("Failed to generate %d-day plots for station %s: %s",
-                                           days, self.station_id, plot_err)
-
-                    _LOGGER.debug("Tide plot generation completed for station %s", self.station_id)
-
-                    # Generate tide tables for 3, 5, 7 day schedules
-                    for table_days in [3, 5, 7]:
-                        try:
-                            # Create data subset for this table range
-                            table_data = {
-                                **data,
-                                "table_days": table_days,
-                                "all_daily_data": all_daily_data[:table_days]
-                            }
-
-                            # Generate light mode table
-                            try:
-                                await self.hass.async_add_executor_job(
-                                    self.table_managers[table_days]['light'].generate_tide_table, table_data
-                                )
-                                _LOGGER.debug("Generated %d-day light table for station %s", table_days, self.station_id)
-                            except Exception as light_err:
-                                _LOGGER.warning("Failed to generate %d-day light table for station %s: %s",
-                                              table_days, self.station_id, light_err)
-
-                            # Generate dark mode table
-                            try:
-                                await self.hass.async_add_executor_job(
-                                    self.table_managers[table_days]['dark'].generate_tide_table, table_data
-                                )
-                                _LOGGER.debug("Generated %d-day dark table for station %s", table_days, self.station_id)
-                            except Exception as dark_err:
-                                _LOGGER.warning("Failed to generate %d-day dark table for station %s: %s",
-                                              table_days, self.station_id, dark_err)
-
-                        except Exception as table_err:
-                            _LOGGER.warning("Failed to generate %d-day tables for station %s: %s",
-                                           table_days, self.station_id, table_err)
-
-                    _LOGGER.debug("Tide table generation completed for station %s", self.station_id)
-
-                return data
+
+            # Station metadata and the long-range envelope are extras: they
+            # run outside the API timeout, and a failure keeps what we had
+            if self.station_location is None:
+                try:
+                    self.station_location = await self.hass.async_add_executor_job(
+                        self.api_client.get_station_location, self.station_id
+                    )
+                except Exception as err:
+                    _LOGGER.warning("Failed to look up the location of station %s: %s",
+                                    self.station_id, err)
+
+            try:
+                await self._async_extend_envelope()
+            except Exception as err:
+                _LOGGER.warning("Failed to extend the tide envelope of station %s, keeping the previous one: %s",
+                                self.station_id, err)
+
+            # Parse everything once into the station store; the raw payloads
+            # are not kept
+            data = StationStore.from_api(
+                self.station_id,
+                self.station_name,
+                all_daily_data,
+                monthly_data,
+                dt_util.now().tzinfo,
+                self.station_location or self._home_location(),
+                self.envelope,
+            )
+
+            # Sensors derive the current height and next events from the timeline
+            if not len(data.timeline):
+                _LOGGER.error("No valid tide data found for station %s", self.station_id)
+
+            data.check_memory_budget()
+
+            # Render all plots and tables as one batch, outside the API timeout
+            if len(data.timeline):
+                await self._async_render_artifacts(data)
+
+            return data
         except Exception as err:
             _LOGGER.error("Error updating data for station %s: %s", self.station_id, err)
             import traceback
             _LOGGER.error("Traceback: %s", traceback.format_exc())
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    def _process_tide_data(self, tide_data):
-        """Process tide data to extract current and next tide information."""
-        now = dt_util.now()  # Use Home Assistant's dt_util for timezone-aware datetime
-        today = now.strftime("%Y-%m-%d")
-        current_height = None
-        next_high = None
-        next_low = None
-        
-        # Log the tide data for debugging
-        _LOGGER.debug("Processing tide data for station %s: %s", self.station_id, tide_data)
-        
-        # Find current tide height (interpolate between points if needed)
-        tide_points = []
-        processed_tide_points = []  # For plot manager
-        for point in tide_data:
-            # Log each point for debugging
-            _LOGGER.debug("Processing tide point: %s", point)
-            
-            if "hora" in point and "altura" in point:
-                time_str = point["hora"]  # Format is "HH:MM"
-                height = float(point["altura"])
-                
-                try:
-                    # Parse the time (format: "HH:MM")
-                    # API returns local time (lst_ldt parameter)
-                    time_parts = time_str.split(":")
-                    hours = int(time_parts[0])
-                    minutes = int(time_parts[1])
-
-                    # Create a naive datetime with today's date and the time from API
-                    local_time = datetime.datetime(
-                        year=now.year,
-                        month=now.month,
-                        day=now.day,
-                        hour=hours,
-                        minute=minutes
-                    )
-
-                    # Make it timezone-aware using Home Assistant's timezone
-                    tide_time = dt_util.as_local(local_time)
-
-                    # Handle case when tide time is past midnight but still part of today's data
-                    if tide_time > now + datetime.timedelta(hours=12):
-                        prev_day_time = local_time - datetime.timedelta(days=1)
-                        tide_time = dt_util.as_local(prev_day_time)
-                    elif tide_time < now - datetime.timedelta(hours=12):
-                        next_day_time = local_time + datetime.timedelta(days=1)
-                        tide_time = dt_util.as_local(next_day_time)
-                        
-                    tide_points.append((tide_time, height))
-                    processed_tide_points.append({
-                        'time': tide_time,
-                        'height': height
-                    })
-                    _LOGGER.debug("Added tide point for station %s: time=%s, height=%s", 
-                                 self.station_id, tide_time, height)
-                except ValueError as e:
-                    _LOGGER.error("Error parsing tide time: %s - %s", time_str, e)
-                    continue
-        
-        # Sort by time
-        tide_points.sort(key=lambda x: x[0])
-        
-        # Find current height through linear interpolation
-        for i in range(len(tide_points) - 1):
-            if tide_points[i][0] <= now <= tide_points[i+1][0]:
-                t1, h1 = tide_points[i]
-                t2, h2 = tide_points[i+1]
-                
-                # Linear interpolation
-                time_diff = (t2 - t1).total_seconds()
-                height_diff = h2 - h1
-                now_diff = (now - t1).total_seconds()
-                
-                if time_diff > 0:
-                    current_height = h1 + (height_diff * now_diff / time_diff)
-                else:
-                    current_height = h1
+    async def _async_extend_envelope(self):
+        """Bring the long-horizon envelope up to the next LONG_PLOT_DAYS days.
+
+        Past days are dropped and only the days not yet covered are fetched,
+        in chunks of LONG_RANGE_FETCH_DAYS. A failed chunk leaves the rest
+        for the next update.
+
+        The station store, cameras and render workers hold the current
+        envelope, so a copy is extended in the executor and then swapped in.
+        """
+        today = dt_util.start_of_local_day()
+        envelope = await self.hass.async_add_executor_job(self.envelope.copy)
+        await self.hass.async_add_executor_job(envelope.start_at, today.timestamp(), today.tzinfo)
+
+        day = today.date()
+        if envelope.covered_until is not None:
+            day = max(day, dt_util.as_local(dt_util.utc_from_timestamp(envelope.covered_until)).date())
+        horizon = today.date() + timedelta(days=max(LONG_PLOT_DAYS))
+
+        while day < horizon:
+            chunk_end = min(day + timedelta(days=LONG_RANGE_FETCH_DAYS), horizon)
+            predictions = await self.hass.async_add_executor_job(
+                self.api_client.get_range_predictions,
+                self.station_id,
+                day.strftime("%Y%m%d"),
+                (chunk_end - timedelta(days=1)).strftime("%Y%m%d"),
+            )
+            if not predictions:
+                _LOGGER.warning("No long-range predictions for station %s from %s", self.station_id, day)
                 break
-        
-        # If we couldn't interpolate, use the closest data point
-        if current_height is None and tide_points:
-            tide_points.sort(key=lambda x: abs((x[0] - now).total_seconds()))
-            current_height = tide_points[0][1]
-        
-        # Identify tide type points (high/low)
-        high_tides = []
-        low_tides = []
-        
-        for point in tide_data:
-            if "hora" in point and "altura" in point and "tipo" in point:
-                time_str = point["hora"]  # Format is "HH:MM"
-                height = float(point["altura"])
-                tide_type = point["tipo"]
-                
-                try:
-                    # Parse the time (format: "HH:MM")
-                    # API returns local time (lst_ldt parameter)
-                    time_parts = time_str.split(":")
-                    hours = int(time_parts[0])
-                    minutes = int(time_parts[1])
-
-                    # Create a naive datetime with today's date and the time from API
-                    local_time = datetime.datetime(
-                        year=now.year,
-                        month=now.month,
-                        day=now.day,
-                        hour=hours,
-                        minute=minutes
-                    )
 
-                    # Make it timezone-aware using Home Assistant's timezone
-                    tide_time = dt_util.as_local(local_time)
+            bins = await self.hass.async_add_executor_job(
+                envelope.add_predictions, predictions, today.tzinfo
+            )
+            envelope.mark_covered(dt_util.start_of_local_day(chunk_end).timestamp())
+            _LOGGER.debug("Extended envelope of station %s to %s (%d hourly bins)",
+                          self.station_id, chunk_end, bins)
+            day = chunk_end
 
-                    # Handle case when tide time is past midnight but still part of today's data
-                    if tide_time > now + datetime.timedelta(hours=12):
-                        prev_day_time = local_time - datetime.timedelta(days=1)
-                        tide_time = dt_util.as_local(prev_day_time)
-                    elif tide_time < now - datetime.timedelta(hours=12):
-                        next_day_time = local_time + datetime.timedelta(days=1)
-                        tide_time = dt_util.as_local(next_day_time)
-                    
-                    if tide_type == "pleamar" and tide_time >= now:
-                        high_tides.append((tide_time, height))
-                        _LOGGER.debug("Added high tide for station %s: time=%s, height=%s", 
-                                     self.station_id, tide_time, height)
-                    elif tide_type == "bajamar" and tide_time >= now:
-                        low_tides.append((tide_time, height))
-                        _LOGGER.debug("Added low tide for station %s: time=%s, height=%s", 
-                                     self.station_id, tide_time, height)
-                except ValueError as e:
-                    _LOGGER.error("Error parsing tide type time: %s - %s", time_str, e)
-                    continue
-        
-        # Sort by time to get next events
-        high_tides.sort(key=lambda x: x[0])
-        low_tides.sort(key=lambda x: x[0])
-        
-        # Extract next high and low tide info
-        if high_tides:
-            next_high = {
-                "time": high_tides[0][0],
-                "height": high_tides[0][1]
-            }
-            
-        if low_tides:
-            next_low = {
-                "time": low_tides[0][0],
-                "height": low_tides[0][1]
-            }
-            
+        self.envelope = envelope
+
+    def artifact_names(self):
+        """Return the registry key of every artifact, by its file's base name."""
+        managers = [*self.plot_managers.values(), *self.table_managers.values(), self.calendar_manager]
         return {
-            "current_height": current_height,
-            "next_high_tide": next_high,
-            "next_low_tide": next_low,
-            "tide_points": processed_tide_points
+            os.path.basename(filename): (*manager.artifact_id, theme)
+            for manager in managers
+            for theme, filename in manager.filenames.items()
         }
 
+    def _home_location(self):
+        """Return Home Assistant's configured location as a fallback."""
+        if self.hass.config.latitude is None or self.hass.config.longitude is None:
+            return None
+        return (self.hass.config.latitude, self.hass.config.longitude)
+
+    async def _async_render_artifacts(self, data: StationStore):
+        """Render every plot, table and calendar for this station on the render engine."""
+        has_envelope = data.envelope is not None and len(data.envelope)
+        managers = [
+            manager for days, manager in self.plot_managers.items()
+            if has_envelope or days not in LONG_PLOT_DAYS
+        ]
+        managers.extend(self.table_managers.values())
+        if data.monthly is not None and data.monthly.extreme_count:
+            managers.append(self.calendar_manager)
+
+        # Renderers slice their days from the shared timeline, so that is all
+        # the worker processes need
+        render_data = data.render_payload()
+        now = dt_util.now()
+
+        try:
+            async with async_timeout.timeout(RENDER_TIMEOUT):
+                results = await self.render_engine.async_render(managers, render_data, now)
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Rendering tide artifacts for station %s timed out", self.station_id)
+            return
+        except Exception as err:
+            _LOGGER.warning("Failed to render tide artifacts for station %s: %s", self.station_id, err)
+            return
+
+        _LOGGER.debug("Rendered %d/%d tide artifacts for station %s",
+                      sum(results.values()), len(results), self.station_id)
+
+        # Exported plot files carry a baked now-marker, which has to move on
+        # even when the base plot was current and not re-rendered
+        if EXPORT_ARTIFACTS:
+            plot_managers = [manager for manager in managers if manager in self.plot_managers.values()]
+            await self.hass.async_add_executor_job(
+                self._export_plots, plot_managers, data.timeline, now
+            )
+
+    def _export_plots(self, managers, timeline, current_time):
+        """Rewrite the exported plot files with the marker for ``current_time``."""
+        registry = self.render_engine.registry
+        for manager in managers:
+            documents = {}
+            for theme in manager.filenames:
+                artifact = registry.get((*manager.artifact_id, theme))
+                if artifact is not None:
+                    documents[theme] = artifact.body
+            manager.export(documents, timeline, current_time)
+
+    def compose_artifact(self, key, body, current_time):
+        """Return ``body`` with the serve-time overlays of its artifact applied.
+
+        Plots are kept without their now-marker, which is spliced in here
+        from the current timeline; other artifacts are returned as they are.
+        """
+        _, kind, days, _ = key
+        manager = self.plot_managers.get(days) if kind == ARTIFACT_PLOT else None
+        if manager is None or self.data is None:
+            return body
+        return manager.compose(body, self.data.timeline, current_time)
+
 async def async_setup(hass, config):
     """Set up the Modern Tides component."""
     hass.data.setdefault(DOMAIN, {})
+
+    # Timeline series and rendered images, shared by all stations
+    hass.http.register_view(TideSeriesView(hass))
+    hass.http.register_view(TideImageView(hass))
     return True
 
 async def async_setup_entry(hass, entry):
     """Set up Modern Tides from a config entry."""
     hass.data.setdefault(DOMAIN, {})
+
+    # One render engine (and worker pool) is shared by all stations and entries
+    if DATA_RENDER_ENGINE not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_RENDER_ENGINE] = RenderEngine(hass)
+    render_engine = hass.data[DOMAIN][DATA_RENDER_ENGINE]
     
     # Initialize entry data structure
     hass.data[DOMAIN][entry.entry_id] = {
@@ -471,7 +418,7 @@ async def async_setup_entry(hass, entry):
         station_name = station[CONF_STATION_NAME]
         _LOGGER.debug("Creating coordinator for station %s (%s)", station_id, station_name)
         
-        coordinator = TideDataCoordinator(hass, station)
+        coordinator = TideDataCoordinator(hass, station, render_engine)
         
         # Do initial data update
         try:
@@ -503,8 +450,16 @@ async def async_unload_entry(hass, entry):
     # Unload entities for this entry/device
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    # Remove entry from data
+    # Remove entry from data, with its stations' published artifacts
     if unload_ok and entry.entry_id in hass.data[DOMAIN]:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        for coordinator in entry_data["coordinators"].values():
+            coordinator.render_engine.registry.discard(coordinator.station_id)
+
+    # Stop the render workers once the last entry is gone
+    if unload_ok and set(hass.data[DOMAIN]) <= {DATA_RENDER_ENGINE}:
+        render_engine = hass.data[DOMAIN].pop(DATA_RENDER_ENGINE, None)
+        if render_engine is not None:
+            await render_engine.async_shutdown()
 
     return unload_ok
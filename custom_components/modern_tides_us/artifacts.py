@@ -0,0 +1,96 @@
+"""In-memory registry of rendered Modern Tides artifacts."""
+import hashlib
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# Artifact kinds, the second part of a registry key
+ARTIFACT_PLOT = "plot"
+ARTIFACT_TABLE = "table"
+ARTIFACT_CALENDAR = "calendar"
+
+# (station id, kind, days) of one manager's artifact, and the registry key
+# that adds the theme; days is None for the calendar
+ArtifactId = Tuple[str, str, Optional[int]]
+ArtifactKey = Tuple[str, str, Optional[int], str]
+
+
+def content_etag(body: bytes) -> str:
+    """Return a strong ETag for ``body``."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+class Artifact:
+    """One published document with the metadata cameras and views serve from."""
+
+    __slots__ = ("body", "etag", "version", "rendered_at", "fingerprint")
+
+    def __init__(
+        self,
+        body: bytes,
+        etag: str,
+        version: int,
+        rendered_at: float,
+        fingerprint: Optional[str] = None
+    ):
+        """Initialize the artifact."""
+        self.body = body
+        self.etag = etag
+        self.version = version
+        self.rendered_at = rendered_at
+        self.fingerprint = fingerprint
+
+
+class ArtifactRegistry:
+    """Finished artifact bytes keyed by (station, kind, days, theme).
+
+    The render engine publishes every document it renders; cameras and
+    the image view read them back without touching the filesystem. Each
+    change bumps a registry-wide version counter, which the artifact
+    keeps, so readers can tell whether anything moved with one integer
+    comparison. Republishing identical bytes keeps the existing entry,
+    its version and its render time.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._artifacts: Dict[ArtifactKey, Artifact] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of artifacts held."""
+        return len(self._artifacts)
+
+    @property
+    def version(self) -> int:
+        """Return the version of the latest change."""
+        return self._version
+
+    def get(self, key: ArtifactKey) -> Optional[Artifact]:
+        """Return the artifact published under ``key``, if any."""
+        return self._artifacts.get(key)
+
+    def publish(self, key: ArtifactKey, body: bytes, fingerprint: Optional[str] = None) -> Artifact:
+        """Store ``body`` under ``key`` and return its entry."""
+        etag = content_etag(body)
+        with self._lock:
+            artifact = self._artifacts.get(key)
+            if artifact is not None and artifact.etag == etag:
+                artifact.fingerprint = fingerprint
+                return artifact
+
+            self._version += 1
+            artifact = Artifact(body, etag, self._version, time.time(), fingerprint)
+            self._artifacts[key] = artifact
+        _LOGGER.debug("Published %s v%d (%d bytes)", key, artifact.version, len(body))
+        return artifact
+
+    def discard(self, station_id: str) -> None:
+        """Drop every artifact of ``station_id``."""
+        with self._lock:
+            for key in [key for key in self._artifacts if key[0] == station_id]:
+                del self._artifacts[key]
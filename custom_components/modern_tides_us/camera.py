@@ -1,6 +1,4 @@
 """Camera platform for Modern Tides integration."""
-import aiofiles
-import aiofiles.os
 import logging
 import os
 import time
@@ -14,8 +12,21 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity_registry import async_get
 from homeassistant.helpers.event import async_track_state_change_event
-
-from .const import CONF_STATION_ID, CONF_STATION_NAME, CONF_STATIONS, DOMAIN
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_STATION_ID,
+    CONF_STATION_NAME,
+    CONF_STATIONS,
+    DOMAIN,
+    EXPORT_ARTIFACTS,
+    IMAGE_FORMAT_PNG,
+    IMAGE_URL,
+    LONG_PLOT_DAYS,
+    PLOT_DAYS_TO_GENERATE,
+)
+from .artifacts import ARTIFACT_CALENDAR, ARTIFACT_PLOT, ARTIFACT_TABLE
+from .plot_manager import THEME_DARK, THEME_LIGHT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,8 +56,9 @@ async def async_setup_entry(
         if station_id in coordinators:
             coordinator = coordinators[station_id]
             
-            # Create cameras for each day duration (1-7 days) in both light and dark modes
-            for days in range(1, 8):
+            # Create cameras for each day duration (1-7 days, plus the long
+            # horizons) in both light and dark modes
+            for days in [*PLOT_DAYS_TO_GENERATE, *LONG_PLOT_DAYS]:
                 # Light mode camera
                 camera_light = ModernTidesCamera(
                     coordinator,
@@ -93,7 +105,17 @@ async def async_setup_entry(
                 )
                 entities.append(table_camera_dark)
 
-            _LOGGER.debug("Added %d cameras (plots + tables, light/dark, multiple days) for station: %s",
+            # Month calendar cameras (light and dark)
+            for dark_mode in (False, True):
+                entities.append(ModernTidesCamera(
+                    coordinator,
+                    station_name,
+                    entry.entry_id,
+                    dark_mode=dark_mode,
+                    is_calendar=True
+                ))
+
+            _LOGGER.debug("Added %d cameras (plots + tables + calendar, light/dark, multiple days) for station: %s",
                          len(entities), station_name)
 
     if entities:
@@ -101,9 +123,9 @@ async def async_setup_entry(
 
 
 class ModernTidesCamera(Camera):
-    """Modern Tides camera that displays tide plots or tables."""
+    """Modern Tides camera that displays tide plots, tables or the month calendar."""
 
-    def __init__(self, coordinator, station_name: str, entry_id: str, plot_days: int = 1, dark_mode: bool = False, is_table: bool = False):
+    def __init__(self, coordinator, station_name: str, entry_id: str, plot_days: int = 1, dark_mode: bool = False, is_table: bool = False, is_calendar: bool = False):
         """Initialize the camera."""
         super().__init__()
         self.coordinator = coordinator
@@ -112,11 +134,19 @@ class ModernTidesCamera(Camera):
         self._plot_days = plot_days
         self._dark_mode = dark_mode
         self._is_table = is_table
+        self._is_calendar = is_calendar
+        # Serve PNG rasters instead of the SVG files
+        self._raster = coordinator.image_format == IMAGE_FORMAT_PNG
 
         # Set name and unique_id based on mode, days, and type
         mode_suffix = " Dark" if dark_mode else ""
 
-        if is_table:
+        if is_calendar:
+            # Calendar naming
+            self._attr_name = f"{station_name} Tide Calendar{mode_suffix}"
+            mode_id_suffix = "_dark" if dark_mode else ""
+            self._attr_unique_id = f"{DOMAIN}_{coordinator.station_id}_{entry_id}_calendar{mode_id_suffix}"
+        elif is_table:
             # Table naming
             self._attr_name = f"{station_name} Tide Table {plot_days}D{mode_suffix}"
             mode_id_suffix = "_dark" if dark_mode else ""
@@ -134,13 +164,21 @@ class ModernTidesCamera(Camera):
             mode_id_suffix = "_dark" if dark_mode else ""
             self._attr_unique_id = f"{DOMAIN}_{coordinator.station_id}_{entry_id}_camera{day_id_suffix}{mode_id_suffix}"
 
+        # Registry key of the artifact this camera serves
+        if is_calendar:
+            kind, days = ARTIFACT_CALENDAR, None
+        else:
+            kind, days = (ARTIFACT_TABLE if is_table else ARTIFACT_PLOT), plot_days
+        theme = THEME_DARK if dark_mode else THEME_LIGHT
+        self._artifact_key = (coordinator.station_id, kind, days, theme)
+
         # Generate safe name for filename (will be used in async_added_to_hass)
         self._safe_name = station_name.lower().replace(" ", "_").replace("-", "_")
         self._image_filename = None  # Will be set in async_added_to_hass
 
-        # Image data
+        # Image data, and the registry version it was taken from
         self._last_image = None
-        self._last_updated = None
+        self._image_version = None
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -155,10 +193,13 @@ class ModernTidesCamera(Camera):
 
     @property
     def available(self) -> bool:
-        """Return if camera is available."""
-        return (self.coordinator.last_update_success and 
-                self._image_filename is not None and 
-                os.path.exists(self._image_filename))
+        """Return if camera is available.
+
+        Checked on every state write, so this only looks the artifact up
+        in the render engine's registry and never touches the filesystem.
+        """
+        return (self.coordinator.last_update_success and
+                self.coordinator.render_engine.registry.get(self._artifact_key) is not None)
 
     async def async_added_to_hass(self) -> None:
         """Handle entity added to hass."""
@@ -167,7 +208,10 @@ class ModernTidesCamera(Camera):
         # Generate image filename now that we have access to hass
         mode_suffix = "_dark" if self._dark_mode else ""
 
-        if self._is_table:
+        if self._is_calendar:
+            # Calendar filename
+            self._image_filename = self.hass.config.path("www", f"{DOMAIN}_{self._safe_name}_calendar{mode_suffix}.svg")
+        elif self._is_table:
             # Table filename
             self._image_filename = self.hass.config.path("www", f"{DOMAIN}_{self._safe_name}_table_{self._plot_days}d{mode_suffix}.svg")
         else:
@@ -179,8 +223,8 @@ class ModernTidesCamera(Camera):
 
             self._image_filename = self.hass.config.path("www", f"{DOMAIN}_{self._safe_name}_plot{filename_suffix}{mode_suffix}.svg")
 
-        # Set content type for SVG images
-        self.content_type = "image/svg+xml"
+        # Set content type for the served format
+        self.content_type = "image/png" if self._raster else "image/svg+xml"
         
         # Listen for coordinator updates
         self.async_on_remove(
@@ -212,59 +256,150 @@ class ModernTidesCamera(Camera):
         """Handle sensor state changes."""
         self.async_write_ha_state()
 
+    def _compose_image(self) -> Optional[bytes]:
+        """Return the cached image with serve-time overlays applied.
+
+        Plot files are base layers without a positioned now-marker; the
+        plot manager brings it up to date from the coordinator's timeline,
+        so every fetch shows the current position without re-rendering.
+        """
+        image = self._last_image
+        if image is None or self._is_table or self._is_calendar:
+            return image
+
+        manager = self.coordinator.plot_managers.get(self._plot_days)
+        data = self.coordinator.data
+        if manager is None or data is None:
+            return image
+
+        return manager.compose(image, data.timeline, dt_util.now())
+
     def camera_image(
         self, width: Optional[int] = None, height: Optional[int] = None
     ) -> Optional[bytes]:
         """Return bytes of camera image."""
-        return self._last_image
+        if self._raster:
+            return self._raster_image(width, height)
+        return self._compose_image()
 
     async def async_camera_image(
         self, width: Optional[int] = None, height: Optional[int] = None
     ) -> Optional[bytes]:
         """Return bytes of camera image."""
+        if self._raster:
+            return await self.hass.async_add_executor_job(self._raster_image, width, height)
+
         await self.async_update()
-        return self._last_image
+        image = await self._async_sized_image(width, height)
+        if image is not None:
+            return image
+        return self._compose_image()
+
+    def _raster_image(
+        self, width: Optional[int] = None, height: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Return the plot, table or calendar as PNG (blocking; cached by the manager).
+
+        Plots are rasterized at the resolution bucket matching the
+        requested size; tables and the calendar at their own size.
+        """
+        data = self.coordinator.data
+        if data is None:
+            return None
+
+        now = dt_util.now()
+        theme = THEME_DARK if self._dark_mode else THEME_LIGHT
+        if self._is_calendar:
+            return self.coordinator.calendar_manager.raster_image(data.render_payload(), theme, now)
+        if self._is_table:
+            manager = self.coordinator.table_managers.get(self._plot_days)
+            if manager is None:
+                return None
+            return manager.raster_image(data.render_payload(), theme, now)
+
+        manager = self.coordinator.plot_managers.get(self._plot_days)
+        if manager is None:
+            return None
+        return manager.raster_image(
+            data.render_payload(), theme, manager.resolution_bucket(width, height), now
+        )
+
+    async def _async_sized_image(
+        self, width: Optional[int], height: Optional[int]
+    ) -> Optional[bytes]:
+        """Return the plot rendered for the requested size, if it differs.
+
+        Returns None when the published image already fits, or for tables and
+        the calendar, which are always served at their own size.
+        """
+        if self._is_table or self._is_calendar or (not width and not height):
+            return None
+
+        manager = self.coordinator.plot_managers.get(self._plot_days)
+        data = self.coordinator.data
+        if manager is None or data is None:
+            return None
+
+        bucket = manager.resolution_bucket(width, height)
+        if bucket is None:
+            return None
+
+        now = dt_util.now()
+        theme = THEME_DARK if self._dark_mode else THEME_LIGHT
+        image = await self.hass.async_add_executor_job(
+            manager.sized_image, data.render_payload(), theme, bucket, now
+        )
+        if image is None:
+            return None
+        return manager.compose(image, data.timeline, now)
 
     async def async_update(self) -> None:
-        """Update the camera image."""
-        try:
-            if self._image_filename is not None:
-                # Read the SVG file directly (filename already includes the correct mode suffix)
-                if await aiofiles.os.path.exists(self._image_filename):
-                    # Check if SVG file has been updated
-                    file_mtime = await aiofiles.os.path.getmtime(self._image_filename)
-                    
-                    if self._last_updated is None or file_mtime > self._last_updated:
-                        # Read SVG content and convert to bytes (non-blocking)
-                        async with aiofiles.open(self._image_filename, "r", encoding='utf-8') as svg_file:
-                            svg_content = await svg_file.read()
-                        
-                        # For SVG content, we need to return it as bytes
-                        # Home Assistant can handle SVG content type
-                        self._last_image = svg_content.encode('utf-8')
-                        self._last_updated = file_mtime
-                        mode_info = " (Dark Mode)" if self._dark_mode else " (Light Mode)"
-                        _LOGGER.debug("Updated camera image (SVG)%s for %s", mode_info, self._station_name)
-                else:
-                    _LOGGER.debug("Image file not found: %s", self._image_filename)
-                    self._last_image = None
-            else:
-                _LOGGER.debug("Image filename not set yet")
-                self._last_image = None
-                
-        except Exception as e:
-            _LOGGER.error("Error reading camera image for %s: %s", self._station_name, e)
+        """Update the camera image from the render engine's registry.
+
+        The renderer publishes finished documents in memory, so this is a
+        dictionary lookup; the bytes are only swapped when their version
+        changed.
+        """
+        artifact = self.coordinator.render_engine.registry.get(self._artifact_key)
+        if artifact is None:
+            _LOGGER.debug("No image published yet for %s", self._attr_name)
             self._last_image = None
+            self._image_version = None
+            return
+
+        if artifact.version != self._image_version:
+            self._last_image = artifact.body
+            self._image_version = artifact.version
+            mode_info = " (Dark Mode)" if self._dark_mode else " (Light Mode)"
+            _LOGGER.debug("Updated camera image (%s)%s for %s to v%d",
+                          "PNG" if self._raster else "SVG", mode_info,
+                          self._station_name, artifact.version)
 
     @property
     def extra_state_attributes(self):
-        """Return the state attributes."""
+        """Return the state attributes, from the registry's artifact metadata."""
         attrs = {}
-        
-        if self._last_updated:
-            attrs["last_updated"] = time.ctime(self._last_updated)
-            
-        if self._image_filename and os.path.exists(self._image_filename):
+
+        artifact = self.coordinator.render_engine.registry.get(self._artifact_key)
+        if artifact is None or self._image_filename is None:
+            return attrs
+
+        attrs["last_updated"] = time.ctime(artifact.rendered_at)
+
+        # URL of the image view. Tables and the calendar are fingerprinted,
+        # so they are cached until the content changes; plots carry a
+        # now-marker that moves every minute and are revalidated instead.
+        image_url = IMAGE_URL.format(
+            station_id=self.coordinator.station_id,
+            filename=os.path.basename(self._image_filename),
+        )
+        if self._is_table or self._is_calendar:
+            version = artifact.etag.strip('"')
+            image_url = f"{image_url}?v={version}"
+        attrs["image_url"] = image_url
+
+        # The file in www only exists when artifacts are exported
+        if EXPORT_ARTIFACTS:
             attrs["image_path"] = self._image_filename
-            
+
         return attrs
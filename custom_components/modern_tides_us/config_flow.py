@@ -21,15 +21,21 @@ except ImportError:
     config_entries = None
 
 from .const import (
+    CONF_IMAGE_FORMAT,
+    CONF_NOW_MARKER,
     CONF_STATION_ID,
     CONF_STATION_NAME,
     CONF_STATIONS,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_IMAGE_FORMAT,
+    DEFAULT_NOW_MARKER,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_STATION_ID,
     DEFAULT_STATION_NAME,
     DOMAIN,
+    IMAGE_FORMATS,
     INTERVALS,
+    NOW_MARKER_MODES,
 )
 from .tide_api import TideApiClient
 
@@ -94,6 +100,8 @@ class ModernTidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_STATION_ID: station_id,
                         CONF_STATION_NAME: user_input.get(CONF_STATION_NAME, station_name),
                         CONF_UPDATE_INTERVAL: user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+                        CONF_NOW_MARKER: user_input.get(CONF_NOW_MARKER, DEFAULT_NOW_MARKER),
+                        CONF_IMAGE_FORMAT: user_input.get(CONF_IMAGE_FORMAT, DEFAULT_IMAGE_FORMAT),
                     })
                     
                     # Create the final configuration entry and finish
@@ -134,6 +142,8 @@ class ModernTidesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.In(
                 {k: f"{k} ({v} min)" for k, v in INTERVALS.items()}
             ),
+            vol.Optional(CONF_NOW_MARKER, default=DEFAULT_NOW_MARKER): vol.In(NOW_MARKER_MODES),
+            vol.Optional(CONF_IMAGE_FORMAT, default=DEFAULT_IMAGE_FORMAT): vol.In(IMAGE_FORMATS),
         })
 
         return self.async_show_form(
@@ -204,6 +214,8 @@ class ModernTidesOptionsFlow(config_entries.OptionsFlow):
                         CONF_STATION_ID: station_id,
                         CONF_STATION_NAME: user_input.get(CONF_STATION_NAME),
                         CONF_UPDATE_INTERVAL: user_input.get(CONF_UPDATE_INTERVAL),
+                        CONF_NOW_MARKER: user_input.get(CONF_NOW_MARKER, DEFAULT_NOW_MARKER),
+                        CONF_IMAGE_FORMAT: user_input.get(CONF_IMAGE_FORMAT, DEFAULT_IMAGE_FORMAT),
                     }
                     break
             
@@ -227,5 +239,11 @@ class ModernTidesOptionsFlow(config_entries.OptionsFlow):
                 vol.Required(CONF_UPDATE_INTERVAL, default=station[CONF_UPDATE_INTERVAL]): vol.In(
                     {k: f"{k} ({v} min)" for k, v in INTERVALS.items()}
                 ),
+                vol.Required(
+                    CONF_NOW_MARKER, default=station.get(CONF_NOW_MARKER, DEFAULT_NOW_MARKER)
+                ): vol.In(NOW_MARKER_MODES),
+                vol.Required(
+                    CONF_IMAGE_FORMAT, default=station.get(CONF_IMAGE_FORMAT, DEFAULT_IMAGE_FORMAT)
+                ): vol.In(IMAGE_FORMATS),
             }),
         )
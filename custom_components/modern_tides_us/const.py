@@ -12,9 +12,59 @@ CONF_STATIONS = "stations"
 CONF_STATION_ID = "station_id"
 CONF_STATION_NAME = "station_name"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_NOW_MARKER = "now_marker"
+CONF_IMAGE_FORMAT = "image_format"
+
+# How plots show the current position
+NOW_MARKER_OVERLAY = "overlay"  # Dot spliced into the image each time it is served
+NOW_MARKER_ANIMATED = "animated"  # Dot animated along the curve by the browser (SMIL)
+DEFAULT_NOW_MARKER = NOW_MARKER_OVERLAY
+NOW_MARKER_MODES = {
+    NOW_MARKER_OVERLAY: "Updated when served",
+    NOW_MARKER_ANIMATED: "Animated in the browser",
+}
+
+# What camera entities serve
+IMAGE_FORMAT_SVG = "svg"  # Vector images, for browsers and the dashboard
+IMAGE_FORMAT_PNG = "png"  # Rasters, for e-ink panels and displays without SVG support
+DEFAULT_IMAGE_FORMAT = IMAGE_FORMAT_SVG
+IMAGE_FORMATS = {
+    IMAGE_FORMAT_SVG: "SVG (vector)",
+    IMAGE_FORMAT_PNG: "PNG (raster, for e-ink and older displays)",
+}
 
 # Plot generation settings
 PLOT_DAYS_TO_GENERATE = [1, 2, 3, 4, 5, 6, 7]  # Generate plots for these day ranges
+LONG_PLOT_DAYS = [14, 30, 90]  # Long-horizon plots, drawn as min/max envelopes
+LONG_RANGE_FETCH_DAYS = 31  # Days of hourly predictions requested at once
+
+# Render engine settings
+DATA_RENDER_ENGINE = "render_engine"  # Key in hass.data[DOMAIN] for the shared engine
+RENDER_MAX_WORKERS = 2  # Upper bound on render worker processes
+RENDER_TIMEOUT = 120  # Seconds allowed for rendering one station's artifacts
+
+# Also write rendered artifacts to www/ for /local URLs; cameras and the
+# image view serve them from memory either way
+EXPORT_ARTIFACTS = True
+
+# Write gzip siblings (<file>.svg.gz) next to rendered artifacts
+PRECOMPRESS_ARTIFACTS = True
+
+# Upper bound on the parsed tide data kept in memory per station (bytes)
+STORE_MEMORY_BUDGET = 256 * 1024
+
+# Series endpoint for client-side rendering
+SERIES_URL = "/api/modern_tides_us/series/{station_id}"
+SERIES_CACHE_SIZE = 16  # Encoded series kept in memory, across all stations
+SERIES_MAX_AGE = 300  # Seconds clients may reuse a series without revalidating
+
+# Image endpoint serving rendered artifacts with conditional responses
+IMAGE_URL = "/api/modern_tides_us/image/{station_id}/{filename}"
+IMAGE_IMMUTABLE_MAX_AGE = 365 * 24 * 3600  # For fingerprinted (?v=<hash>) URLs
+IMAGE_CACHE_SIZE = 64  # Plots served with their now-marker, per base image and minute
+
+# Seconds between state writes of the sensors that follow the clock
+SENSOR_REFRESH_INTERVAL = 60
 
 # Update intervals in minutes
 DEFAULT_UPDATE_INTERVAL = 360
@@ -30,7 +80,9 @@ INTERVALS = {
 # NOAA CO-OPS API endpoints
 API_BASE_URL = "https://tidesandcurrents.noaa.gov/api/datagetter"
 API_STATION_LIST_URL = "https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi/stations.json?type=tidepredictions"
+API_STATION_METADATA_URL = "https://api.tidesandcurrents.noaa.gov/mdapi/prod/webapi/stations/{station_id}.json"
 API_PREDICTIONS = f"{API_BASE_URL}?product=predictions&application=NOS.COOPS.TAC.WL&datum=MLLW&station={{station_id}}&time_zone=lst_ldt&units=english&format=json&begin_date={{begin_date}}&end_date={{end_date}}&interval=6"
+API_HOURLY_PREDICTIONS = f"{API_BASE_URL}?product=predictions&application=NOS.COOPS.TAC.WL&datum=MLLW&station={{station_id}}&time_zone=lst_ldt&units=english&format=json&begin_date={{begin_date}}&end_date={{end_date}}&interval=h"
 API_HILO_PREDICTIONS = f"{API_BASE_URL}?product=predictions&application=NOS.COOPS.TAC.WL&datum=MLLW&station={{station_id}}&time_zone=lst_ldt&units=english&format=json&begin_date={{begin_date}}&end_date={{end_date}}&interval=hilo"
 
 # Default station - Provincetown, MA
@@ -0,0 +1,106 @@
+"""Shape-preserving downsampling of tide curves for Modern Tides plots."""
+from bisect import bisect_left
+from typing import Iterable, List, Sequence, Tuple
+
+# Curve vertices per horizontal pixel; the bezier smoothing fills the gaps
+PIXELS_PER_POINT = 2
+
+
+def _lttb_range(
+    times: Sequence[float],
+    heights: Sequence[float],
+    lo: int,
+    hi: int,
+    budget: int
+) -> List[int]:
+    """Largest-Triangle-Three-Buckets over ``times[lo:hi + 1]``.
+
+    Returns the indices of at most ``budget`` points, always including
+    ``lo`` and ``hi``.
+    """
+    count = hi - lo + 1
+    if count <= budget or budget < 3:
+        return list(range(lo, hi + 1)) if count <= budget else [lo, hi]
+
+    selected = [lo]
+    bucket_size = (count - 2) / (budget - 2)
+    anchor = lo
+
+    for bucket in range(budget - 2):
+        start = lo + 1 + int(bucket * bucket_size)
+        end = lo + 1 + int((bucket + 1) * bucket_size)
+
+        # Average of the next bucket is the third vertex of the triangle
+        next_start = end
+        next_end = min(lo + 1 + int((bucket + 2) * bucket_size), hi + 1)
+        if next_start >= next_end:
+            avg_t, avg_h = times[hi], heights[hi]
+        else:
+            span = next_end - next_start
+            avg_t = sum(times[next_start:next_end]) / span
+            avg_h = sum(heights[next_start:next_end]) / span
+
+        anchor_t, anchor_h = times[anchor], heights[anchor]
+        best, best_area = start, -1.0
+        for idx in range(start, end):
+            area = abs(
+                (anchor_t - avg_t) * (heights[idx] - anchor_h)
+                - (anchor_t - times[idx]) * (avg_h - anchor_h)
+            )
+            if area > best_area:
+                best, best_area = idx, area
+
+        selected.append(best)
+        anchor = best
+
+    selected.append(hi)
+    return selected
+
+
+def downsample_curve(
+    times: Sequence[float],
+    heights: Sequence[float],
+    pixel_width: float,
+    anchors: Iterable[Tuple[float, float]] = (),
+    pixels_per_point: int = PIXELS_PER_POINT
+) -> Tuple[List[float], List[float]]:
+    """Reduce a sorted curve to the points worth drawing at ``pixel_width``.
+
+    ``anchors`` are ``(timestamp, height)`` points that must appear in the
+    output, typically the high/low extremes, so the curve passes exactly
+    through the markers drawn on top of it. Anchors that fall between
+    samples are spliced in. The curve is split at the anchors and each
+    segment gets a share of the point budget proportional to its length,
+    so peaks and troughs are never clipped.
+    """
+    times = list(times)
+    heights = list(heights)
+    if not times:
+        return times, heights
+
+    first, last = times[0], times[-1]
+    keep = set()
+    for anchor_ts, anchor_height in sorted(anchors):
+        if anchor_ts < first or anchor_ts > last:
+            continue
+        idx = bisect_left(times, anchor_ts)
+        if idx == len(times) or times[idx] != anchor_ts:
+            times.insert(idx, anchor_ts)
+            heights.insert(idx, anchor_height)
+            keep = {k + 1 if k >= idx else k for k in keep}
+        else:
+            heights[idx] = anchor_height
+        keep.add(idx)
+
+    total = len(times)
+    budget = max(3, int(pixel_width // max(1, pixels_per_point)))
+    if total <= budget:
+        return times, heights
+
+    bounds = sorted(keep | {0, total - 1})
+    indices = [0]
+    for lo, hi in zip(bounds, bounds[1:]):
+        share = max(2, round(budget * (hi - lo) / (total - 1)) + 1)
+        indices.extend(_lttb_range(times, heights, lo, hi, share)[1:])
+
+    return [times[i] for i in indices], [heights[i] for i in indices]
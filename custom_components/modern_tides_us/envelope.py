@@ -0,0 +1,235 @@
+"""Incremental min/max envelopes of long tide series for Modern Tides."""
+import datetime
+import hashlib
+import logging
+import math
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# Width of the finest envelope bins (seconds)
+ENVELOPE_BIN_SECONDS = 3600
+
+# Bin width of each level, in finest bins. Every level divides the next and
+# a 24-hour day, so dropping such days keeps all levels aligned; the coarser
+# levels are rebuilt when a DST change makes a day 23 or 25 hours long.
+ENVELOPE_LEVELS = (1, 2, 4, 8, 24)
+
+DAY_SECONDS = 86400
+
+# Window each column's min/max is taken over: one lunar day, so every column
+# spans a full high and low (both of them on mixed tides)
+ENVELOPE_WINDOW_SECONDS = 25 * 3600
+
+_EMPTY = math.nan
+
+
+class TideEnvelope:
+    """Multi-resolution min/max envelope of a long tide series.
+
+    Samples are folded into hourly bins and every coarser level keeps the
+    min and max of a fixed number of them. Adding days only recomputes the
+    bins they touch, and columns() reads the level whose bin count best
+    matches the requested width, so drawing costs the same for 14 days as
+    for 90. Empty bins hold NaN.
+
+    Plots and workers read an envelope while it is shared, so it is only
+    extended through a copy() that then replaces it.
+    """
+
+    def __init__(self):
+        """Initialize an empty envelope; start_at() anchors it."""
+        self._origin: Optional[float] = None
+        self._mins = [array("d") for _ in ENVELOPE_LEVELS]
+        self._maxs = [array("d") for _ in ENVELOPE_LEVELS]
+        self._covered_until: Optional[float] = None
+        self._fingerprint: Optional[str] = None
+
+    def __len__(self) -> int:
+        """Return the number of finest bins held."""
+        return len(self._mins[0])
+
+    @property
+    def origin(self) -> Optional[float]:
+        """Return the timestamp of the first bin."""
+        return self._origin
+
+    @property
+    def covered_until(self) -> Optional[float]:
+        """Return the timestamp up to which days have been added."""
+        return self._covered_until
+
+    @property
+    def fingerprint(self) -> str:
+        """Return a content hash of the finest bins."""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(repr(self._origin).encode())
+            digest.update(self._mins[0].tobytes())
+            digest.update(self._maxs[0].tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def copy(self) -> "TideEnvelope":
+        """Return an independent copy of this envelope."""
+        envelope = TideEnvelope()
+        envelope._origin = self._origin
+        envelope._mins = [array("d", values) for values in self._mins]
+        envelope._maxs = [array("d", values) for values in self._maxs]
+        envelope._covered_until = self._covered_until
+        envelope._fingerprint = self._fingerprint
+        return envelope
+
+    def start_at(self, timestamp: float, tz: datetime.tzinfo = datetime.timezone.utc) -> None:
+        """Drop the whole days before ``timestamp``; an empty envelope starts there.
+
+        Days are counted on local dates in ``tz``, so the origin stays on
+        local midnight across DST changes.
+        """
+        if self._origin is None or not len(self):
+            self._origin = timestamp
+            self._covered_until = None
+            self._fingerprint = None
+            return
+
+        day = datetime.datetime.fromtimestamp(timestamp, tz).date()
+        if day <= datetime.datetime.fromtimestamp(self._origin, tz).date():
+            return
+
+        midnight = datetime.datetime.combine(day, datetime.time(), tzinfo=tz).timestamp()
+        dropped = int((midnight - self._origin) // ENVELOPE_BIN_SECONDS)
+        aligned = all(dropped % factor == 0 for factor in ENVELOPE_LEVELS)
+        for level, factor in enumerate(ENVELOPE_LEVELS):
+            # Unaligned coarser levels are cleared and rebuilt below
+            cut = dropped // factor if aligned or not level else len(self._mins[level])
+            del self._mins[level][:cut]
+            del self._maxs[level][:cut]
+        self._origin += dropped * ENVELOPE_BIN_SECONDS
+        if not aligned and len(self):
+            self._rebuild(0, len(self))
+        if self._covered_until is not None and self._covered_until < self._origin:
+            self._covered_until = None
+        self._fingerprint = None
+
+    def mark_covered(self, timestamp: float) -> None:
+        """Record that every sample before ``timestamp`` has been added."""
+        if self._covered_until is None or timestamp > self._covered_until:
+            self._covered_until = timestamp
+
+    def add(self, times: Iterable[float], heights: Iterable[float]) -> int:
+        """Fold samples into the envelope and return the number of bins touched.
+
+        Samples before the origin are ignored. Only the touched range of
+        every level is recomputed.
+        """
+        samples = list(zip(times, heights))
+        if not samples:
+            return 0
+        if self._origin is None:
+            self.start_at(min(time for time, _ in samples))
+
+        mins, maxs = self._mins[0], self._maxs[0]
+        low = high = None
+        for timestamp, height in samples:
+            idx = int((timestamp - self._origin) // ENVELOPE_BIN_SECONDS)
+            if idx < 0:
+                continue
+            if idx >= len(mins):
+                padding = idx + 1 - len(mins)
+                mins.extend([_EMPTY] * padding)
+                maxs.extend([_EMPTY] * padding)
+            # NaN compares False, so an empty bin takes the first sample
+            if not mins[idx] <= height:
+                mins[idx] = height
+            if not maxs[idx] >= height:
+                maxs[idx] = height
+            low = idx if low is None else min(low, idx)
+            high = idx if high is None else max(high, idx)
+
+        if low is None:
+            return 0
+        self._rebuild(low, high + 1)
+        self._fingerprint = None
+        return high + 1 - low
+
+    def add_predictions(self, predictions: List[Dict[str, Any]], tz: datetime.tzinfo) -> int:
+        """Fold NOAA predictions (``{'t': 'YYYY-MM-DD HH:MM', 'v': '1.23'}``) in."""
+        times = array("d")
+        heights = array("d")
+        for prediction in predictions:
+            try:
+                local_time = datetime.datetime.strptime(prediction["t"], "%Y-%m-%d %H:%M")
+                height = float(prediction["v"])
+            except (KeyError, TypeError, ValueError) as e:
+                _LOGGER.debug("Skipping invalid prediction %s: %s", prediction, e)
+                continue
+            times.append(local_time.replace(tzinfo=tz).timestamp())
+            heights.append(height)
+        return self.add(times, heights)
+
+    def _rebuild(self, low: int, high: int) -> None:
+        """Recompute the coarser levels over finest bins ``low`` to ``high``."""
+        base_mins, base_maxs = self._mins[0], self._maxs[0]
+        for level, factor in enumerate(ENVELOPE_LEVELS[1:], 1):
+            mins, maxs = self._mins[level], self._maxs[level]
+            first, last = low // factor, -(-high // factor)
+            if len(mins) < last:
+                padding = last - len(mins)
+                mins.extend([_EMPTY] * padding)
+                maxs.extend([_EMPTY] * padding)
+            for idx in range(first, last):
+                chunk = slice(idx * factor, (idx + 1) * factor)
+                chunk_mins = [value for value in base_mins[chunk] if value == value]
+                chunk_maxs = [value for value in base_maxs[chunk] if value == value]
+                mins[idx] = min(chunk_mins) if chunk_mins else _EMPTY
+                maxs[idx] = max(chunk_maxs) if chunk_maxs else _EMPTY
+
+    def columns(
+        self,
+        start_ts: float,
+        end_ts: float,
+        max_columns: float,
+        window: float = ENVELOPE_WINDOW_SECONDS
+    ) -> Tuple[array, array, array]:
+        """Return (bin midpoint, min, max) series covering ``start_ts`` to ``end_ts``.
+
+        The finest level with at most ``max_columns`` bins over the range is
+        read, so the result never has more points than that. Each point is
+        the min and max of the bins within ``window`` seconds centred on it,
+        a bounded number whatever the level. Empty bins are skipped.
+        """
+        times, mins_out, maxs_out = array("d"), array("d"), array("d")
+        if self._origin is None or end_ts <= start_ts:
+            return times, mins_out, maxs_out
+
+        span = end_ts - start_ts
+        level = next(
+            (level for level, factor in enumerate(ENVELOPE_LEVELS)
+             if span / (factor * ENVELOPE_BIN_SECONDS) <= max_columns),
+            len(ENVELOPE_LEVELS) - 1,
+        )
+        bin_seconds = ENVELOPE_LEVELS[level] * ENVELOPE_BIN_SECONDS
+        mins, maxs = self._mins[level], self._maxs[level]
+
+        half = int(window / 2 // bin_seconds)
+
+        first = max(0, int((start_ts - self._origin) // bin_seconds))
+        last = min(len(mins), math.ceil((end_ts - self._origin) / bin_seconds))
+        for idx in range(first, last):
+            if mins[idx] != mins[idx]:
+                continue
+            around = slice(max(first, idx - half), min(last, idx + half + 1))
+            # Bins cut by the range edges are drawn at the edge
+            midpoint = self._origin + (idx + 0.5) * bin_seconds
+            times.append(min(max(midpoint, start_ts), end_ts))
+            mins_out.append(min(value for value in mins[around] if value == value))
+            maxs_out.append(max(value for value in maxs[around] if value == value))
+        return times, mins_out, maxs_out
+
+    def memory_footprint(self) -> int:
+        """Return the approximate number of bytes held by this envelope."""
+        return sys.getsizeof(self) + sum(
+            sys.getsizeof(values) for values in (*self._mins, *self._maxs)
+        )
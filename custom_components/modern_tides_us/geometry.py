@@ -0,0 +1,202 @@
+"""Bulk geometry for Modern Tides plots.
+
+Series are mapped to pixel space and turned into SVG path data in one
+pass. NumPy is used when it is available (Home Assistant ships it), with
+a pure ``array`` fallback otherwise.
+"""
+from array import array
+from typing import Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the host install
+    np = None
+
+from .svg import DEFAULT_PRECISION, format_number, format_numbers
+
+
+def to_pixels(
+    times: Sequence[float],
+    heights: Sequence[float],
+    min_ts: float,
+    x_origin: float,
+    x_scale: float,
+    min_height: float,
+    y_origin: float,
+    y_scale: float
+) -> Tuple[Sequence[float], Sequence[float]]:
+    """Map timestamps and heights to x/y pixel coordinates.
+
+    ``x = x_origin + (t - min_ts) * x_scale`` and
+    ``y = y_origin - (h - min_height) * y_scale`` (SVG y grows downwards).
+    """
+    if np is not None:
+        xs = (np.asarray(times, dtype=float) - min_ts) * x_scale + x_origin
+        ys = y_origin - (np.asarray(heights, dtype=float) - min_height) * y_scale
+        return xs, ys
+
+    xs = array("d", [x_origin + (t - min_ts) * x_scale for t in times])
+    ys = array("d", [y_origin - (h - min_height) * y_scale for h in heights])
+    return xs, ys
+
+
+def _rounded(values: Sequence[float], precision: int) -> Sequence[float]:
+    """Round a series to ``precision`` decimals."""
+    if np is not None:
+        return np.round(np.asarray(values, dtype=float), precision)
+    return array("d", [round(value, precision) for value in values])
+
+
+def _catmull_rom_segments(xs: Sequence[float], ys: Sequence[float]) -> Sequence[float]:
+    """Return the flattened relative ``dx1 dy1 dx2 dy2 dx dy`` of every segment.
+
+    Each segment ``i`` runs from point ``i`` to ``i + 1``; the neighbours
+    ``i - 1`` and ``i + 2`` are clamped at the ends of the series. Offsets
+    are relative to point ``i``, as the ``c`` path command expects.
+    """
+    if np is not None:
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        last = len(xs) - 1
+        idx = np.arange(last)
+        prev_idx = np.maximum(idx - 1, 0)
+        next_idx = np.minimum(idx + 2, last)
+        dx = xs[1:] - xs[:-1]
+        dy = ys[1:] - ys[:-1]
+        segments = np.empty((last, 6))
+        segments[:, 0] = (xs[idx + 1] - xs[prev_idx]) / 6
+        segments[:, 1] = (ys[idx + 1] - ys[prev_idx]) / 6
+        segments[:, 2] = dx - (xs[next_idx] - xs[idx]) / 6
+        segments[:, 3] = dy - (ys[next_idx] - ys[idx]) / 6
+        segments[:, 4] = dx
+        segments[:, 5] = dy
+        return segments.ravel().tolist()
+
+    last = len(xs) - 1
+    flat = array("d")
+    for i in range(last):
+        prev_i, next_i = max(i - 1, 0), min(i + 2, last)
+        dx, dy = xs[i + 1] - xs[i], ys[i + 1] - ys[i]
+        flat.extend((
+            (xs[i + 1] - xs[prev_i]) / 6,
+            (ys[i + 1] - ys[prev_i]) / 6,
+            dx - (xs[next_i] - xs[i]) / 6,
+            dy - (ys[next_i] - ys[i]) / 6,
+            dx,
+            dy,
+        ))
+    return flat
+
+
+def smooth_path(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    precision: int = DEFAULT_PRECISION
+) -> str:
+    """Return compact SVG path data for a smooth curve through the points.
+
+    Four or more points become a Catmull-Rom spline drawn as relative
+    cubic beziers; fewer fall back to relative line segments. Points are
+    rounded before the offsets are taken, so rounding never accumulates
+    along the path.
+    """
+    count = len(xs)
+    if count == 0:
+        return ""
+
+    xs = _rounded(xs, precision)
+    ys = _rounded(ys, precision)
+    start = f"M{format_number(xs[0], precision)},{format_number(ys[0], precision)}"
+    if count == 1:
+        return start
+
+    if count < 4:
+        offsets = [
+            value
+            for i in range(1, count)
+            for value in (xs[i] - xs[i - 1], ys[i] - ys[i - 1])
+        ]
+        return start + "l" + format_numbers(offsets, precision)
+
+    # The command letter is implied for every segment after the first
+    return start + "c" + format_numbers(_catmull_rom_segments(xs, ys), precision)
+
+
+def band_path(
+    xs: Sequence[float],
+    upper: Sequence[float],
+    lower: Sequence[float],
+    precision: int = DEFAULT_PRECISION
+) -> str:
+    """Return closed SVG path data for the band between two curves.
+
+    The outline runs along ``upper`` left to right and back along
+    ``lower`` as relative line segments. Like smooth_path(), points are
+    rounded before the offsets are taken.
+    """
+    count = len(xs)
+    if count == 0:
+        return ""
+
+    outline_x = _rounded([*xs, *reversed(xs)], precision)
+    outline_y = _rounded([*upper, *reversed(lower)], precision)
+    offsets = [
+        value
+        for i in range(1, 2 * count)
+        for value in (outline_x[i] - outline_x[i - 1], outline_y[i] - outline_y[i - 1])
+    ]
+    start = f"M{format_number(outline_x[0], precision)},{format_number(outline_y[0], precision)}"
+    return start + "l" + format_numbers(offsets, precision) + "z"
+
+
+class PlotGeometry:
+    """Linear mapping from (timestamp, height) to plot pixel coordinates.
+
+    The base plot and the serve-time now-marker use the same instance, so
+    the marker lands exactly on the rendered curve.
+    """
+
+    __slots__ = ("min_ts", "max_ts", "x_origin", "x_scale", "min_height", "y_origin", "y_scale")
+
+    def __init__(
+        self,
+        min_ts: float,
+        max_ts: float,
+        x_origin: float,
+        x_scale: float,
+        min_height: float,
+        y_origin: float,
+        y_scale: float
+    ):
+        """Initialize the mapping."""
+        self.min_ts = min_ts
+        self.max_ts = max_ts
+        self.x_origin = x_origin
+        self.x_scale = x_scale
+        self.min_height = min_height
+        self.y_origin = y_origin
+        self.y_scale = y_scale
+
+    def contains(self, timestamp: float) -> bool:
+        """Return True if ``timestamp`` falls inside the plotted range."""
+        return self.min_ts <= timestamp <= self.max_ts
+
+    def x(self, timestamp: float) -> float:
+        """Map a timestamp to an x coordinate."""
+        return self.x_origin + (timestamp - self.min_ts) * self.x_scale
+
+    def y(self, height: float) -> float:
+        """Map a height to a y coordinate."""
+        return self.y_origin - (height - self.min_height) * self.y_scale
+
+    def pixels(
+        self,
+        times: Sequence[float],
+        heights: Sequence[float]
+    ) -> Tuple[Sequence[float], Sequence[float]]:
+        """Map whole series to pixel space in bulk."""
+        return to_pixels(
+            times, heights,
+            self.min_ts, self.x_origin, self.x_scale,
+            self.min_height, self.y_origin, self.y_scale,
+        )
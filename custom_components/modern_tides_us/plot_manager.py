@@ -1,31 +1,695 @@
 """Plot management for Modern Tides integration."""
+import calendar
 import datetime
+import functools
+import hashlib
 import logging
 import math
-import base64
-import io
-from typing import Any, Dict, List, Optional, Tuple
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from homeassistant.util import dt as dt_util
 
+from .downsample import downsample_curve
+from .envelope import DAY_SECONDS
+from .geometry import PlotGeometry, band_path, smooth_path
+from .raster import svg_to_png
+from .solar import sun_times_range
+from .artifacts import ArtifactId, ArtifactRegistry
+from .svg import (
+    DEFAULT_PRECISION,
+    FONT_FAMILY,
+    SvgWriter,
+    format_number,
+    splice_overlay,
+    svg_document,
+    write_artifact,
+)
+from .timeline import TideTimeline, TimelineView
+
 _LOGGER = logging.getLogger(__name__)
 
+# Default plot dimensions in pixels
+PLOT_WIDTH = 800
+PLOT_HEIGHT = 400
+PLOT_MARGIN = 60
+
+# Table layout: fixed width and the x position of each column
+TABLE_WIDTH = 600
+TABLE_COLUMNS_X = (50, 170, 250, 350)  # Day, Type, Time, Height
+
+# Month calendar layout: day cell size, outer margin and grid top
+CALENDAR_CELL_WIDTH = 110
+CALENDAR_CELL_HEIGHT = 78
+CALENDAR_MARGIN = 20
+CALENDAR_GRID_TOP = 65
+# High/low lines shown per day cell (mixed tides have four)
+CALENDAR_MAX_EVENTS = 4
+# Share of the month's spread in daily tidal range that marks spring and neap days
+SPRING_NEAP_FRACTION = 0.25
+
+# Long-horizon plots: layout units between envelope markers and between date
+# ticks, and the day steps a tick may take
+ENVELOPE_MARKER_SPACING = 40
+DATE_TICK_SPACING = 70
+DATE_TICK_STEPS = (1, 2, 7, 14, 28)
+
+# Start offset of the self-animating now-marker, rewritten when served
+_MARKER_BEGIN = re.compile(rb' begin="-?[0-9.]+s"')
+
+# Static layers kept per process; a station uses a few dozen at most
+CHROME_CACHE_SIZE = 64
+
+# Calendar day cells kept per process: a month for a handful of stations
+CALENDAR_CELL_CACHE_SIZE = 256
+
+
+# Themes an artifact can be stamped in; "auto" follows prefers-color-scheme
+THEME_LIGHT = "light"
+THEME_DARK = "dark"
+THEME_AUTO = "auto"
+
+# Clean minimal color schemes, keyed by role
+PLOT_PALETTES = {
+    THEME_LIGHT: {
+        'background': '#FFFFFF',
+        'tide_line': '#000000',
+        'text': '#000000',
+        'title': '#000000',
+        'high_tide': '#DC143C',  # Crimson for high tides
+        'low_tide': '#1E90FF',   # Dodger blue for low tides
+        'daylight': '#FFE5B4',   # Peach for daylight gradient
+        'daylight_opacity': '0.1',
+        'sunrise_line': '#FF8C00',  # Dark orange for sunrise/sunset
+    },
+    THEME_DARK: {
+        'background': '#000000',
+        'tide_line': '#FFFFFF',
+        'text': '#FFFFFF',
+        'title': '#FFFFFF',
+        'high_tide': '#FF6B6B',  # Soft red for high tides
+        'low_tide': '#4DABF7',   # Soft blue for low tides
+        'daylight': '#FFFFFF',   # White for daylight gradient
+        'daylight_opacity': '0.05',
+        'sunrise_line': '#FFA500',  # Orange for sunrise/sunset
+    },
+}
+
+TABLE_PALETTES = {
+    THEME_LIGHT: {
+        'background': '#FFFFFF',
+        'text': '#000000',
+        'title': '#000000',
+        'high_tide': '#DC143C',
+        'low_tide': '#1E90FF',
+        'header': '#CCCCCC',
+        'border': '#DDDDDD',
+    },
+    THEME_DARK: {
+        'background': '#000000',
+        'text': '#FFFFFF',
+        'title': '#FFFFFF',
+        'high_tide': '#FF6B6B',
+        'low_tide': '#4DABF7',
+        'header': '#666666',
+        'border': '#333333',
+    },
+}
+
+CALENDAR_PALETTES = {
+    THEME_LIGHT: {
+        **TABLE_PALETTES[THEME_LIGHT],
+        'spring': '#FDE2E4',  # Pale red for spring tides (largest range)
+        'neap': '#E3F2FD',    # Pale blue for neap tides (smallest range)
+        'today': '#000000',
+    },
+    THEME_DARK: {
+        **TABLE_PALETTES[THEME_DARK],
+        'spring': '#3A1F22',
+        'neap': '#1A2A3A',
+        'today': '#FFFFFF',
+    },
+}
+
+# CSS rules binding element classes to palette roles: (selector, property, role)
+PLOT_STYLE_RULES = (
+    ('.bg', 'fill', 'background'),
+    ('.curve', 'stroke', 'tide_line'),
+    ('.now', 'fill', 'tide_line'),
+    ('.txt', 'fill', 'text'),
+    ('.title', 'fill', 'title'),
+    ('.hi', 'fill', 'high_tide'),
+    ('.lo', 'fill', 'low_tide'),
+    ('.day', 'fill', 'daylight'),
+    ('.day', 'opacity', 'daylight_opacity'),
+    ('.sunline', 'stroke', 'sunrise_line'),
+    ('.suntxt', 'fill', 'sunrise_line'),
+    ('.band', 'fill', 'tide_line'),
+    ('.band', 'stroke', 'tide_line'),
+    ('.grid', 'stroke', 'text'),
+    ('.nowline', 'stroke', 'tide_line'),
+)
+
+TABLE_STYLE_RULES = (
+    ('.bg', 'fill', 'background'),
+    ('.txt', 'fill', 'text'),
+    ('.title', 'fill', 'title'),
+    ('.hi', 'fill', 'high_tide'),
+    ('.lo', 'fill', 'low_tide'),
+    ('.hdr', 'fill', 'header'),
+    ('.border', 'stroke', 'border'),
+)
+
+CALENDAR_STYLE_RULES = TABLE_STYLE_RULES + (
+    ('.cell', 'stroke', 'border'),
+    ('.spring', 'fill', 'spring'),
+    ('.neap', 'fill', 'neap'),
+    ('.tag', 'fill', 'header'),
+    ('.today', 'stroke', 'today'),
+)
+
+# Plot font sizes in layout units, before any bucket font scale
+PLOT_FONT_SIZES = {'text': 9, 'title': 14, 'day': 12, 'label': 10}
+
+# Sizes plots are served at to cameras that ask for one: (pixel width,
+# font scale). The layout keeps its own coordinate system and is scaled by
+# viewBox, so small buckets enlarge text to keep it legible
+PLOT_RESOLUTION_BUCKETS = ((320, 1.5), (480, 1.25), (800, 1.0), (1280, 1.0))
+
+# Sized SVG renders and PNG rasters kept per manager
+SIZED_CACHE_SIZE = 8
+RASTER_CACHE_SIZE = 8
+
+# Advance of one character of the monospace plot font, in ems, and the
+# extent of a line above and below its baseline
+PLOT_CHAR_WIDTH = 0.6
+PLOT_ASCENT = 0.8
+PLOT_DESCENT = 0.2
+
+# A plot label line: (css class, font role, x, baseline y, text)
+LabelLine = Tuple[str, str, float, float, str]
+
+
+class _LabelLayout:
+    """Place plot labels by measured extent so that none overlap.
+
+    Labels are offered in priority order, each with one or more candidate
+    positions (a candidate being one or more lines). The first candidate
+    that clears everything placed so far is taken; a label with no free
+    candidate is left out. Extents follow from the monospace font at the
+    bucket's font scale, so small buckets drop or move labels instead of
+    drawing them over each other.
+    """
+
+    def __init__(self, font_scale: float = 1.0):
+        """Initialize an empty layout."""
+        self._font_scale = font_scale
+        self._boxes: List[Tuple[float, float, float, float]] = []
+
+    def _extent(self, line: LabelLine) -> Tuple[float, float, float, float]:
+        """Return the (left, top, right, bottom) box of one label line."""
+        css_class, role, x, y, text = line
+        size = PLOT_FONT_SIZES[role] * self._font_scale
+        width = len(text) * PLOT_CHAR_WIDTH * size
+        classes = css_class.split()
+        if 'sr' in classes:
+            left = x
+        elif 'ss' in classes:
+            left = x - width
+        else:
+            left = x - width / 2
+        return left, y - PLOT_ASCENT * size, left + width, y + PLOT_DESCENT * size
+
+    def reserve(self, left: float, top: float, right: float, bottom: float) -> None:
+        """Keep labels out of a box, such as the title's."""
+        self._boxes.append((left, top, right, bottom))
+
+    def place(self, svg: SvgWriter, *candidates: Sequence[LabelLine]) -> bool:
+        """Write the first candidate that fits and return whether one did."""
+        for lines in candidates:
+            boxes = [self._extent(line) for line in lines]
+            if any(
+                left < p_right and p_left < right and top < p_bottom and p_top < bottom
+                for left, top, right, bottom in boxes
+                for p_left, p_top, p_right, p_bottom in self._boxes
+            ):
+                continue
+            self._boxes.extend(boxes)
+            for css_class, _, x, y, text in lines:
+                svg.element('text', {'class': css_class, 'x': x, 'y': y}, text)
+            return True
+        return False
+
+
+def _plot_title_baseline(font_scale: float = 1.0) -> float:
+    """Return the title's baseline; its top edge stays put as the font grows."""
+    return 11 + PLOT_FONT_SIZES['title'] * font_scale
+
+
+def _plot_label_layout(width: int, font_scale: float = 1.0) -> _LabelLayout:
+    """Return a label layout for a plot, with the title's band reserved."""
+    layout = _LabelLayout(font_scale)
+    layout.reserve(
+        0, 0, width, _plot_title_baseline(font_scale) + PLOT_DESCENT * PLOT_FONT_SIZES['title'] * font_scale
+    )
+    return layout
+
+
+def _plot_base_css(font_scale: float = 1.0) -> str:
+    """Return the theme-independent plot rules with fonts scaled by ``font_scale``."""
+    size = {role: format_number(px * font_scale) for role, px in PLOT_FONT_SIZES.items()}
+    return (
+        f"text{{font-family:{FONT_FAMILY};font-size:{size['text']}px;text-anchor:middle}}"
+        f".title{{font-size:{size['title']}px}}"
+        f".dl{{font-size:{size['day']}px;font-weight:bold}}"
+        f".hi,.lo{{font-size:{size['label']}px;font-weight:bold}}"
+        ".sr{text-anchor:start}"
+        ".ss{text-anchor:end}"
+        ".curve{fill:none;stroke-width:2;stroke-linecap:round;stroke-linejoin:round;"
+        "shape-rendering:geometricPrecision}"
+        ".sunline{stroke-width:1.5;stroke-dasharray:3 3;opacity:.5}"
+        ".band{fill-opacity:.35;stroke-width:1;stroke-linejoin:round}"
+        ".grid{stroke-width:1;opacity:.15}"
+        ".nowline{stroke-width:1.5;stroke-dasharray:4 3}"
+    )
+
+
+# Theme-independent table presentation, written once per document instead
+# of on every element
+TABLE_BASE_CSS = (
+    f"text{{font-family:{FONT_FAMILY};font-size:10px}}"
+    ".title{font-size:14px;font-weight:bold;text-anchor:middle}"
+    ".hdr{font-size:11px;font-weight:bold}"
+    ".hi,.lo{font-weight:bold}"
+    ".border{stroke-width:1}"
+)
+
+
+# Theme-independent calendar presentation
+CALENDAR_BASE_CSS = (
+    f"text{{font-family:{FONT_FAMILY};font-size:9px}}"
+    ".title{font-size:14px;font-weight:bold;text-anchor:middle}"
+    ".hdr{font-size:11px;font-weight:bold;text-anchor:middle}"
+    ".dn{font-size:11px;font-weight:bold}"
+    ".tag{font-size:8px;text-anchor:end}"
+    ".cell{fill:none;stroke-width:1}"
+    ".today{fill:none;stroke-width:2}"
+)
+
+
+def _theme_style(
+    rules: Sequence[Tuple[str, str, str]],
+    palettes: Dict[str, Dict[str, str]],
+    theme: str,
+    overrides: Optional[Dict[str, str]] = None,
+    base_css: str = ""
+) -> str:
+    """Return the <style> block that styles a theme-agnostic SVG body.
+
+    ``base_css`` carries the theme-independent rules. Fixed themes get
+    literal colors so any SVG consumer can render them; the auto theme
+    uses CSS custom properties switched by prefers-color-scheme.
+    """
+    overrides = overrides or {}
+    if theme != THEME_AUTO:
+        palette = {**palettes[theme], **overrides}
+        return "<style>" + base_css + "".join(
+            f"{selector}{{{prop}:{palette[role]}}}" for selector, prop, role in rules
+        ) + "</style>"
+
+    def _variables(palette: Dict[str, str]) -> str:
+        palette = {**palette, **overrides}
+        return ";".join(f"--{role}:{value}" for role, value in palette.items())
+
+    return (
+        f"<style>{base_css}svg{{{_variables(palettes[THEME_LIGHT])}}}"
+        f"@media (prefers-color-scheme:dark){{svg{{{_variables(palettes[THEME_DARK])}}}}}"
+        + "".join(f"{selector}{{{prop}:var(--{role})}}" for selector, prop, role in rules)
+        + "</style>"
+    )
+
+
+def _fingerprint(*parts: Any) -> str:
+    """Return a short content hash of the given render inputs."""
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=CHROME_CACHE_SIZE)
+def _plot_style(theme: str, transparent_background: bool, font_scale: float = 1.0) -> str:
+    """Return the cached <style> block for a plot theme."""
+    overrides = {'background': 'none'} if transparent_background else None
+    return _theme_style(
+        PLOT_STYLE_RULES, PLOT_PALETTES, theme, overrides, _plot_base_css(font_scale)
+    )
+
+
+@functools.lru_cache(maxsize=CHROME_CACHE_SIZE)
+def _table_style(theme: str) -> str:
+    """Return the cached <style> block for a table theme."""
+    return _theme_style(TABLE_STYLE_RULES, TABLE_PALETTES, theme, base_css=TABLE_BASE_CSS)
+
+
+@functools.lru_cache(maxsize=CHROME_CACHE_SIZE)
+def _calendar_style(theme: str) -> str:
+    """Return the cached <style> block for a calendar theme."""
+    return _theme_style(CALENDAR_STYLE_RULES, CALENDAR_PALETTES, theme, base_css=CALENDAR_BASE_CSS)
+
+
+@functools.lru_cache(maxsize=CHROME_CACHE_SIZE)
+def _plot_chrome(
+    width: int, height: int, plot_days: int, name: str, font_scale: float = 1.0
+) -> Tuple[str, str]:
+    """Return the static layers drawn under and over a plot's data.
+
+    They depend only on the size, day range, station name and font scale,
+    which are exactly the cache key; colors come from the theme's style
+    block.
+    """
+    under = SvgWriter()
+    under.element('rect', {'class': 'bg', 'width': width, 'height': height})
+
+    # Sunrise/sunset line, drawn with <use> at each x (short plots only)
+    if plot_days <= 3:
+        under.open('defs')
+        under.element('path', {
+            'id': 'sl', 'class': 'sunline', 'd': f"M0,{PLOT_MARGIN}V{height - PLOT_MARGIN}",
+        })
+        under.close('defs')
+
+    if plot_days == 1:
+        title_text = f"TIDE PREDICTION - {name.upper()}"
+    else:
+        title_text = f"TIDE PREDICTION ({plot_days}D) - {name.upper()}"
+
+    over = SvgWriter()
+    over.element('text', {
+        'class': 'title', 'x': width / 2, 'y': _plot_title_baseline(font_scale),
+    }, title_text)
+
+    return under.getvalue(), over.getvalue()
+
+
+@functools.lru_cache(maxsize=CHROME_CACHE_SIZE)
+def _table_chrome(table_days: int, name: str) -> str:
+    """Return a table's static title, column headers and separator."""
+    svg = SvgWriter()
+
+    # Title
+    svg.element('text', {
+        'class': 'title', 'x': TABLE_WIDTH / 2, 'y': 25,
+    }, f"TIDE SCHEDULE ({table_days}D) - {name.upper()}")
+
+    # Table headers
+    headers = ["DATE", "TIDE", "TIME", "HEIGHT"]
+    for x, header in zip(TABLE_COLUMNS_X, headers):
+        svg.element('text', {
+            'class': 'hdr', 'x': x, 'y': 60,
+        }, header)
+
+    # Header separator line
+    svg.element('line', {
+        'class': 'border', 'x1': 40, 'y1': 65,
+        'x2': TABLE_WIDTH - 40, 'y2': 65,
+    })
+
+    return svg.getvalue()
+
+
+@functools.lru_cache(maxsize=CHROME_CACHE_SIZE)
+def _calendar_chrome(year: int, month: int, weeks: int, name: str) -> Tuple[int, int, str]:
+    """Return a month's size and static layer: background, title, weekday header, legend."""
+    width = 2 * CALENDAR_MARGIN + 7 * CALENDAR_CELL_WIDTH
+    height = CALENDAR_GRID_TOP + weeks * CALENDAR_CELL_HEIGHT + 40
+
+    svg = SvgWriter()
+    svg.element('rect', {'class': 'bg', 'width': width, 'height': height})
+    svg.element('text', {
+        'class': 'title', 'x': width / 2, 'y': 25,
+    }, f"TIDE CALENDAR - {calendar.month_name[month].upper()} {year} - {name.upper()}")
+
+    # Weeks start on Sunday
+    for column, day_name in enumerate(("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT")):
+        svg.element('text', {
+            'class': 'hdr',
+            'x': CALENDAR_MARGIN + (column + 0.5) * CALENDAR_CELL_WIDTH,
+            'y': CALENDAR_GRID_TOP - 10,
+        }, day_name)
+
+    legend_y = height - 25
+    for offset, (css_class, label) in enumerate((
+        ('spring', "SPRING TIDES (LARGEST RANGE)"),
+        ('neap', "NEAP TIDES (SMALLEST RANGE)"),
+    )):
+        x = CALENDAR_MARGIN + offset * 300
+        svg.element('rect', {
+            'class': f'cell {css_class}', 'x': x, 'y': legend_y, 'width': 14, 'height': 14,
+        })
+        svg.element('text', {'class': 'txt', 'x': x + 20, 'y': legend_y + 11}, label)
+
+    return width, height, svg.getvalue()
+
+
+@functools.lru_cache(maxsize=CALENDAR_CELL_CACHE_SIZE)
+def _calendar_cell(
+    day: datetime.date,
+    column: int,
+    week: int,
+    events: Tuple[Tuple[str, str, float], ...],
+    range_class: str,
+    today: bool
+) -> str:
+    """Return the markup of one day cell.
+
+    ``events`` are ``(type, time label, height)`` for the day's highs and
+    lows. Every input that shows in the cell is part of the cache key, so
+    as the month goes on only the cells whose data, spring/neap class or
+    today outline changed are rebuilt.
+    """
+    x = CALENDAR_MARGIN + column * CALENDAR_CELL_WIDTH
+    y = CALENDAR_GRID_TOP + week * CALENDAR_CELL_HEIGHT
+
+    svg = SvgWriter()
+    svg.element('rect', {
+        'class': f'cell {range_class}'.strip(), 'x': x, 'y': y,
+        'width': CALENDAR_CELL_WIDTH, 'height': CALENDAR_CELL_HEIGHT,
+    })
+    if today:
+        svg.element('rect', {
+            'class': 'today', 'x': x + 2, 'y': y + 2,
+            'width': CALENDAR_CELL_WIDTH - 4, 'height': CALENDAR_CELL_HEIGHT - 4,
+        })
+
+    svg.element('text', {'class': 'txt dn', 'x': x + 6, 'y': y + 15}, str(day.day))
+    if range_class:
+        svg.element('text', {
+            'class': 'tag', 'x': x + CALENDAR_CELL_WIDTH - 6, 'y': y + 14,
+        }, range_class.upper())
+
+    for line, (tide_type, time_label, height) in enumerate(events[:CALENDAR_MAX_EVENTS]):
+        is_high = tide_type == 'pleamar'
+        svg.element('text', {
+            'class': 'hi' if is_high else 'lo', 'x': x + 6, 'y': y + 30 + line * 12,
+        }, f"{'H' if is_high else 'L'} {time_label:>7} {height:4.1f}")
+
+    return svg.getvalue()
+
+
+def _spring_neap(ranges: Dict[datetime.date, float]) -> Dict[datetime.date, str]:
+    """Classify days as 'spring' or 'neap' by their tidal range.
+
+    Days whose range falls in the top (bottom) SPRING_NEAP_FRACTION of
+    the month's spread are spring (neap) tides; the rest are unmarked.
+    """
+    if not ranges:
+        return {}
+    low, high = min(ranges.values()), max(ranges.values())
+    spread = high - low
+    if spread <= 0:
+        return {}
+
+    classes = {}
+    for day, tidal_range in ranges.items():
+        if tidal_range >= high - spread * SPRING_NEAP_FRACTION:
+            classes[day] = 'spring'
+        elif tidal_range <= low + spread * SPRING_NEAP_FRACTION:
+            classes[day] = 'neap'
+    return classes
+
+
+class _RenderCache:
+    """Small thread-safe LRU of served images, kept per manager.
+
+    This is serve-side state: it is dropped rather than pickled when a
+    manager is sent to a render worker.
+    """
+
+    def __init__(self, size: int):
+        """Initialize an empty cache holding up to ``size`` images."""
+        self._size = size
+        self._items: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the capacity only."""
+        return {'size': self._size}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Recreate an empty cache in the receiving process."""
+        self.__init__(state['size'])
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[bytes]:
+        """Return the image cached under ``key``, marking it recently used."""
+        with self._lock:
+            image = self._items.get(key)
+            if image is not None:
+                self._items.move_to_end(key)
+            return image
+
+    def put(self, key: Tuple[Any, ...], image: bytes) -> None:
+        """Cache ``image``, evicting the least recently used beyond capacity."""
+        with self._lock:
+            self._items[key] = image
+            while len(self._items) > self._size:
+                self._items.popitem(last=False)
+
+
+def _prepared_timeline(tide_data: Dict[str, Any]) -> Optional[TideTimeline]:
+    """Return the shared timeline, building one from raw daily data if needed."""
+    timeline = tide_data.get("timeline")
+    if timeline is None and tide_data.get("all_daily_data"):
+        timeline = TideTimeline.from_daily_data(tide_data["all_daily_data"], dt_util.now().tzinfo)
+    return timeline
+
+
+class _ArtifactManager:
+    """Bookkeeping shared by the plot, table and calendar managers.
+
+    A manager renders one document per theme in ``filenames``. The render
+    engine publishes them to its ArtifactRegistry under ``artifact_id``,
+    which is what cameras and views serve; with ``export`` they are also
+    written to the files, and ``precompress`` adds gzip siblings.
+    """
+
+    # What the manager renders, for logs
+    _label = "artifact"
+
+    def __init__(
+        self,
+        name: str,
+        filenames: Dict[str, str],
+        precompress: bool = False,
+        artifact_id: Optional[ArtifactId] = None,
+        export: bool = True,
+    ):
+        """Initialize the shared state."""
+        self._name = name
+        self._filenames = dict(filenames)
+        self._precompress = precompress
+        self._artifact_id = artifact_id
+        self._export = export
+        self._last_fingerprint: Optional[str] = None
+
+    @property
+    def filenames(self) -> Dict[str, str]:
+        """Return the output path for each theme."""
+        return self._filenames
+
+    @property
+    def artifact_id(self) -> Optional[ArtifactId]:
+        """Return the (station, kind, days) documents are published under."""
+        return self._artifact_id
+
+    def is_current(self, fingerprint: Optional[str], registry: Optional[ArtifactRegistry] = None) -> bool:
+        """Return True if the published artifacts were rendered from ``fingerprint``.
+
+        With a ``registry``, every theme's artifact must also be held
+        there with that fingerprint; exported files are not checked.
+        """
+        if fingerprint is None or fingerprint != self._last_fingerprint:
+            return False
+        if registry is None or self._artifact_id is None:
+            return True
+        for theme in self._filenames:
+            artifact = registry.get((*self._artifact_id, theme))
+            if artifact is None or artifact.fingerprint != fingerprint:
+                return False
+        return True
+
+    def mark_rendered(self, fingerprint: Optional[str]) -> None:
+        """Record the fingerprint of an artifact rendered elsewhere."""
+        self._last_fingerprint = fingerprint
+
+    def _save_svg(self, filename: str, document: bytes) -> bool:
+        """Save a themed document to file."""
+        try:
+            if write_artifact(filename, document, self._precompress):
+                _LOGGER.debug("Saved %s to %s", self._label, filename)
+            else:
+                _LOGGER.debug("%s %s unchanged on disk", self._label.capitalize(), filename)
+            return True
+        except Exception as e:
+            _LOGGER.error("Error saving %s: %s", self._label, e)
+            return False
+
 
-class TideTableManager:
+class TideTableManager(_ArtifactManager):
     """Class to manage SVG-based tide table schedules."""
 
+    _label = "tide table"
+
     def __init__(
         self,
         name: str,
-        filename: str,
-        dark_mode: bool = False,
+        filenames: Dict[str, str],
         table_days: int = 3,
+        precompress: bool = False,
+        artifact_id: Optional[ArtifactId] = None,
+        export: bool = True,
     ):
-        """Initialize the table manager."""
-        self._name = name
-        self._filename = filename
-        self._dark_mode = dark_mode
+        """Initialize the table manager.
+
+        ``filenames`` maps each theme to render (light, dark, auto) to its
+        output path; all of them are stamped from one layout pass. The
+        render engine publishes the documents under ``artifact_id``; with
+        ``export`` they are also written to the files, and with
+        ``precompress`` each file gets a gzip sibling.
+        """
+        super().__init__(name, filenames, precompress, artifact_id, export)
         self._table_days = table_days
+        # (theme, fingerprint) -> PNG
+        self._raster_cache = _RenderCache(RASTER_CACHE_SIZE)
+
+    def __repr__(self) -> str:
+        """Return a short description for logs."""
+        return f"<TideTableManager {self._name} {self._table_days}d>"
+
+    def render_fingerprint(
+        self,
+        tide_data: Dict[str, Any],
+        current_time: datetime.datetime
+    ) -> Optional[str]:
+        """Fingerprint the inputs that determine the rendered table.
+
+        Rows only change when an extreme drops into the past, so the time
+        component is the next upcoming extreme rather than the clock.
+        """
+        timeline = _prepared_timeline(tide_data)
+        if timeline is None:
+            return None
+
+        next_extreme = timeline.next_extreme(current_time)
+        return _fingerprint(
+            "table",
+            timeline.fingerprint,
+            timeline.days[:self._table_days],
+            next_extreme["time"].timestamp() if next_extreme else None,
+            self._table_days,
+            self._precompress,
+            tuple(sorted(self._filenames)),
+            self._name,
+        )
 
     def generate_tide_table(
         self,
@@ -40,246 +704,391 @@ class TideTableManager:
         if current_time is None:
             current_time = dt_util.now()
 
-        try:
-            # Extract extremes (high/low tides) from the data
-            extremes = self._extract_extremes(tide_data)
+        # Skip rendering and writing when nothing visible has changed
+        fingerprint = self.render_fingerprint(tide_data, current_time)
+        if self.is_current(fingerprint):
+            _LOGGER.debug("Tide table %r unchanged, skipping render", self)
+            return True
 
-            if not extremes:
-                _LOGGER.warning("No extremes found for tide table")
-                return False
+        documents = self.generate(tide_data, current_time)
+        self._last_fingerprint = fingerprint if documents is not None else None
+        return documents is not None
 
-            # Generate SVG table
-            svg_content = self._generate_svg_table(extremes, current_time)
+    def generate(
+        self,
+        tide_data: Dict[str, Any],
+        current_time: Optional[datetime.datetime] = None
+    ) -> Optional[Dict[str, bytes]]:
+        """Render each theme's document (render engine entry point).
 
-            # Save SVG
-            return self._save_svg(svg_content)
+        Returns the documents by theme, or None if rendering or the export
+        failed.
+        """
+        if current_time is None:
+            current_time = dt_util.now()
+
+        try:
+            timeline = _prepared_timeline(tide_data)
+            if timeline is None:
+                _LOGGER.warning("Cannot generate table: no tide timeline available")
+                return None
+
+            # High/low tides for this table's days, sliced from the shared timeline
+            view = timeline.day_window(self._table_days)
+            if not view.extreme_count:
+                _LOGGER.warning("No extremes found for tide table")
+                return None
+
+            # Lay the upcoming rows out once, then stamp each theme's colors onto them
+            width, height, body = self._generate_svg_table(view.upcoming_extremes(current_time))
+            documents = {
+                theme: svg_document(width, height, _table_style(theme), body)
+                for theme in self._filenames
+            }
 
         except Exception as e:
             _LOGGER.error(f"Error generating tide table: {e}")
-            return False
+            return None
+
+        if self._export and not all([
+            self._save_svg(filename, documents[theme]) for theme, filename in self._filenames.items()
+        ]):
+            return None
+        return documents
 
-    def _extract_extremes(self, tide_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract high/low tide extremes from tide data."""
-        extremes = []
-        seen_times = set()  # Track unique times to avoid duplicates
-
-        # Check if we have multi-day data
-        if "all_daily_data" in tide_data and tide_data["all_daily_data"]:
-            # Limit to the requested number of days
-            days_to_process = min(self._table_days, len(tide_data["all_daily_data"]))
-
-            for day_idx in range(days_to_process):
-                day_data_info = tide_data["all_daily_data"][day_idx]
-                day_data = day_data_info["data"]
-                date_str = day_data_info["date"]
-
-                if day_data and "mareas" in day_data:
-                    mareas = day_data["mareas"]
-
-                    # Use the dedicated pleamares and bajamares arrays to avoid duplicates
-                    # Process high tides (pleamares)
-                    if "pleamares" in mareas:
-                        for event in mareas["pleamares"]:
-                            if "hora" in event and "altura" in event:
-                                time_str = event["hora"]
-                                day_date = datetime.datetime.strptime(date_str, "%Y%m%d")
-                                time_parts = time_str.split(":")
-                                hours = int(time_parts[0])
-                                minutes = int(time_parts[1])
-
-                                dt = datetime.datetime(
-                                    year=day_date.year,
-                                    month=day_date.month,
-                                    day=day_date.day,
-                                    hour=hours,
-                                    minute=minutes
-                                )
-                                dt = dt_util.as_local(dt)
-
-                                # Check for duplicates using timestamp
-                                time_key = dt.strftime("%Y%m%d%H%M")
-                                if time_key not in seen_times:
-                                    seen_times.add(time_key)
-                                    extremes.append({
-                                        'time': dt,
-                                        'height': float(event["altura"]),
-                                        'type': 'pleamar'
-                                    })
-
-                    # Process low tides (bajamares)
-                    if "bajamares" in mareas:
-                        for event in mareas["bajamares"]:
-                            if "hora" in event and "altura" in event:
-                                time_str = event["hora"]
-                                day_date = datetime.datetime.strptime(date_str, "%Y%m%d")
-                                time_parts = time_str.split(":")
-                                hours = int(time_parts[0])
-                                minutes = int(time_parts[1])
-
-                                dt = datetime.datetime(
-                                    year=day_date.year,
-                                    month=day_date.month,
-                                    day=day_date.day,
-                                    hour=hours,
-                                    minute=minutes
-                                )
-                                dt = dt_util.as_local(dt)
-
-                                # Check for duplicates using timestamp
-                                time_key = dt.strftime("%Y%m%d%H%M")
-                                if time_key not in seen_times:
-                                    seen_times.add(time_key)
-                                    extremes.append({
-                                        'time': dt,
-                                        'height': float(event["altura"]),
-                                        'type': 'bajamar'
-                                    })
-
-        return sorted(extremes, key=lambda x: x['time'])
-
-    def _generate_svg_table(
+    def raster_image(
         self,
-        extremes: List[Dict[str, Any]],
-        current_time: datetime.datetime
-    ) -> str:
-        """Generate SVG table content."""
+        tide_data: Dict[str, Any],
+        theme: str,
+        current_time: Optional[datetime.datetime] = None
+    ) -> Optional[bytes]:
+        """Return this table as PNG, cached per theme and data fingerprint."""
+        if current_time is None:
+            current_time = dt_util.now()
 
-        # SVG dimensions - make it wide enough for a readable table
-        width, height = 600, 50 + (len(extremes) * 30) + 50  # Dynamic height based on rows
-
-        # Color scheme
-        if self._dark_mode:
-            colors = {
-                'background': '#000000',
-                'text': '#FFFFFF',
-                'title': '#FFFFFF',
-                'high_tide': '#FF6B6B',
-                'low_tide': '#4DABF7',
-                'header': '#666666',
-                'border': '#333333',
-            }
-        else:
-            colors = {
-                'background': '#FFFFFF',
-                'text': '#000000',
-                'title': '#000000',
-                'high_tide': '#DC143C',
-                'low_tide': '#1E90FF',
-                'header': '#CCCCCC',
-                'border': '#DDDDDD',
-            }
+        fingerprint = self.render_fingerprint(tide_data, current_time)
+        if fingerprint is None:
+            return None
 
-        # Start SVG
-        svg_parts = [
-            f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">',
-            f'<rect width="{width}" height="{height}" fill="{colors["background"]}"/>',
-        ]
-
-        # Title
-        title_text = f"TIDE SCHEDULE ({self._table_days}D) - {self._name.upper()}"
-        svg_parts.append(f'''
-            <text x="{width/2}" y="25" text-anchor="middle" font-family="'Courier New', 'Courier', monospace" font-size="14" font-weight="bold" fill="{colors["title"]}">
-                {title_text}
-            </text>
-        ''')
-
-        # Table headers
-        y_offset = 60
-        col_widths = [120, 80, 100, 100]  # Day, Type, Time, Height
-        col_x = [50, 170, 250, 350]
+        key = (theme, fingerprint)
+        image = self._raster_cache.get(key)
+        if image is not None:
+            return image
+
+        view = _prepared_timeline(tide_data).day_window(self._table_days)
+        if not view.extreme_count:
+            return None
 
-        headers = ["DATE", "TIDE", "TIME", "HEIGHT"]
-        for i, header in enumerate(headers):
-            svg_parts.append(f'''
-                <text x="{col_x[i]}" y="{y_offset}" text-anchor="start" font-family="'Courier New', 'Courier', monospace" font-size="11" font-weight="bold" fill="{colors["header"]}">
-                    {header}
-                </text>
-            ''')
+        width, height, body = self._generate_svg_table(view.upcoming_extremes(current_time))
+        image = svg_to_png(svg_document(width, height, _table_style(theme), body))
+        self._raster_cache.put(key, image)
+        _LOGGER.debug("Rasterized %r (%d bytes)", self, len(image))
+        return image
+
+    def _generate_svg_table(self, extremes: List[Dict[str, Any]]) -> Tuple[int, int, str]:
+        """Generate the theme-agnostic SVG table body.
+
+        ``extremes`` are the rows to show, already cut at the current
+        time. Returns the document width and height and the body markup;
+        colors are applied by the theme's <style> block.
+        """
+
+        # SVG dimensions - make it wide enough for a readable table
+        width, height = TABLE_WIDTH, 50 + (len(extremes) * 30) + 50  # Dynamic height based on visible rows
+        col_x = TABLE_COLUMNS_X
 
-        # Header separator line
-        svg_parts.append(f'<line x1="40" y1="{y_offset + 5}" x2="{width - 40}" y2="{y_offset + 5}" stroke="{colors["border"]}" stroke-width="1"/>')
+        # Background, then the cached title and headers
+        svg = SvgWriter()
+        svg.element('rect', {'class': 'bg', 'width': width, 'height': height})
+        svg.raw(_table_chrome(self._table_days, self._name))
+
+        y_offset = 60
 
         # Table rows
         y_offset += 25
         current_date = None
 
-        for extreme in extremes:
-            # Only show future tides
-            if extreme['time'] < current_time:
-                continue
+        def cell(css_class: str, x: int, text: str) -> None:
+            svg.element('text', {'class': css_class, 'x': x, 'y': y_offset}, text)
 
+        for extreme in extremes:
             is_high = extreme['type'] == 'pleamar'
-            tide_color = colors['high_tide'] if is_high else colors['low_tide']
 
             # Date (only show if different from previous)
             date_str = extreme['time'].strftime("%a %m/%d")
             if date_str != current_date:
                 current_date = date_str
-                svg_parts.append(f'''
-                    <text x="{col_x[0]}" y="{y_offset}" text-anchor="start" font-family="'Courier New', 'Courier', monospace" font-size="10" fill="{colors["text"]}">
-                        {date_str}
-                    </text>
-                ''')
-
-            # Tide type
-            tide_type = "HIGH" if is_high else "LOW"
-            svg_parts.append(f'''
-                <text x="{col_x[1]}" y="{y_offset}" text-anchor="start" font-family="'Courier New', 'Courier', monospace" font-size="10" font-weight="bold" fill="{tide_color}">
-                    {tide_type}
-                </text>
-            ''')
-
-            # Time
-            time_str = extreme['time'].strftime("%I:%M%p").lstrip('0')
-            svg_parts.append(f'''
-                <text x="{col_x[2]}" y="{y_offset}" text-anchor="start" font-family="'Courier New', 'Courier', monospace" font-size="10" fill="{colors["text"]}">
-                    {time_str}
-                </text>
-            ''')
-
-            # Height
-            height_str = f"{extreme['height']:.1f}m"
-            svg_parts.append(f'''
-                <text x="{col_x[3]}" y="{y_offset}" text-anchor="start" font-family="'Courier New', 'Courier', monospace" font-size="10" fill="{colors["text"]}">
-                    {height_str}
-                </text>
-            ''')
+                cell('txt', col_x[0], date_str)
+
+            # Tide type, time and height
+            cell('hi' if is_high else 'lo', col_x[1], "HIGH" if is_high else "LOW")
+            cell('txt', col_x[2], extreme['time'].strftime("%I:%M%p").lstrip('0'))
+            cell('txt', col_x[3], f"{extreme['height']:.1f}m")
 
             y_offset += 30
 
-        svg_parts.append('</svg>')
+        return width, height, svg.getvalue()
 
-        return '\n'.join(svg_parts)
 
-    def _save_svg(self, svg_content: str) -> bool:
-        """Save SVG content to file."""
-        try:
-            with open(self._filename, 'w', encoding='utf-8') as f:
-                f.write(svg_content)
-            _LOGGER.debug("Saved tide table to %s", self._filename)
+
+class TideCalendarManager(_ArtifactManager):
+    """Class to manage the SVG month-at-a-glance tide calendar."""
+
+    _label = "tide calendar"
+
+    def __init__(
+        self,
+        name: str,
+        filenames: Dict[str, str],
+        precompress: bool = False,
+        artifact_id: Optional[ArtifactId] = None,
+        export: bool = True,
+    ):
+        """Initialize the calendar manager.
+
+        ``filenames`` maps each theme to render (light, dark, auto) to its
+        output path. The calendar is drawn from the monthly high/low
+        events, for the month containing the render time. Documents are
+        published under ``artifact_id`` and, with ``export``, written to
+        the files; ``precompress`` adds gzip siblings.
+        """
+        super().__init__(name, filenames, precompress, artifact_id, export)
+        # (theme, fingerprint) -> PNG
+        self._raster_cache = _RenderCache(RASTER_CACHE_SIZE)
+
+    def __repr__(self) -> str:
+        """Return a short description for logs."""
+        return f"<TideCalendarManager {self._name}>"
+
+    def render_fingerprint(
+        self,
+        tide_data: Dict[str, Any],
+        current_time: datetime.datetime
+    ) -> Optional[str]:
+        """Fingerprint the inputs that determine the rendered calendar.
+
+        Besides the monthly events only the date matters (it moves the
+        today outline), so the calendar re-renders at most once a day.
+        """
+        monthly = tide_data.get("monthly")
+        if monthly is None or not monthly.extreme_count:
+            return None
+
+        return _fingerprint(
+            "calendar",
+            monthly.fingerprint,
+            current_time.date().isoformat(),
+            self._precompress,
+            tuple(sorted(self._filenames)),
+            self._name,
+        )
+
+    def generate_tide_calendar(
+        self,
+        tide_data: Dict[str, Any],
+        current_time: Optional[datetime.datetime] = None
+    ) -> bool:
+        """Generate the tide calendar SVG from the monthly events."""
+        if current_time is None:
+            current_time = dt_util.now()
+
+        fingerprint = self.render_fingerprint(tide_data or {}, current_time)
+        if self.is_current(fingerprint):
+            _LOGGER.debug("Tide calendar %r unchanged, skipping render", self)
             return True
+
+        documents = self.generate(tide_data or {}, current_time)
+        self._last_fingerprint = fingerprint if documents is not None else None
+        return documents is not None
+
+    def generate(
+        self,
+        tide_data: Dict[str, Any],
+        current_time: Optional[datetime.datetime] = None
+    ) -> Optional[Dict[str, bytes]]:
+        """Render each theme's document (render engine entry point).
+
+        Returns the documents by theme, or None if rendering or the export
+        failed.
+        """
+        if current_time is None:
+            current_time = dt_util.now()
+
+        try:
+            monthly = tide_data.get("monthly")
+            if monthly is None or not monthly.extreme_count:
+                _LOGGER.warning("Cannot generate calendar: no monthly tide events available")
+                return None
+
+            width, height, body = self._generate_svg_calendar(monthly, current_time)
+            documents = {
+                theme: svg_document(width, height, _calendar_style(theme), body)
+                for theme in self._filenames
+            }
+
         except Exception as e:
-            _LOGGER.error("Error saving tide table: %s", e)
-            return False
+            _LOGGER.error("Error generating tide calendar: %s", e)
+            return None
 
+        if self._export and not all([
+            self._save_svg(filename, documents[theme]) for theme, filename in self._filenames.items()
+        ]):
+            return None
+        return documents
+
+    def raster_image(
+        self,
+        tide_data: Dict[str, Any],
+        theme: str,
+        current_time: Optional[datetime.datetime] = None
+    ) -> Optional[bytes]:
+        """Return the calendar as PNG, cached per theme and data fingerprint."""
+        if current_time is None:
+            current_time = dt_util.now()
+
+        fingerprint = self.render_fingerprint(tide_data, current_time)
+        if fingerprint is None:
+            return None
 
-class TidePlotManager:
+        key = (theme, fingerprint)
+        image = self._raster_cache.get(key)
+        if image is not None:
+            return image
+
+        width, height, body = self._generate_svg_calendar(tide_data["monthly"], current_time)
+        image = svg_to_png(svg_document(width, height, _calendar_style(theme), body))
+        self._raster_cache.put(key, image)
+        _LOGGER.debug("Rasterized %r (%d bytes)", self, len(image))
+        return image
+
+    def _generate_svg_calendar(
+        self,
+        monthly: TideTimeline,
+        current_time: datetime.datetime
+    ) -> Tuple[int, int, str]:
+        """Generate the theme-agnostic calendar body for ``current_time``'s month.
+
+        Returns the document width and height and the body markup. Day
+        cells come from the per-process cell cache (see _calendar_cell()).
+        """
+        today = current_time.date()
+        year, month = today.year, today.month
+        month_start = datetime.datetime(year, month, 1, tzinfo=monthly.tz)
+        next_month = (month_start + datetime.timedelta(days=32)).replace(day=1)
+
+        # Group the month's highs and lows by local date
+        by_day: Dict[datetime.date, List[Dict[str, Any]]] = {}
+        for extreme in monthly.window(month_start, next_month).extremes:
+            by_day.setdefault(extreme['time'].date(), []).append(extreme)
+
+        ranges = {}
+        for day, extremes in by_day.items():
+            highs = [e['height'] for e in extremes if e['type'] == 'pleamar']
+            lows = [e['height'] for e in extremes if e['type'] != 'pleamar']
+            if highs and lows:
+                ranges[day] = max(highs) - min(lows)
+        range_classes = _spring_neap(ranges)
+
+        weeks = calendar.Calendar(firstweekday=calendar.SUNDAY).monthdatescalendar(year, month)
+        width, height, chrome = _calendar_chrome(year, month, len(weeks), self._name)
+
+        svg = SvgWriter()
+        svg.raw(chrome)
+        for week, dates in enumerate(weeks):
+            for column, day in enumerate(dates):
+                if day.month != month:
+                    continue
+                events = tuple(
+                    (e['type'], e['time'].strftime("%I:%M%p").lstrip('0'), e['height'])
+                    for e in by_day.get(day, ())
+                )
+                svg.raw(_calendar_cell(
+                    day, column, week, events, range_classes.get(day, ''), day == today
+                ))
+
+        return width, height, svg.getvalue()
+
+
+
+class TidePlotManager(_ArtifactManager):
     """Class to manage SVG-based tide plots."""
 
+    _label = "tide plot"
+
     def __init__(
         self,
         name: str,
-        filename: str,
+        filenames: Dict[str, str],
         transparent_background: bool = False,
-        dark_mode: bool = False,
         plot_days: int = 1,
+        width: int = PLOT_WIDTH,
+        height: int = PLOT_HEIGHT,
+        animate_now_marker: bool = False,
+        precision: int = DEFAULT_PRECISION,
+        precompress: bool = False,
+        artifact_id: Optional[ArtifactId] = None,
+        export: bool = True,
     ):
-        """Initialize the plot manager."""
-        self._name = name
-        self._filename = filename
+        """Initialize the plot manager.
+
+        ``filenames`` maps each theme to render (light, dark, auto) to its
+        output path; all of them are stamped from one geometry pass. With
+        ``animate_now_marker`` the base plot embeds a SMIL-animated marker
+        that moves along the curve by itself instead of a serve-time dot.
+        Coordinates are written with ``precision`` decimals. Documents are
+        published under ``artifact_id`` and, with ``export``, written to
+        the files; ``precompress`` adds gzip siblings.
+        """
+        super().__init__(name, filenames, precompress, artifact_id, export)
         self._transparent_background = transparent_background
-        self._dark_mode = dark_mode
         self._plot_days = plot_days
+        self._width = width
+        self._height = height
+        self._animate_now_marker = animate_now_marker
+        self._precision = precision
+        # (timeline fingerprint, geometry) of the last served base plot
+        self._geometry_cache: Optional[Tuple[str, Optional[PlotGeometry]]] = None
+        # (theme, bucket, fingerprint) -> sized document
+        self._sized_cache = _RenderCache(SIZED_CACHE_SIZE)
+        # (theme, bucket, fingerprint, now-marker) -> PNG
+        self._raster_cache = _RenderCache(RASTER_CACHE_SIZE)
+        # (document hashes, whole-pixel now-marker) of the last export
+        self._exported: Optional[Tuple[Tuple[int, ...], str]] = None
+
+    def __repr__(self) -> str:
+        """Return a short description for logs."""
+        return f"<TidePlotManager {self._name} {self._plot_days}d>"
+
+    def render_fingerprint(
+        self,
+        tide_data: Dict[str, Any],
+        current_time: datetime.datetime
+    ) -> Optional[str]:
+        """Fingerprint the inputs that determine the rendered plot.
+
+        The base plot carries no now-marker (see now_marker()), so the
+        clock does not enter and the plot is re-rendered only when the
+        data or layout changes.
+        """
+        timeline = _prepared_timeline(tide_data)
+        if timeline is None:
+            return None
+
+        return _fingerprint(
+            "plot",
+            timeline.fingerprint,
+            timeline.days[:self._plot_days],
+            tide_data.get("location"),
+            self._plot_days,
+            tuple(sorted(self._filenames)),
+            self._transparent_background,
+            self._animate_now_marker,
+            self._precision,
+            self._precompress,
+            self._width,
+            self._height,
+            self._name,
+        )
 
     def generate_tide_plot(
         self, 
@@ -294,203 +1103,340 @@ class TidePlotManager:
         if current_time is None:
             current_time = dt_util.now()
 
+        # Skip rendering and writing when nothing visible has changed
+        fingerprint = self.render_fingerprint(tide_data, current_time)
+        if self.is_current(fingerprint):
+            _LOGGER.debug("Tide plot %r unchanged, skipping render", self)
+            return True
+
+        documents = self.generate(tide_data, current_time)
+        self._last_fingerprint = fingerprint if documents is not None else None
+        return documents is not None
+
+    def generate(
+        self,
+        tide_data: Dict[str, Any],
+        current_time: Optional[datetime.datetime] = None
+    ) -> Optional[Dict[str, bytes]]:
+        """Render each theme's document (render engine entry point).
+
+        Returns the documents by theme, or None if rendering or the export
+        failed.
+        """
+        if current_time is None:
+            current_time = dt_util.now()
+
         try:
-            # Extract tide predictions
-            predictions = self._extract_predictions(tide_data)
-            if not predictions:
+            # Compute the geometry once as a theme-agnostic base body; the
+            # now-marker is spliced in when the image is served
+            body = self._plot_body(tide_data, current_time)
+            if body is None:
                 _LOGGER.warning("No valid predictions found in tide data")
-                return False
-
-            # Generate interpolated curve points for smooth visualization
-            curve_points = self._generate_smooth_curve(predictions, current_time)
-            
-            # Find extremes (high/low tides)
-            extremes = self._find_extremes(predictions)
-            
-            # Get current height
-            current_height = self._interpolate_current_height(predictions, current_time)
-            
-            # Generate SVG
-            svg_content = self._generate_svg_plot(
-                curve_points, 
-                extremes, 
-                current_time, 
-                current_height,
-                predictions
-            )
-            
-            # Convert SVG to PNG and save
-            return self._save_svg_as_png(svg_content)
+                return None
+
+            # Stamp each theme's colors onto the shared body
+            documents = {
+                theme: svg_document(
+                    self._width, self._height, _plot_style(theme, self._transparent_background), body
+                )
+                for theme in self._filenames
+            }
 
         except Exception as e:
             _LOGGER.error(f"Error generating tide plot: {e}")
-            return False
+            return None
 
-    def _extract_predictions(self, tide_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract prediction data from the processed tide data."""
-        predictions = []
-        
-        # Check if we have multi-day data
-        if "all_daily_data" in tide_data and tide_data["all_daily_data"] and self._plot_days > 1:
-            _LOGGER.debug("Processing multi-day data for %d days", self._plot_days)
-            
-            # Process each day's data
-            for day_data_info in tide_data["all_daily_data"]:
-                day_data = day_data_info["data"]
-                date_str = day_data_info["date"]
-                
-                # Parse date to get the day offset
-                day_date = datetime.datetime.strptime(date_str, "%Y%m%d")
-                # Convert to timezone-aware UTC first, then to local
-                day_date = dt_util.utc_from_timestamp(day_date.timestamp())
-                day_date = dt_util.as_local(day_date)
-                
-                # Extract predictions from this day
-                if day_data and "mareas" in day_data and "datos" in day_data["mareas"]:
-                    if "marea" in day_data["mareas"]["datos"]:
-                        marea_data = day_data["mareas"]["datos"]["marea"]
-                        
-                        for point in marea_data:
-                            if "hora" in point and "altura" in point:
-                                try:
-                                    time_str = point["hora"]  # Format is "HH:MM"
-                                    height = float(point["altura"])
-                                    
-                                    # Parse time and combine with the correct date
-                                    time_parts = time_str.split(":")
-                                    hours = int(time_parts[0])
-                                    minutes = int(time_parts[1])
-                                    
-                                    # Create datetime for this specific day
-                                    # API returns local times (lst_ldt), so combine with the day date
-                                    dt = day_date.replace(hour=hours, minute=minutes, second=0, microsecond=0)
-                                    # Make timezone-aware using Home Assistant's timezone
-                                    dt = dt_util.as_local(dt)
-                                    
-                                    predictions.append({
-                                        'time': dt,
-                                        'height': height
-                                    })
-                                except (ValueError, TypeError) as e:
-                                    _LOGGER.debug(f"Skipping invalid prediction entry: {e}")
-                                    continue
-            
-            # Sort by time to ensure chronological order
-            predictions.sort(key=lambda x: x['time'])
-            _LOGGER.debug("Extracted %d multi-day predictions", len(predictions))
-            
-        # Check if we have processed tide_points in the data (single day or fallback)
-        elif "tide_points" in tide_data and tide_data["tide_points"]:
-            predictions = tide_data["tide_points"]
-            _LOGGER.debug("Using %d processed tide points", len(predictions))
-        else:
-            # Fallback to original API structure parsing
-            _LOGGER.debug("Tide data structure: %s", tide_data.keys() if tide_data else "No data")
-            if "daily" in tide_data:
-                _LOGGER.debug("Daily data keys: %s", tide_data["daily"].keys())
-                if "mareas" in tide_data["daily"]:
-                    _LOGGER.debug("Mareas data keys: %s", tide_data["daily"]["mareas"].keys())
-            
-            # Navigate through the API response structure
-            if "daily" in tide_data and "mareas" in tide_data["daily"]:
-                mareas_data = tide_data["daily"]["mareas"]
-                
-                # Get prediction data
-                if "prediccion" in mareas_data:
-                    prediccion = mareas_data["prediccion"]
-                    _LOGGER.debug("Found %d prediction entries", len(prediccion))
-                    
-                    for entry in prediccion:
-                        try:
-                            # Parse datetime
-                            fecha_str = entry.get("fecha")
-                            hora_str = entry.get("hora")
-                            if fecha_str and hora_str:
-                                # Combine date and time
-                                datetime_str = f"{fecha_str} {hora_str}"
-                                dt = datetime.datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-                                # API returns local times (lst_ldt), make timezone-aware
-                                dt = dt_util.as_local(dt)
-                                
-                                # Get height
-                                height = float(entry.get("altura", 0))
-                                
-                                predictions.append({
-                                    'time': dt,
-                                    'height': height
-                                })
-                        except (ValueError, TypeError) as e:
-                            _LOGGER.debug(f"Skipping invalid prediction entry: {e}")
-                            continue
-                else:
-                    _LOGGER.debug("No 'prediccion' key found in mareas data")
-            else:
-                _LOGGER.debug("Missing required keys in tide data structure")
-        
-        _LOGGER.debug("Extracted %d valid predictions", len(predictions))
-        return predictions
+        if not self.export(documents, _prepared_timeline(tide_data), current_time):
+            return None
+        return documents
 
-    def _generate_smooth_curve(
+    def export(
         self,
-        predictions: List[Dict[str, Any]],
+        documents: Dict[str, bytes],
+        timeline: Optional[TideTimeline],
         current_time: datetime.datetime
-    ) -> List[Dict[str, Any]]:
-        """Generate smooth curve points (NOAA data is already at 6-min intervals, so just sort)."""
-        if len(predictions) < 2:
-            return predictions
+    ) -> bool:
+        """Write base documents to this plot's files with the now-marker baked in.
+
+        Files in www are served as they are, so unlike the base documents
+        kept in memory they carry the marker for ``current_time``. They are
+        only rewritten when a document changed or the marker moved by at
+        least a pixel. Does nothing when export is off; returns False if a
+        file could not be written.
+        """
+        if not self._export:
+            return True
 
-        # Sort predictions by time - NOAA provides 6-minute interval data
-        # which is already dense enough for smooth visualization
-        return sorted(predictions, key=lambda x: x['time'])
+        themes = [theme for theme in self._filenames if theme in documents]
+        exported = (
+            tuple(hash(documents[theme]) for theme in themes),
+            self.now_marker(timeline, current_time, precision=0),
+        )
+        if exported == self._exported:
+            return True
 
-    def _interpolate_current_height(
-        self, 
-        predictions: List[Dict[str, Any]], 
-        current_time: datetime.datetime
-    ) -> Optional[float]:
-        """Interpolate the current tide height."""
-        if len(predictions) < 2:
+        saved = all([
+            self._save_svg(self._filenames[theme], self.compose(documents[theme], timeline, current_time))
+            for theme in themes
+        ])
+        self._exported = exported if saved else None
+        return saved
+
+    def resolution_bucket(
+        self,
+        width: Optional[int] = None,
+        height: Optional[int] = None
+    ) -> Optional[Tuple[int, float]]:
+        """Return the bucket to serve a client asking for ``width`` x ``height``.
+
+        The smallest bucket covering the request is used, capped at the
+        largest. Returns None when the plot's own size should be served,
+        which is the file on disk.
+        """
+        if not width and not height:
             return None
 
-        # Find the two predictions that bracket the current time
-        for i in range(len(predictions) - 1):
-            if predictions[i]['time'] <= current_time <= predictions[i + 1]['time']:
-                # Linear interpolation
-                t1, h1 = predictions[i]['time'], predictions[i]['height']
-                t2, h2 = predictions[i + 1]['time'], predictions[i + 1]['height']
-                
-                # Calculate time ratios
-                total_seconds = (t2 - t1).total_seconds()
-                elapsed_seconds = (current_time - t1).total_seconds()
-                
-                if total_seconds == 0:
-                    return h1
-                
-                ratio = elapsed_seconds / total_seconds
-                interpolated_height = h1 + (h2 - h1) * ratio
-                
-                return interpolated_height
-
-        return None
-
-    def _find_extremes(self, predictions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Find high and low tide extremes from predictions with tipo field."""
-        extremes = []
-
-        for pred in predictions:
-            # Check if this point has a tipo field indicating high or low tide
-            if 'tipo' in pred:
-                extremes.append({
-                    'time': pred['time'],
-                    'height': pred['height'],
-                    'type': pred['tipo']  # 'pleamar' or 'bajamar'
-                })
-
-        _LOGGER.debug("Found %d tide extremes", len(extremes))
-        return extremes
+        # A height-only request implies the width at the plot's aspect ratio
+        wanted = max(width or 0, (height or 0) * self._width / self._height)
+        bucket = next(
+            (bucket for bucket in PLOT_RESOLUTION_BUCKETS if bucket[0] >= wanted),
+            PLOT_RESOLUTION_BUCKETS[-1],
+        )
+        return None if bucket[0] == self._width else bucket
+
+    def sized_image(
+        self,
+        tide_data: Dict[str, Any],
+        theme: str,
+        bucket: Tuple[int, float],
+        current_time: Optional[datetime.datetime] = None
+    ) -> Optional[bytes]:
+        """Return this plot rendered for a resolution bucket.
+
+        The body keeps the plot's layout and is scaled with viewBox, so the
+        now-marker overlay lines up unchanged. The curve budget follows the
+        bucket's pixel width and fonts its font scale. Renders are kept in
+        an LRU keyed by (theme, bucket, data fingerprint).
+        """
+        if current_time is None:
+            current_time = dt_util.now()
+
+        fingerprint = self.render_fingerprint(tide_data, current_time)
+        if fingerprint is None:
+            return None
+
+        key = (theme, bucket, fingerprint)
+        image = self._sized_cache.get(key)
+        if image is not None:
+            return image
+
+        bucket_width, font_scale = bucket
+        scale = bucket_width / self._width
+        body = self._plot_body(tide_data, current_time, pixel_scale=scale, font_scale=font_scale)
+        if body is None:
+            return None
+        image = svg_document(
+            bucket_width, round(self._height * scale),
+            _plot_style(theme, self._transparent_background, font_scale), body,
+            view_box=f"0 0 {self._width} {self._height}",
+        )
+
+        self._sized_cache.put(key, image)
+        _LOGGER.debug("Rendered %r at %dpx (%d bytes)", self, bucket_width, len(image))
+        return image
+
+    def raster_image(
+        self,
+        tide_data: Dict[str, Any],
+        theme: str,
+        bucket: Optional[Tuple[int, float]] = None,
+        current_time: Optional[datetime.datetime] = None
+    ) -> Optional[bytes]:
+        """Return this plot as PNG for a resolution bucket (native size if None).
+
+        The now-marker is drawn in, snapped to whole layout pixels, and is
+        part of the cache key along with the data fingerprint, so a raster
+        is redrawn only when the marker visibly moves. Animated plots get
+        the static marker too; a PNG cannot move it.
+        """
+        if current_time is None:
+            current_time = dt_util.now()
+
+        bucket = bucket or (self._width, 1.0)
+        fingerprint = self.render_fingerprint(tide_data, current_time)
+        if fingerprint is None:
+            return None
+
+        marker = self.now_marker(_prepared_timeline(tide_data), current_time, precision=0)
+        key = (theme, bucket, fingerprint, marker)
+        image = self._raster_cache.get(key)
+        if image is not None:
+            return image
+
+        document = self.sized_image(tide_data, theme, bucket, current_time)
+        if document is None:
+            return None
+
+        image = svg_to_png(splice_overlay(document, marker))
+        self._raster_cache.put(key, image)
+        _LOGGER.debug("Rasterized %r at %dpx (%d bytes)", self, bucket[0], len(image))
+        return image
+
+    def _plot_body(
+        self,
+        tide_data: Dict[str, Any],
+        current_time: datetime.datetime,
+        pixel_scale: float = 1.0,
+        font_scale: float = 1.0
+    ) -> Optional[str]:
+        """Return the theme-agnostic body for ``tide_data``, or None without data.
+
+        This plot's days are a zero-copy slice of the shared timeline.
+        """
+        timeline = _prepared_timeline(tide_data)
+        if timeline is None:
+            return None
+        view = timeline.day_window(self._plot_days)
+        if not len(view):
+            return None
+
+        return self._generate_svg_plot(
+            view.times,
+            view.heights,
+            view.extremes,
+            self.plot_geometry(view),
+            current_time,
+            tide_data.get("location"),
+            pixel_scale=pixel_scale,
+            font_scale=font_scale
+        )
+
+    def plot_geometry(self, view: TimelineView) -> PlotGeometry:
+        """Return the pixel mapping for the days covered by ``view``."""
+        width, height = self._width, self._height
+        margin = PLOT_MARGIN
+        plot_width = width - 2 * margin
+        plot_height = height - 2 * margin
+
+        # Times are sorted, so the range is the first and last point
+        times, heights = view.times, view.heights
+        min_ts, max_ts = times[0], times[-1]
+        # Extremes are spliced into the curve, so they bound the height range too
+        extreme_heights = [extreme['height'] for extreme in view.extremes]
+        min_height = min(min(heights), *extreme_heights) if extreme_heights else min(heights)
+        max_height = max(max(heights), *extreme_heights) if extreme_heights else max(heights)
+
+        # Add some padding to height range
+        height_range = max_height - min_height
+        min_height -= height_range * 0.1
+        max_height += height_range * 0.1
+
+        return PlotGeometry(
+            min_ts, max_ts,
+            margin, plot_width / ((max_ts - min_ts) or 1.0),
+            min_height, height - margin, plot_height / ((max_height - min_height) or 1.0),
+        )
+
+    def _served_geometry(self, timeline: TideTimeline) -> Optional[PlotGeometry]:
+        """Return the geometry of the base plot for ``timeline``, cached per fingerprint."""
+        cached = self._geometry_cache
+        if cached is None or cached[0] != timeline.fingerprint:
+            view = timeline.day_window(self._plot_days)
+            cached = (timeline.fingerprint, self.plot_geometry(view) if len(view) else None)
+            self._geometry_cache = cached
+        return cached[1]
+
+    def now_marker(
+        self,
+        timeline: Optional[TideTimeline],
+        current_time: datetime.datetime,
+        precision: Optional[int] = None
+    ) -> str:
+        """Return the now-marker overlay for this plot's base image.
+
+        The geometry is derived once per timeline and cached, so serving
+        the marker costs one bisect lookup. Coordinates use ``precision``
+        decimals, the plot's own by default. Returns an empty string when
+        now falls outside the plotted days.
+        """
+        if timeline is None:
+            return ""
+
+        geometry = self._served_geometry(timeline)
+        now_ts = current_time.timestamp()
+        if geometry is None or not geometry.contains(now_ts):
+            return ""
+
+        current_height = timeline.height_at(current_time)
+        if current_height is None:
+            return ""
+
+        svg = SvgWriter(precision=self._precision if precision is None else precision)
+        svg.element('circle', {
+            'class': 'now', 'cx': geometry.x(now_ts), 'cy': geometry.y(current_height), 'r': 4,
+        })
+        return svg.getvalue()
+
+    def compose(
+        self,
+        image: bytes,
+        timeline: Optional[TideTimeline],
+        current_time: datetime.datetime
+    ) -> bytes:
+        """Bring a served base image up to ``current_time``.
+
+        Animated plots only need their marker's start offset rewritten
+        for the client's clock; otherwise the now-marker is spliced in.
+        """
+        if not self._animate_now_marker:
+            return splice_overlay(image, self.now_marker(timeline, current_time))
+
+        geometry = self._served_geometry(timeline) if timeline is not None else None
+        if geometry is None:
+            return image
+        begin = geometry.min_ts - current_time.timestamp()
+        return _MARKER_BEGIN.sub(b' begin="%.1fs"' % begin, image)
+
+    def _write_animated_marker(
+        self,
+        svg: SvgWriter,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        times: Sequence[float],
+        geometry: PlotGeometry,
+        current_time: datetime.datetime
+    ) -> None:
+        """Write a now-marker that travels along the curve in real time.
+
+        The dot follows the downsampled curve vertices with SMIL
+        animateMotion; keyTimes place each vertex at its wall-clock offset
+        and ``dur`` spans the plotted range, so one second of animation is
+        one second of tide. ``begin`` is negative by the time already
+        elapsed since the start of the plot when the document was produced
+        (see compose()). The dot is only visible while the animation runs.
+        """
+        span = (geometry.max_ts - geometry.min_ts) or 1.0
+        begin = f"{geometry.min_ts - current_time.timestamp():.1f}s"
+        duration = f"{span:.1f}s"
+
+        svg.open('circle', {'class': 'now', 'r': 4, 'visibility': 'hidden'})
+        svg.element('animateMotion', {
+            'dur': duration, 'begin': begin, 'calcMode': 'linear',
+            'keyTimes': ";".join(f"{(t - geometry.min_ts) / span:.6f}" for t in times),
+            'values': ";".join(
+                f"{format_number(x, svg.precision)},{format_number(y, svg.precision)}"
+                for x, y in zip(xs, ys)
+            ),
+        })
+        svg.element('set', {
+            'attributeName': 'visibility', 'to': 'visible',
+            'dur': duration, 'begin': begin,
+        })
+        svg.close('circle')
 
     def _generate_daylight_backgrounds(
         self,
+        svg: SvgWriter,
         min_time: datetime.datetime,
         max_time: datetime.datetime,
         margin: int,
@@ -498,13 +1444,18 @@ class TidePlotManager:
         plot_width: int,
         plot_height: int,
         time_to_x,
-        colors: Dict[str, str]
-    ) -> List[str]:
-        """Generate daylight gradient backgrounds, sunrise/sunset markers, and day labels."""
-        elements = []
-
-        # Approximate sunrise and sunset times (6 AM to 6 PM for simplicity)
-        # In a production version, you'd use a library like astral for accurate times
+        location: Optional[Tuple[float, float]] = None,
+        font_scale: float = 1.0
+    ) -> Tuple[List[LabelLine], List[LabelLine]]:
+        """Write daylight gradient backgrounds and sunrise/sunset markers.
+
+        Sunrise and sunset come from the solar ephemeris for the station's
+        ``location``; without one they fall back to 6 AM and 6 PM. Returns
+        the day labels and sunrise/sunset labels, which are placed after
+        the tide labels (see _LabelLayout).
+        """
+        day_labels: List[LabelLine] = []
+        sun_labels: List[LabelLine] = []
         current_day = min_time.date()
         days_in_range = (max_time.date() - min_time.date()).days + 1
 
@@ -516,12 +1467,25 @@ class TidePlotManager:
             # Single letter initials for 3+ day charts
             day_format = "%a"  # Mon, Tue, etc. - we'll take first letter
 
-        for day_offset in range(days_in_range):
+        # Every day's sun times in one memoized, vectorized lookup
+        if location is not None:
+            sun_days = sun_times_range(location[0], location[1], current_day, days_in_range)
+        else:
+            sun_days = [None] * days_in_range
+
+        for day_offset, sun_day in enumerate(sun_days):
             day = current_day + datetime.timedelta(days=day_offset)
 
-            # Approximate sunrise at 6 AM and sunset at 6 PM local time
-            sunrise = dt_util.as_local(datetime.datetime.combine(day, datetime.time(6, 0)))
-            sunset = dt_util.as_local(datetime.datetime.combine(day, datetime.time(18, 0)))
+            if sun_day is None:
+                # No station location: approximate 6 AM to 6 PM local time
+                sunrise = datetime.datetime.combine(day, datetime.time(6, 0), tzinfo=min_time.tzinfo)
+                sunset = datetime.datetime.combine(day, datetime.time(18, 0), tzinfo=min_time.tzinfo)
+            elif sun_day[0] is None:
+                # Polar day or night: no sunrise to mark
+                continue
+            else:
+                sunrise = dt_util.as_local(dt_util.utc_from_timestamp(sun_day[0]))
+                sunset = dt_util.as_local(dt_util.utc_from_timestamp(sun_day[1]))
 
             # Only draw if sunrise/sunset fall within plot range
             if sunrise >= min_time and sunrise <= max_time:
@@ -532,12 +1496,11 @@ class TidePlotManager:
                     sunset_x = time_to_x(sunset)
                     gradient_width = sunset_x - sunrise_x
 
-                    # Subtle gradient background for daylight hours
-                    opacity = 0.1 if not self._dark_mode else 0.05
-                    elements.append(f'''
-                        <rect x="{sunrise_x}" y="{margin}" width="{gradient_width}" height="{plot_height}"
-                              fill="{colors["daylight"]}" opacity="{opacity}"/>
-                    ''')
+                    # Subtle gradient background for daylight hours (opacity set by theme)
+                    svg.element('rect', {
+                        'class': 'day', 'x': sunrise_x, 'y': margin,
+                        'width': gradient_width, 'height': plot_height,
+                    })
 
                     # Add day label centered in daylight section
                     center_x = sunrise_x + (gradient_width / 2)
@@ -545,329 +1508,379 @@ class TidePlotManager:
                     if self._plot_days > 2:
                         day_label = day_label[0]  # Just first letter (M, T, W, etc.)
 
-                    elements.append(f'''
-                        <text x="{center_x}" y="{height - margin + 30}" text-anchor="middle"
-                              font-family="'Courier New', 'Courier', monospace" font-size="12" font-weight="bold" fill="{colors["text"]}">
-                            {day_label}
-                        </text>
-                    ''')
+                    day_labels.append((
+                        'txt dl', 'day', center_x,
+                        height - margin + 18 + PLOT_FONT_SIZES['day'] * font_scale, day_label,
+                    ))
 
                     # Add sunrise/sunset lines only for charts 3 days or fewer
                     if self._plot_days <= 3:
-                        # Sunrise line
-                        elements.append(f'''
-                            <line x1="{sunrise_x}" y1="{margin}" x2="{sunrise_x}" y2="{height - margin}"
-                                  stroke="{colors["sunrise_line"]}" stroke-width="1.5" stroke-dasharray="3,3" opacity="0.5"/>
-                        ''')
-
-                        # Sunrise time label
-                        sunrise_label = sunrise.strftime("%I:%M%p").lstrip('0')
-                        elements.append(f'''
-                            <text x="{sunrise_x + 5}" y="{margin + 15}" text-anchor="start"
-                                  font-family="'Courier New', 'Courier', monospace" font-size="9" fill="{colors["sunrise_line"]}">
-                                ↑{sunrise_label}
-                            </text>
-                        ''')
-
-                        # Sunset line
-                        elements.append(f'''
-                            <line x1="{sunset_x}" y1="{margin}" x2="{sunset_x}" y2="{height - margin}"
-                                  stroke="{colors["sunrise_line"]}" stroke-width="1.5" stroke-dasharray="3,3" opacity="0.5"/>
-                        ''')
-
-                        # Sunset time label
-                        sunset_label = sunset.strftime("%I:%M%p").lstrip('0')
-                        elements.append(f'''
-                            <text x="{sunset_x - 5}" y="{margin + 15}" text-anchor="end"
-                                  font-family="'Courier New', 'Courier', monospace" font-size="9" fill="{colors["sunrise_line"]}">
-                                ↓{sunset_label}
-                            </text>
-                        ''')
-
-        return elements
-
-    def _decimate_curve_points(self, curve_points: List[Dict[str, Any]], max_points: int = 300) -> List[Dict[str, Any]]:
-        """Reduce the number of curve points for smoother rendering while preserving shape."""
-        if len(curve_points) <= max_points:
-            return curve_points
-
-        # Use simple decimation - take every Nth point
-        step = len(curve_points) // max_points
-        decimated = [curve_points[i] for i in range(0, len(curve_points), step)]
-
-        # Always include the last point
-        if decimated[-1] != curve_points[-1]:
-            decimated.append(curve_points[-1])
-
-        return decimated
+                        for line_x, label_x, anchor, arrow, moment in (
+                            (sunrise_x, sunrise_x + 5, 'sr', '↑', sunrise),
+                            (sunset_x, sunset_x - 5, 'ss', '↓', sunset),
+                        ):
+                            svg.element('use', {'href': '#sl', 'x': line_x})
+                            sun_labels.append((
+                                f'suntxt {anchor}', 'text', label_x, margin + 15,
+                                arrow + moment.strftime("%I:%M%p").lstrip('0'),
+                            ))
+
+        return day_labels, sun_labels
 
     def _generate_svg_plot(
         self,
-        curve_points: List[Dict[str, Any]],
+        times: Sequence[float],
+        heights: Sequence[float],
         extremes: List[Dict[str, Any]],
+        geometry: PlotGeometry,
         current_time: datetime.datetime,
-        current_height: Optional[float],
-        original_predictions: List[Dict[str, Any]]
+        location: Optional[Tuple[float, float]] = None,
+        pixel_scale: float = 1.0,
+        font_scale: float = 1.0
     ) -> str:
-        """Generate SVG content for the tide plot."""
+        """Generate the theme-agnostic SVG body for the tide plot.
+
+        ``times`` are POSIX timestamps and ``heights`` the matching heights;
+        ``location`` places the daylight bands. ``pixel_scale`` is the ratio
+        of served pixels to layout units and sizes the curve's point
+        budget; ``font_scale`` spaces the labels for the bucket's fonts
+        (see _plot_base_css()). Elements carry classes instead of colors; see _plot_style().
+        The background and title come from the cached chrome layers.
+        """
 
         # SVG dimensions
-        width, height = 800, 400
-        margin = 60
+        width, height = self._width, self._height
+        margin = PLOT_MARGIN
         plot_width = width - 2 * margin
         plot_height = height - 2 * margin
 
-        # Get time and height ranges
-        if not curve_points:
-            return self._generate_error_svg()
+        min_time = dt_util.as_local(dt_util.utc_from_timestamp(geometry.min_ts))
+        max_time = dt_util.as_local(dt_util.utc_from_timestamp(geometry.max_ts))
 
-        times = [p['time'] for p in curve_points]
-        heights = [p['height'] for p in curve_points]
+        def time_to_x(time_val):
+            """Map a timestamp (or datetime) to an x coordinate."""
+            if isinstance(time_val, datetime.datetime):
+                time_val = time_val.timestamp()
+            return geometry.x(time_val)
+
+        # Start from the cached background layer
+        chrome_under, chrome_over = _plot_chrome(
+            width, height, self._plot_days, self._name, font_scale
+        )
+        svg = SvgWriter(precision=self._precision)
+        svg.raw(chrome_under)
 
-        min_time, max_time = min(times), max(times)
-        min_height, max_height = min(heights), max(heights)
+        # Add daylight gradient backgrounds
+        day_labels, sun_labels = self._generate_daylight_backgrounds(
+            svg, min_time, max_time, margin, height, plot_width, plot_height,
+            time_to_x, location, font_scale
+        )
+
+        # Downsample to the pixel budget, keeping the extremes the labels point at
+        decimated_times, decimated_heights = downsample_curve(
+            times, heights, plot_width * pixel_scale,
+            anchors=[(extreme['time'].timestamp(), extreme['height']) for extreme in extremes],
+        )
+
+        # Map the whole curve to pixels and build the spline path in bulk
+        xs, ys = geometry.pixels(decimated_times, decimated_heights)
+        path_data = smooth_path(xs, ys, self._precision)
+
+        if path_data:
+            # Single clean tide line with anti-aliasing
+            svg.element('path', {
+                'class': 'curve', 'd': path_data,
+            })
+
+        # Labels go on by priority: high/low tides (no dots, just labels at
+        # the curve points), then day names, then sunrise/sunset times. A
+        # label that would overlap an earlier one is moved or left out.
+        layout = _plot_label_layout(width, font_scale)
+        line_height = (PLOT_FONT_SIZES['text'] + 3) * font_scale
+        for extreme in extremes:
+            ext_x = time_to_x(extreme['time'])
+            ext_y = geometry.y(extreme['height'])
+            is_high = extreme['type'] == 'pleamar'
 
-        # Add some padding to height range
-        height_range = max_height - min_height
-        min_height -= height_range * 0.1
-        max_height += height_range * 0.1
+            # Position labels above for high tides, below for low tides,
+            # one line of the (scaled) label font apart
+            if is_high:
+                time_y = ext_y - 6
+                height_y = time_y - line_height
+            else:
+                height_y = ext_y + 8 + PLOT_FONT_SIZES['label'] * font_scale
+                time_y = height_y + line_height
 
-        # Clean minimal color scheme
-        if self._dark_mode:
-            colors = {
-                'background': '#000000' if not self._transparent_background else 'none',
-                'tide_line': '#FFFFFF',
-                'text': '#FFFFFF',
-                'title': '#FFFFFF',
-                'high_tide': '#FF6B6B',  # Soft red for high tides
-                'low_tide': '#4DABF7',   # Soft blue for low tides
-                'daylight': '#FFFFFF',   # White for daylight gradient
-                'sunrise_line': '#FFA500',  # Orange for sunrise/sunset
-            }
-        else:
-            colors = {
-                'background': '#FFFFFF' if not self._transparent_background else 'none',
-                'tide_line': '#000000',
-                'text': '#000000',
-                'title': '#000000',
-                'high_tide': '#DC143C',  # Crimson for high tides
-                'low_tide': '#1E90FF',   # Dodger blue for low tides
-                'daylight': '#FFE5B4',   # Peach for daylight gradient
-                'sunrise_line': '#FF8C00',  # Dark orange for sunrise/sunset
-            }
+            # Bold, colored height; then the time, AM/PM without a leading
+            # zero, which is dropped first when space runs out
+            height_line = ('hi' if is_high else 'lo', 'label', ext_x, height_y, f"{extreme['height']:.1f}m")
+            time_line = ('txt', 'text', ext_x, time_y, extreme['time'].strftime("%I:%M%p").lstrip('0'))
+            # Without room for both, the height alone sits next to the point
+            nearest_y = time_y if is_high else height_y
+            layout.place(svg, [height_line, time_line], [(*height_line[:3], nearest_y, height_line[4])])
 
-        # Helper functions for coordinate conversion
-        def time_to_x(time_val):
-            time_ratio = (time_val - min_time).total_seconds() / (max_time - min_time).total_seconds()
-            return margin + time_ratio * plot_width
+        for day_label in day_labels:
+            layout.place(svg, [day_label])
 
-        def height_to_y(height_val):
-            height_ratio = (height_val - min_height) / (max_height - min_height)
-            return height - margin - height_ratio * plot_height
+        # Sunrise/sunset times stack one line lower when the top row is taken
+        for sun_label in sun_labels:
+            css_class, role, x, y, text = sun_label
+            layout.place(svg, [sun_label], [(css_class, role, x, y + line_height, text)])
 
-        # Start building SVG
-        svg_parts = [
-            f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">',
-            f'<rect width="{width}" height="{height}" fill="{colors["background"]}"/>',
-        ]
+        # Self-animating now-marker, when enabled
+        if self._animate_now_marker and decimated_times:
+            self._write_animated_marker(svg, xs, ys, decimated_times, geometry, current_time)
 
-        # Add daylight gradient backgrounds
-        svg_parts.extend(self._generate_daylight_backgrounds(
-            min_time, max_time, margin, height, plot_width, plot_height,
-            time_to_x, colors
-        ))
-
-        # Decimate curve points to prevent rendering artifacts
-        decimated_points = self._decimate_curve_points(curve_points, max_points=300)
-
-        # Generate tide curve path - clean single line
-        path_points = []
-        for point in decimated_points:
-            x = time_to_x(point['time'])
-            y = height_to_y(point['height'])
-            path_points.append((x, y))
-
-        if path_points:
-            # Use Catmull-Rom spline for smooth, natural tide curves
-            if len(path_points) >= 4:
-                path_data = f"M {path_points[0][0]},{path_points[0][1]}"
-
-                # For Catmull-Rom, we need at least 4 points (P0, P1, P2, P3)
-                # The curve is drawn between P1 and P2
-                for i in range(len(path_points) - 1):
-                    # Get surrounding points (with boundary handling)
-                    p0 = path_points[max(0, i - 1)]
-                    p1 = path_points[i]
-                    p2 = path_points[i + 1]
-                    p3 = path_points[min(len(path_points) - 1, i + 2)]
-
-                    # Calculate control points for cubic bezier
-                    # This creates a smooth Catmull-Rom-style curve
-                    cp1_x = p1[0] + (p2[0] - p0[0]) / 6
-                    cp1_y = p1[1] + (p2[1] - p0[1]) / 6
-                    cp2_x = p2[0] - (p3[0] - p1[0]) / 6
-                    cp2_y = p2[1] - (p3[1] - p1[1]) / 6
-
-                    path_data += f" C {cp1_x},{cp1_y} {cp2_x},{cp2_y} {p2[0]},{p2[1]}"
-            else:
-                # Fall back to simple line for few points
-                path_data = f"M {path_points[0][0]},{path_points[0][1]}"
-                for i in range(1, len(path_points)):
-                    path_data += f" L {path_points[i][0]},{path_points[i][1]}"
+        # Cached title layer on top
+        svg.raw(chrome_over)
 
-            # Single clean tide line with anti-aliasing
-            svg_parts.append(f'<path d="{path_data}" stroke="{colors["tide_line"]}" stroke-width="2" fill="none" stroke-linecap="round" stroke-linejoin="round" shape-rendering="geometricPrecision"/>')
+        return svg.getvalue()
 
-        # Add high/low tide labels (no dots, just labels at the curve points)
-        for extreme in extremes:
-            ext_x = time_to_x(extreme['time'])
-            ext_y = height_to_y(extreme['height'])
-            is_high = extreme['type'] == 'pleamar'
 
-            marker_color = colors['high_tide'] if is_high else colors['low_tide']
+class TideEnvelopePlotManager(TidePlotManager):
+    """Long-horizon plot drawn as a min/max envelope band.
+
+    Weeks of tides are too dense to draw as a curve, so the series is read
+    from the station's TideEnvelope at one bin per pixel column and drawn
+    as a filled band with markers at its peaks. Serving, theming and
+    resolution buckets are the same as for TidePlotManager; the serve-time
+    marker is a vertical now-line.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        filenames: Dict[str, str],
+        plot_days: int,
+        width: int = PLOT_WIDTH,
+        height: int = PLOT_HEIGHT,
+        precision: int = DEFAULT_PRECISION,
+        precompress: bool = False,
+        artifact_id: Optional[ArtifactId] = None,
+        export: bool = True,
+    ):
+        """Initialize the plot manager for ``plot_days`` days from today."""
+        super().__init__(
+            name, filenames, plot_days=plot_days, width=width, height=height,
+            precision=precision, precompress=precompress,
+            artifact_id=artifact_id, export=export,
+        )
+
+    def __repr__(self) -> str:
+        """Return a short description for logs."""
+        return f"<TideEnvelopePlotManager {self._name} {self._plot_days}d>"
+
+    def render_fingerprint(
+        self,
+        tide_data: Dict[str, Any],
+        current_time: datetime.datetime
+    ) -> Optional[str]:
+        """Fingerprint the envelope, the first plotted day and the layout."""
+        timeline = _prepared_timeline(tide_data)
+        envelope = tide_data.get("envelope")
+        if timeline is None or not timeline.days or envelope is None or not len(envelope):
+            return None
+
+        return _fingerprint(
+            "envelope",
+            envelope.fingerprint,
+            timeline.days[0],
+            self._plot_days,
+            tuple(sorted(self._filenames)),
+            self._precision,
+            self._precompress,
+            self._width,
+            self._height,
+            self._name,
+        )
+
+    def _plot_range(self, timeline: TideTimeline) -> Tuple[float, float]:
+        """Return the plotted (start, end) timestamps: whole days from the first fetched one."""
+        first_day = datetime.datetime.strptime(timeline.days[0], "%Y%m%d").date()
+        start = datetime.datetime.combine(first_day, datetime.time(), tzinfo=timeline.tz)
+        end = datetime.datetime.combine(
+            first_day + datetime.timedelta(days=self._plot_days), datetime.time(), tzinfo=timeline.tz
+        )
+        return start.timestamp(), end.timestamp()
+
+    def _plot_body(
+        self,
+        tide_data: Dict[str, Any],
+        current_time: datetime.datetime,
+        pixel_scale: float = 1.0,
+        font_scale: float = 1.0
+    ) -> Optional[str]:
+        """Return the theme-agnostic envelope body, or None without data.
+
+        At most one envelope bin per served pixel column is read, so the
+        cost follows the bucket width rather than the number of days.
+        """
+        timeline = _prepared_timeline(tide_data)
+        envelope = tide_data.get("envelope")
+        if timeline is None or not timeline.days or envelope is None:
+            return None
 
-            # No circle marker - just labels
+        start_ts, end_ts = self._plot_range(timeline)
+        plot_width = self._width - 2 * PLOT_MARGIN
+        times, mins, maxs = envelope.columns(start_ts, end_ts, plot_width * pixel_scale)
+        if not times:
+            return None
 
-            # Add label with time (AM/PM) and height on separate lines
-            time_str = extreme['time'].strftime("%I:%M%p").lstrip('0')  # Remove leading zero, add AM/PM
-            height_str = f"{extreme['height']:.1f}m"
+        geometry = self.envelope_geometry(start_ts, end_ts, min(mins), max(maxs))
+        return self._generate_svg_envelope(times, mins, maxs, geometry, timeline.tz, font_scale)
 
-            # Position labels above for high tides, below for low tides
-            if is_high:
-                height_y = ext_y - 18
-                time_y = ext_y - 6
-            else:
-                height_y = ext_y + 18
-                time_y = ext_y + 30
-
-            # Height label (bold, colored)
-            svg_parts.append(f'''
-                <text x="{ext_x}" y="{height_y}" text-anchor="middle" font-family="'Courier New', 'Courier', monospace" font-size="10" font-weight="bold" fill="{marker_color}">
-                    {height_str}
-                </text>
-            ''')
-
-            # Time label (below height)
-            svg_parts.append(f'''
-                <text x="{ext_x}" y="{time_y}" text-anchor="middle" font-family="'Courier New', 'Courier', monospace" font-size="9" fill="{colors["text"]}">
-                    {time_str}
-                </text>
-            ''')
-
-        # Add current position marker (dot only, no label)
-        if current_height is not None:
-            curr_x = time_to_x(current_time)
-            curr_y = height_to_y(current_height)
-
-            # Just show the dot - no label
-            svg_parts.append(f'<circle cx="{curr_x}" cy="{curr_y}" r="4" fill="{colors["tide_line"]}"/>')
-
-        # Add title with Courier font
-        if self._plot_days == 1:
-            title_text = f"TIDE PREDICTION - {self._name.upper()}"
-        else:
-            title_text = f"TIDE PREDICTION ({self._plot_days}D) - {self._name.upper()}"
-
-        svg_parts.append(f'''
-            <text x="{width/2}" y="25" text-anchor="middle" font-family="'Courier New', 'Courier', monospace" font-size="14" fill="{colors["title"]}">
-                {title_text}
-            </text>
-        ''')
-
-        svg_parts.append('</svg>')
-
-        return '\n'.join(svg_parts)
-
-    def _generate_grid(self, margin, plot_width, plot_height, width, height, grid_color="lightgray"):
-        """Generate grid lines for the plot."""
-        grid_parts = []
-        
-        # Vertical grid lines (time)
-        for i in range(5):
-            x = margin + (i * plot_width / 4)
-            grid_parts.append(f'<line x1="{x}" y1="{margin}" x2="{x}" y2="{height - margin}" stroke="{grid_color}" stroke-width="0.5"/>')
-        
-        # Horizontal grid lines (height)
-        for i in range(5):
-            y = margin + (i * plot_height / 4)
-            grid_parts.append(f'<line x1="{margin}" y1="{y}" x2="{width - margin}" y2="{y}" stroke="{grid_color}" stroke-width="0.5"/>')
-        
-        return grid_parts
-
-    def _generate_axes_labels(self, margin, plot_width, plot_height, width, height,
-                            min_time, max_time, min_height, max_height, text_color="black"):
-        """Generate axes labels with Courier font."""
-        labels = []
-
-        # X-axis (time) labels
-        for i in range(5):
-            x = margin + (i * plot_width / 4)
-            time_ratio = i / 4
-            label_time = min_time + (max_time - min_time) * time_ratio
-            time_label = label_time.strftime("%H:%M")
-
-            labels.append(f'<text x="{x}" y="{height - margin + 15}" text-anchor="middle" font-family="\'Courier New\', \'Courier\', monospace" font-size="10" fill="{text_color}">{time_label}</text>')
-
-        # Y-axis (height) labels
-        for i in range(5):
-            y = height - margin - (i * plot_height / 4)
-            height_ratio = i / 4
-            label_height = min_height + (max_height - min_height) * height_ratio
-            height_label = f"{label_height:.1f}m"
-
-            labels.append(f'<text x="{margin - 10}" y="{y + 3}" text-anchor="end" font-family="\'Courier New\', \'Courier\', monospace" font-size="10" fill="{text_color}">{height_label}</text>')
-
-        # Axis labels
-        labels.append(f'<text x="{width/2}" y="{height - 10}" text-anchor="middle" font-family="\'Courier New\', \'Courier\', monospace" font-size="10" fill="{text_color}">TIME</text>')
-        labels.append(f'''
-            <text x="15" y="{height/2}" text-anchor="middle" font-family="'Courier New', 'Courier', monospace" font-size="10" fill="{text_color}"
-                  transform="rotate(-90, 15, {height/2})">TIDE HEIGHT (M)</text>
-        ''')
+    def envelope_geometry(
+        self,
+        start_ts: float,
+        end_ts: float,
+        min_height: float,
+        max_height: float
+    ) -> PlotGeometry:
+        """Return the pixel mapping for the plotted range and envelope extent."""
+        margin = PLOT_MARGIN
+        plot_width = self._width - 2 * margin
+        plot_height = self._height - 2 * margin
+
+        # Same padding as the curve plots
+        height_range = max_height - min_height
+        min_height -= height_range * 0.1
+        max_height += height_range * 0.1
+
+        return PlotGeometry(
+            start_ts, end_ts,
+            margin, plot_width / ((end_ts - start_ts) or 1.0),
+            min_height, self._height - margin, plot_height / ((max_height - min_height) or 1.0),
+        )
 
+    def now_marker(
+        self,
+        timeline: Optional[TideTimeline],
+        current_time: datetime.datetime,
+        precision: Optional[int] = None
+    ) -> str:
+        """Return a vertical now-line for this plot's base image.
+
+        Only the time axis is needed, which depends on the plotted days
+        alone. Returns an empty string when now falls outside them.
+        """
+        if timeline is None or not timeline.days:
+            return ""
+
+        start_ts, end_ts = self._plot_range(timeline)
+        now_ts = current_time.timestamp()
+        if not start_ts <= now_ts <= end_ts:
+            return ""
+
+        x = PLOT_MARGIN + (now_ts - start_ts) * (self._width - 2 * PLOT_MARGIN) / (end_ts - start_ts)
+        svg = SvgWriter(precision=self._precision if precision is None else precision)
+        svg.element('line', {
+            'class': 'nowline', 'x1': x, 'y1': PLOT_MARGIN, 'x2': x, 'y2': self._height - PLOT_MARGIN,
+        })
+        return svg.getvalue()
+
+    def _generate_date_ticks(
+        self,
+        svg: SvgWriter,
+        geometry: PlotGeometry,
+        tz: datetime.tzinfo,
+        font_scale: float = 1.0
+    ) -> List[LabelLine]:
+        """Write date gridlines spaced at least DATE_TICK_SPACING apart; return their labels."""
+        margin, height = PLOT_MARGIN, self._height
+        day_width = DAY_SECONDS * geometry.x_scale
+        step = next(
+            (step for step in DATE_TICK_STEPS if step * day_width >= DATE_TICK_SPACING * font_scale),
+            DATE_TICK_STEPS[-1],
+        )
+
+        labels: List[LabelLine] = []
+        first_day = datetime.datetime.fromtimestamp(geometry.min_ts, tz).date()
+        for offset in range(0, self._plot_days, step):
+            day = first_day + datetime.timedelta(days=offset)
+            x = geometry.x(datetime.datetime.combine(day, datetime.time(), tzinfo=tz).timestamp())
+            svg.element('line', {
+                'class': 'grid', 'x1': x, 'y1': margin, 'x2': x, 'y2': height - margin,
+            })
+            labels.append((
+                'txt dl', 'day', x, height - margin + 18 + PLOT_FONT_SIZES['day'] * font_scale,
+                f"{day:%b} {day.day}",
+            ))
         return labels
 
-    def _generate_error_svg(self) -> str:
-        """Generate an error SVG when no data is available."""
-        bg_color = '#1e1e1e' if self._dark_mode and not self._transparent_background else ('none' if self._transparent_background else 'white')
-        text_color = '#FF5722' if self._dark_mode else 'red'  # Orange for dark mode, red for light
-        
-        return f'''
-        <svg width="800" height="400" xmlns="http://www.w3.org/2000/svg">
-            <rect width="800" height="400" fill="{bg_color}"/>
-            <text x="400" y="200" text-anchor="middle" font-family="Arial" font-size="18" fill="{text_color}">
-                Could not load tide data
-            </text>
-        </svg>
-        '''
-
-    def _save_svg_as_png(self, svg_content: str) -> bool:
-        """Save SVG content as PNG file."""
-        try:
-            # For now, save as SVG and let browsers handle it
-            # This is compatible with Home Assistant camera entities
-            with open(self._filename.replace('.png', '.svg'), 'w', encoding='utf-8') as f:
-                f.write(svg_content)
-            
-            # Also create a simple PNG placeholder that references the SVG
-            # We'll create a basic PNG with the SVG embedded as base64
-            svg_base64 = base64.b64encode(svg_content.encode('utf-8')).decode('ascii')
-            
-            # Create a simple HTML that can be served as image
-            html_content = f'''
-            <html>
-            <body style="margin:0;padding:0;">
-                <img src="data:image/svg+xml;base64,{svg_base64}" style="width:800px;height:400px;"/>
-            </body>
-            </html>
-            '''
-            
-            # Save as both SVG and a data URI for flexibility
-            with open(self._filename, 'w', encoding='utf-8') as f:
-                f.write(svg_content)
-            
-            _LOGGER.info(f"Tide plot saved successfully: {self._filename}")
-            return True
-            
-        except Exception as e:
-            _LOGGER.error(f"Error saving tide plot: {e}")
-            return False
+    def _generate_svg_envelope(
+        self,
+        times: Sequence[float],
+        mins: Sequence[float],
+        maxs: Sequence[float],
+        geometry: PlotGeometry,
+        tz: datetime.tzinfo,
+        font_scale: float = 1.0
+    ) -> str:
+        """Generate the theme-agnostic SVG body for an envelope plot.
+
+        The band spans each column's min to max. Columns are grouped every
+        ENVELOPE_MARKER_SPACING units and a group's highest (lowest) column
+        is marked when it tops both neighbouring groups, which picks out
+        the spring tides. The extremes of the whole range are labelled.
+        """
+        chrome_under, chrome_over = _plot_chrome(
+            self._width, self._height, self._plot_days, self._name, font_scale
+        )
+        svg = SvgWriter(precision=self._precision)
+        svg.raw(chrome_under)
+
+        date_labels = self._generate_date_ticks(svg, geometry, tz, font_scale)
+
+        xs, upper = geometry.pixels(times, maxs)
+        _, lower = geometry.pixels(times, mins)
+        svg.element('path', {
+            'class': 'band', 'd': band_path(xs, upper, lower, self._precision),
+        })
+
+        # Highest and lowest column of each fixed-width group
+        groups: Dict[int, List[int]] = {}
+        for idx, x in enumerate(xs):
+            group = groups.setdefault(int((x - PLOT_MARGIN) // ENVELOPE_MARKER_SPACING), [idx, idx])
+            if maxs[idx] > maxs[group[0]]:
+                group[0] = idx
+            if mins[idx] < mins[group[1]]:
+                group[1] = idx
+
+        # Mark the groups that peak above (dip below) their neighbours
+        ordered = [groups[key] for key in sorted(groups)]
+        for pos, (high_idx, low_idx) in enumerate(ordered):
+            before = ordered[pos - 1] if pos else None
+            after = ordered[pos + 1] if pos + 1 < len(ordered) else None
+            if ((before is None or maxs[high_idx] >= maxs[before[0]])
+                    and (after is None or maxs[high_idx] > maxs[after[0]])):
+                svg.element('circle', {'class': 'hi', 'cx': xs[high_idx], 'cy': upper[high_idx], 'r': 2.5})
+            if ((before is None or mins[low_idx] <= mins[before[1]])
+                    and (after is None or mins[low_idx] < mins[after[1]])):
+                svg.element('circle', {'class': 'lo', 'cx': xs[low_idx], 'cy': lower[low_idx], 'r': 2.5})
+
+        # Label the highest high and lowest low of the range with their
+        # date, then the date ticks where they do not overlap them
+        layout = _plot_label_layout(self._width, font_scale)
+        line_height = (PLOT_FONT_SIZES['text'] + 3) * font_scale
+        highest = max(range(len(maxs)), key=maxs.__getitem__)
+        lowest = min(range(len(mins)), key=mins.__getitem__)
+        for idx, height, y, is_high in (
+            (highest, maxs[highest], upper[highest], True),
+            (lowest, mins[lowest], lower[lowest], False),
+        ):
+            day = datetime.datetime.fromtimestamp(times[idx], tz)
+            if is_high:
+                date_y = y - 6
+                height_y = date_y - line_height
+            else:
+                height_y = y + 8 + PLOT_FONT_SIZES['label'] * font_scale
+                date_y = height_y + line_height
+            layout.place(svg, [
+                ('hi' if is_high else 'lo', 'label', xs[idx], height_y, f"{height:.1f}m"),
+                ('txt', 'text', xs[idx], date_y, f"{day:%b} {day.day}"),
+            ])
+        for date_label in date_labels:
+            layout.place(svg, [date_label])
+
+        svg.raw(chrome_over)
+        return svg.getvalue()
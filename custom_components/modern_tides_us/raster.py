@@ -0,0 +1,701 @@
+"""PNG rasterizer for Modern Tides artifacts.
+
+Displays that cannot parse SVG (e-ink panels, older wall tablets) are
+served PNG instead. The SVG documents the plot and table managers write
+use a small subset of SVG: rects, lines, circles, relative bezier paths,
+``<use>`` references and text, styled by class from one ``<style>`` block.
+This module draws exactly that subset with a scanline rasterizer and a
+5x7 bitmap font, with no dependencies beyond the standard library.
+
+When CairoSVG is installed it is used instead for anti-aliased output
+with real fonts; the built-in rasterizer remains the fallback.
+"""
+import logging
+import math
+import re
+import struct
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from xml.etree import ElementTree
+
+try:
+    import cairosvg
+except (ImportError, OSError):  # pragma: no cover - depends on the host install
+    cairosvg = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bitmap font: 5x7 glyphs, one hex byte per row (bit 4 is the left column)
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 7
+# Font size in pixels drawn at glyph scale 1; larger sizes use integer multiples
+GLYPH_EM = 8
+
+_FONT_TABLE = """
+0 0E 11 13 15 19 11 0E
+1 04 0C 04 04 04 04 0E
+2 0E 11 01 02 04 08 1F
+3 1F 02 04 02 01 11 0E
+4 02 06 0A 12 1F 02 02
+5 1F 10 1E 01 01 11 0E
+6 06 08 10 1E 11 11 0E
+7 1F 01 02 04 08 08 08
+8 0E 11 11 0E 11 11 0E
+9 0E 11 11 0F 01 02 0C
+A 0E 11 11 11 1F 11 11
+B 1E 11 11 1E 11 11 1E
+C 0E 11 10 10 10 11 0E
+D 1C 12 11 11 11 12 1C
+E 1F 10 10 1E 10 10 1F
+F 1F 10 10 1E 10 10 10
+G 0E 10 10 17 11 11 0F
+H 11 11 11 1F 11 11 11
+I 0E 04 04 04 04 04 0E
+J 07 02 02 02 02 12 0C
+K 11 12 14 18 14 12 11
+L 10 10 10 10 10 10 1F
+M 11 1B 15 15 11 11 11
+N 11 11 19 15 13 11 11
+O 0E 11 11 11 11 11 0E
+P 1E 11 11 1E 10 10 10
+Q 0E 11 11 11 15 12 0D
+R 1E 11 11 1E 14 12 11
+S 0F 10 10 0E 01 01 1E
+T 1F 04 04 04 04 04 04
+U 11 11 11 11 11 11 0E
+V 11 11 11 11 11 0A 04
+W 11 11 11 15 15 15 0A
+X 11 11 0A 04 0A 11 11
+Y 11 11 11 0A 04 04 04
+Z 1F 01 02 04 08 10 1F
+a 00 00 0E 01 0F 11 0F
+b 10 10 16 19 11 11 1E
+c 00 00 0E 10 10 11 0E
+d 01 01 0D 13 11 11 0F
+e 00 00 0E 11 1F 10 0E
+f 06 09 08 1C 08 08 08
+g 00 0F 11 11 0F 01 0E
+h 10 10 16 19 11 11 11
+i 04 00 0C 04 04 04 0E
+j 02 00 06 02 02 12 0C
+k 10 10 12 14 18 14 12
+l 0C 04 04 04 04 04 0E
+m 00 00 1A 15 15 11 11
+n 00 00 16 19 11 11 11
+o 00 00 0E 11 11 11 0E
+p 00 00 1E 11 1E 10 10
+q 00 00 0D 13 0F 01 01
+r 00 00 16 19 10 10 10
+s 00 00 0E 10 0E 01 1E
+t 08 08 1C 08 08 09 06
+u 00 00 11 11 11 13 0D
+v 00 00 11 11 11 0A 04
+w 00 00 11 11 15 15 0A
+x 00 00 11 0A 04 0A 11
+y 00 00 11 11 0F 01 0E
+z 00 00 1F 02 04 08 1F
+. 00 00 00 00 00 0C 0C
+, 00 00 00 00 0C 04 08
+: 00 0C 0C 00 0C 0C 00
+; 00 0C 0C 00 0C 04 08
+- 00 00 00 1F 00 00 00
++ 00 04 04 1F 04 04 00
+/ 00 01 02 04 08 10 00
+( 02 04 08 08 08 04 02
+) 08 04 02 02 02 04 08
+' 0C 04 08 00 00 00 00
+! 04 04 04 04 00 00 04
+? 0E 11 01 02 04 00 04
+& 0C 12 14 08 15 12 0D
+% 18 19 02 04 08 13 03
+# 0A 0A 1F 0A 1F 0A 0A
+_ 00 00 00 00 00 00 1F
+° 0C 12 12 0C 00 00 00
+↑ 04 0E 15 04 04 04 04
+↓ 04 04 04 04 15 0E 04
+"""
+
+
+def _load_font(table: str) -> Dict[str, Tuple[int, ...]]:
+    """Parse the glyph table into rows of bits per character."""
+    font = {" ": (0,) * GLYPH_HEIGHT}
+    for line in table.strip().splitlines():
+        char, *rows = line.split()
+        font[char] = tuple(int(row, 16) for row in rows)
+    return font
+
+
+_FONT = _load_font(_FONT_TABLE)
+
+# Colors understood besides #rgb and #rrggbb
+_NAMED_COLORS = {
+    'black': (0, 0, 0),
+    'white': (255, 255, 255),
+    'red': (255, 0, 0),
+    'gray': (128, 128, 128),
+    'lightgray': (211, 211, 211),
+}
+
+# Computed style of an element with no matching rules
+_DEFAULT_STYLE = {
+    'fill': 'black',
+    'stroke': 'none',
+    'stroke-width': '1',
+    'font-size': '16px',
+    'font-weight': 'normal',
+    'text-anchor': 'start',
+    'opacity': '1',
+    'visibility': 'visible',
+}
+
+# Presentation attributes honoured on elements, below CSS in the cascade
+_PRESENTATION_ATTRIBUTES = tuple(_DEFAULT_STYLE) + ('stroke-dasharray',)
+
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_PATH_TOKEN = re.compile(r"[MmLlHhVvCcZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_SELECTOR = re.compile(r"^([a-z]*)((?:\.[\w-]+)*)$")
+_VAR = re.compile(r"var\(--([\w-]+)\)")
+
+# Straight segments used per cubic bezier when flattening paths
+BEZIER_STEPS = 8
+
+# Sides of the polygon drawn for circles and round joins
+CIRCLE_SIDES = 24
+
+Color = Tuple[int, int, int]
+Point = Tuple[float, float]
+
+
+def encode_png(width: int, height: int, rgba: bytes) -> bytes:
+    """Encode 8-bit RGBA pixels as a PNG image."""
+    stride = width * 4
+    # Filter type 0 (none) on every scanline; zlib does the rest
+    raw = b"".join(b"\x00" + rgba[y * stride:(y + 1) * stride] for y in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+        )
+
+    return b"".join((
+        b"\x89PNG\r\n\x1a\n",
+        chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)),
+        chunk(b"IDAT", zlib.compress(raw, 6)),
+        chunk(b"IEND", b""),
+    ))
+
+
+class Canvas:
+    """RGBA pixel buffer with scanline primitives.
+
+    Spans are written as whole slices; translucent spans are blended one
+    channel at a time through ``bytes.translate`` lookup tables, so no
+    primitive loops over individual pixels in Python.
+    """
+
+    def __init__(self, width: int, height: int):
+        """Initialize a fully transparent canvas."""
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(width * height * 4)
+        self._blend_tables: Dict[Tuple[Color, float], Tuple[bytes, ...]] = {}
+
+    def _tables(self, color: Color, alpha: float) -> Tuple[bytes, ...]:
+        """Return per-channel lookup tables for painting ``color`` at ``alpha``."""
+        key = (color, alpha)
+        tables = self._blend_tables.get(key)
+        if tables is None:
+            keep = 1 - alpha
+            tables = tuple(
+                bytes(round(value * alpha + dst * keep) for dst in range(256))
+                for value in (*color, 255)
+            )
+            self._blend_tables[key] = tables
+        return tables
+
+    def fill_span(self, y: int, x0: int, x1: int, color: Color, alpha: float = 1.0) -> None:
+        """Paint pixels ``x0`` (inclusive) to ``x1`` (exclusive) of row ``y``."""
+        if y < 0 or y >= self.height:
+            return
+        x0, x1 = max(x0, 0), min(x1, self.width)
+        if x0 >= x1 or alpha <= 0:
+            return
+
+        start = (y * self.width + x0) * 4
+        end = (y * self.width + x1) * 4
+        if alpha >= 1:
+            self.pixels[start:end] = bytes((*color, 255)) * (x1 - x0)
+            return
+
+        for channel, table in enumerate(self._tables(color, alpha)):
+            self.pixels[start + channel:end:4] = self.pixels[start + channel:end:4].translate(table)
+
+    def fill_rect(
+        self, x: float, y: float, width: float, height: float, color: Color, alpha: float = 1.0
+    ) -> None:
+        """Fill an axis-aligned rectangle, sampling at pixel centers."""
+        x0, x1 = math.ceil(x - 0.5), math.ceil(x + width - 0.5)
+        # Keep hairlines visible
+        if x1 == x0 and width > 0:
+            x1 += 1
+        y0, y1 = math.ceil(y - 0.5), math.ceil(y + height - 0.5)
+        if y1 == y0 and height > 0:
+            y1 += 1
+        for row in range(max(y0, 0), min(y1, self.height)):
+            self.fill_span(row, x0, x1, color, alpha)
+
+    def fill_polygon(
+        self, polygons: Iterable[Sequence[Point]], color: Color, alpha: float = 1.0
+    ) -> None:
+        """Fill one or more closed polygons with the even-odd rule."""
+        edges = []
+        for points in polygons:
+            count = len(points)
+            for i in range(count):
+                (xa, ya), (xb, yb) = points[i], points[(i + 1) % count]
+                if ya != yb:
+                    edges.append((xa, ya, xb, yb) if ya < yb else (xb, yb, xa, ya))
+        if not edges:
+            return
+
+        top = max(math.ceil(min(edge[1] for edge in edges) - 0.5), 0)
+        bottom = min(math.ceil(max(edge[3] for edge in edges) - 0.5), self.height)
+        for row in range(top, bottom):
+            center = row + 0.5
+            crossings = sorted(
+                xa + (center - ya) * (xb - xa) / (yb - ya)
+                for xa, ya, xb, yb in edges if ya <= center < yb
+            )
+            for left, right in zip(crossings[::2], crossings[1::2]):
+                x0, x1 = math.ceil(left - 0.5), math.ceil(right - 0.5)
+                self.fill_span(row, x0, max(x1, x0 + 1), color, alpha)
+
+    def fill_circle(self, cx: float, cy: float, radius: float, color: Color, alpha: float = 1.0) -> None:
+        """Fill a circle, approximated by a regular polygon."""
+        self.fill_polygon([_circle_points(cx, cy, radius)], color, alpha)
+
+    def stroke_polyline(
+        self,
+        points: Sequence[Point],
+        width: float,
+        color: Color,
+        alpha: float = 1.0,
+        closed: bool = False
+    ) -> None:
+        """Stroke a polyline as one quad per segment, with round joins."""
+        half = max(width, 1.0) / 2
+        if closed and len(points) > 2:
+            points = [*points, points[0]]
+
+        for (xa, ya), (xb, yb) in zip(points, points[1:]):
+            length = math.hypot(xb - xa, yb - ya)
+            if not length:
+                continue
+            nx, ny = (ya - yb) / length * half, (xb - xa) / length * half
+            self.fill_polygon([(
+                (xa + nx, ya + ny), (xb + nx, yb + ny), (xb - nx, yb - ny), (xa - nx, ya - ny),
+            )], color, alpha)
+
+        # Joins would blend twice over translucent strokes, and vanish below 2px
+        if alpha >= 1 and half >= 1:
+            for x, y in points[1:-1]:
+                self.fill_circle(x, y, half, color, alpha)
+
+    def draw_text(
+        self,
+        x: float,
+        y: float,
+        text: str,
+        color: Color,
+        scale: int = 1,
+        anchor: str = 'start',
+        bold: bool = False,
+        alpha: float = 1.0
+    ) -> None:
+        """Draw ``text`` in the bitmap font with its baseline at ``y``."""
+        advance = (GLYPH_WIDTH + 1) * scale
+        text_width = len(text) * advance - scale
+        if anchor == 'middle':
+            x -= text_width / 2
+        elif anchor == 'end':
+            x -= text_width
+        left, top = round(x), round(y) - GLYPH_HEIGHT * scale
+        extra = scale if bold else 0
+
+        for index, char in enumerate(text):
+            rows = _FONT.get(char) or _FONT.get(char.upper()) or _FONT['?']
+            glyph_x = left + index * advance
+            for row_index, bits in enumerate(rows):
+                if not bits:
+                    continue
+                row_y = top + row_index * scale
+                # Paint each run of set bits as one span per pixel row
+                column = 0
+                while column < GLYPH_WIDTH:
+                    if bits & (0x10 >> column):
+                        run_start = column
+                        while column < GLYPH_WIDTH and bits & (0x10 >> column):
+                            column += 1
+                        x0 = glyph_x + run_start * scale
+                        x1 = glyph_x + column * scale + extra
+                        for offset in range(scale):
+                            self.fill_span(row_y + offset, x0, x1, color, alpha)
+                    else:
+                        column += 1
+
+    def png(self) -> bytes:
+        """Return the canvas encoded as PNG."""
+        return encode_png(self.width, self.height, bytes(self.pixels))
+
+
+def _circle_points(cx: float, cy: float, radius: float) -> List[Point]:
+    """Return the vertices of a circle approximation."""
+    return [
+        (cx + radius * math.cos(2 * math.pi * i / CIRCLE_SIDES),
+         cy + radius * math.sin(2 * math.pi * i / CIRCLE_SIDES))
+        for i in range(CIRCLE_SIDES)
+    ]
+
+
+def _parse_color(value: Optional[str]) -> Optional[Color]:
+    """Parse a CSS color; None for ``none`` or anything unrecognized."""
+    if not value:
+        return None
+    value = value.strip().lower()
+    if value.startswith('#'):
+        digits = value[1:]
+        if len(digits) == 3:
+            digits = "".join(digit * 2 for digit in digits)
+        if len(digits) == 6:
+            try:
+                return tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4))
+            except ValueError:
+                return None
+        return None
+    return _NAMED_COLORS.get(value)
+
+
+def _parse_length(value: Optional[str], default: float = 0.0) -> float:
+    """Parse a number, ignoring any unit suffix."""
+    match = _NUMBER.match(value.strip()) if value else None
+    return float(match.group()) if match else default
+
+
+def _parse_css(text: str) -> List[Tuple[int, int, str, Tuple[str, ...], Dict[str, str]]]:
+    """Parse the flat style sheets the renderers write.
+
+    Returns ``(specificity, order, tag, classes, declarations)`` for every
+    simple selector. At-rules such as ``@media`` blocks are skipped, so
+    ``auto`` theme documents render with their light colors.
+    """
+    rules = []
+    depth, position, block_start, selector = 0, 0, 0, ""
+    for match in re.finditer(r"[{}]", text):
+        if match.group() == "{":
+            if depth == 0:
+                selector = text[position:match.start()].strip()
+                block_start = match.end()
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                if not selector.startswith("@"):
+                    declarations = {}
+                    for declaration in text[block_start:match.start()].split(";"):
+                        name, _, value = declaration.partition(":")
+                        if value:
+                            declarations[name.strip()] = value.strip()
+                    for part in selector.split(","):
+                        simple = _SELECTOR.match(part.strip())
+                        if simple:
+                            tag, classes = simple.group(1), tuple(filter(None, simple.group(2).split(".")))
+                            rules.append((len(classes) * 10 + bool(tag), len(rules), tag, classes, declarations))
+                position = match.end()
+    rules.sort(key=lambda rule: rule[:2])
+    return rules
+
+
+def _parse_path(data: str) -> List[Tuple[List[Point], bool]]:
+    """Flatten SVG path data into ``(points, closed)`` subpaths."""
+    tokens = _PATH_TOKEN.findall(data)
+    subpaths: List[Tuple[List[Point], bool]] = []
+    points: List[Point] = []
+    x = y = 0.0
+    command = None
+    index = 0
+
+    def number() -> float:
+        nonlocal index
+        value = float(tokens[index])
+        index += 1
+        return value
+
+    while index < len(tokens):
+        token = tokens[index]
+        if token.isalpha():
+            command = token
+            index += 1
+            if command in "Zz":
+                if points:
+                    subpaths.append((points, True))
+                    x, y = points[0]
+                points = []
+                continue
+        elif command is None:
+            break
+
+        relative = command.islower()
+        kind = command.upper()
+        if kind == 'M':
+            if points:
+                subpaths.append((points, False))
+            dx, dy = number(), number()
+            x, y = (x + dx, y + dy) if relative else (dx, dy)
+            points = [(x, y)]
+            # Further pairs after a moveto are implicit linetos
+            command = 'l' if relative else 'L'
+        elif kind == 'L':
+            dx, dy = number(), number()
+            x, y = (x + dx, y + dy) if relative else (dx, dy)
+            points.append((x, y))
+        elif kind == 'H':
+            value = number()
+            x = x + value if relative else value
+            points.append((x, y))
+        elif kind == 'V':
+            value = number()
+            y = y + value if relative else value
+            points.append((x, y))
+        elif kind == 'C':
+            coords = [number() for _ in range(6)]
+            if relative:
+                coords = [value + (x if i % 2 == 0 else y) for i, value in enumerate(coords)]
+            x1, y1, x2, y2, x3, y3 = coords
+            for step in range(1, BEZIER_STEPS + 1):
+                t = step / BEZIER_STEPS
+                u = 1 - t
+                points.append((
+                    u * u * u * x + 3 * u * u * t * x1 + 3 * u * t * t * x2 + t * t * t * x3,
+                    u * u * u * y + 3 * u * u * t * y1 + 3 * u * t * t * y2 + t * t * t * y3,
+                ))
+            x, y = x3, y3
+        else:
+            index += 1
+
+    if points:
+        subpaths.append((points, False))
+    return subpaths
+
+
+def _dashed(points: Sequence[Point], pattern: Sequence[float]) -> List[List[Point]]:
+    """Split a polyline into the dashes of ``pattern`` (on, off, on, ...)."""
+    if not pattern or sum(pattern) <= 0:
+        return [list(points)]
+
+    dashes: List[List[Point]] = []
+    current: List[Point] = []
+    phase, remaining = 0, pattern[0]
+    for (xa, ya), (xb, yb) in zip(points, points[1:]):
+        length = math.hypot(xb - xa, yb - ya)
+        travelled = 0.0
+        while length - travelled > remaining:
+            travelled += remaining
+            t = travelled / length
+            point = (xa + (xb - xa) * t, ya + (yb - ya) * t)
+            if phase % 2 == 0:
+                dashes.append([*(current or [(xa, ya)]), point])
+                current = []
+            else:
+                current = [point]
+            phase = (phase + 1) % len(pattern)
+            remaining = pattern[phase]
+        remaining -= length - travelled
+        if phase % 2 == 0:
+            current = current or [(xa, ya)]
+            current.append((xb, yb))
+    if len(current) > 1:
+        dashes.append(current)
+    return dashes
+
+
+class _Renderer:
+    """Walk a parsed SVG document and paint it onto a canvas."""
+
+    def __init__(self, root: ElementTree.Element):
+        """Prepare the viewport, style sheet and id index."""
+        width = _parse_length(root.get('width'), 0)
+        height = _parse_length(root.get('height'), 0)
+        view_box = [float(value) for value in _NUMBER.findall(root.get('viewBox') or "")]
+        if len(view_box) == 4 and view_box[2] > 0 and view_box[3] > 0:
+            self.origin = (view_box[0], view_box[1])
+            self.scale = (width / view_box[2] if width else 1.0, height / view_box[3] if height else 1.0)
+            width = width or view_box[2]
+            height = height or view_box[3]
+        else:
+            self.origin = (0.0, 0.0)
+            self.scale = (1.0, 1.0)
+
+        self.canvas = Canvas(max(1, round(width)), max(1, round(height)))
+        self.rules = _parse_css("".join(
+            element.text or "" for element in root.iter() if _tag(element) == 'style'
+        ))
+        # Custom properties (auto theme documents) declared on the root
+        self.variables = {
+            name[2:]: value
+            for _, _, tag, classes, declarations in self.rules if tag == 'svg' and not classes
+            for name, value in declarations.items() if name.startswith('--')
+        }
+        self.ids = {element.get('id'): element for element in root.iter() if element.get('id')}
+
+    def point(self, x: float, y: float) -> Point:
+        """Map user units to canvas pixels."""
+        return ((x - self.origin[0]) * self.scale[0], (y - self.origin[1]) * self.scale[1])
+
+    def style(self, element: ElementTree.Element, tag: str) -> Dict[str, str]:
+        """Return the computed style of ``element``."""
+        style = dict(_DEFAULT_STYLE)
+        for name in _PRESENTATION_ATTRIBUTES:
+            if element.get(name) is not None:
+                style[name] = element.get(name)
+
+        classes = set((element.get('class') or "").split())
+        for _, _, rule_tag, rule_classes, declarations in self.rules:
+            if (not rule_tag or rule_tag == tag) and classes.issuperset(rule_classes) \
+                    and (rule_tag or rule_classes):
+                style.update(declarations)
+
+        for name, value in style.items():
+            if "var(" in value:
+                style[name] = _VAR.sub(lambda match: self.variables.get(match.group(1), ""), value)
+        return style
+
+    def render(self, element: ElementTree.Element, offset: Point = (0.0, 0.0)) -> None:
+        """Paint ``element`` and its children in document order."""
+        for child in element:
+            tag = _tag(child)
+            if tag in ('defs', 'style'):
+                continue
+            if tag == 'g':
+                self.render(child, offset)
+                continue
+            try:
+                self.draw(child, tag, offset)
+            except (ValueError, IndexError) as err:
+                _LOGGER.debug("Skipping unsupported <%s>: %s", tag, err)
+
+    def draw(self, element: ElementTree.Element, tag: str, offset: Point) -> None:
+        """Paint one shape element."""
+        if tag == 'use':
+            target = self.ids.get((element.get('href') or element.get(
+                '{http://www.w3.org/1999/xlink}href') or "").lstrip('#'))
+            if target is not None:
+                self.draw(target, _tag(target), (
+                    offset[0] + _parse_length(element.get('x')),
+                    offset[1] + _parse_length(element.get('y')),
+                ))
+            return
+
+        style = self.style(element, tag)
+        if style['visibility'] == 'hidden':
+            return
+        opacity = _parse_length(style['opacity'], 1.0)
+        fill = _parse_color(style['fill'])
+        fill_alpha = opacity * _parse_length(style.get('fill-opacity'), 1.0)
+        stroke = _parse_color(style['stroke'])
+        stroke_alpha = opacity * _parse_length(style.get('stroke-opacity'), 1.0)
+        stroke_width = _parse_length(style['stroke-width'], 1.0) * self.scale[0]
+        dashes = [value * self.scale[0] for value in map(float, _NUMBER.findall(
+            style.get('stroke-dasharray') or ""))]
+
+        def attr(name: str) -> float:
+            return _parse_length(element.get(name))
+
+        def at(x: float, y: float) -> Point:
+            return self.point(x + offset[0], y + offset[1])
+
+        canvas = self.canvas
+        if tag == 'rect':
+            x, y = at(attr('x'), attr('y'))
+            width, height = attr('width') * self.scale[0], attr('height') * self.scale[1]
+            if fill is not None:
+                canvas.fill_rect(x, y, width, height, fill, fill_alpha)
+            if stroke is not None:
+                corners = [(x, y), (x + width, y), (x + width, y + height), (x, y + height)]
+                canvas.stroke_polyline(corners, stroke_width, stroke, stroke_alpha, closed=True)
+            return
+
+        if tag == 'circle':
+            x, y = at(attr('cx'), attr('cy'))
+            radius = attr('r') * self.scale[0]
+            if fill is not None:
+                canvas.fill_circle(x, y, radius, fill, fill_alpha)
+            if stroke is not None:
+                points = _circle_points(x, y, radius)
+                canvas.stroke_polyline(points, stroke_width, stroke, stroke_alpha, closed=True)
+            return
+
+        if tag == 'text':
+            text = "".join(element.itertext()).strip()
+            if fill is None or not text:
+                return
+            x, y = at(attr('x'), attr('y'))
+            size = _parse_length(style['font-size'], 16) * self.scale[1]
+            canvas.draw_text(
+                x, y, text, fill,
+                scale=max(1, int(size / GLYPH_EM + 0.5)),
+                anchor=style['text-anchor'],
+                bold=style['font-weight'] in ('bold', '700', '800', '900'),
+                alpha=fill_alpha,
+            )
+            return
+
+        if tag == 'line':
+            subpaths = [([at(attr('x1'), attr('y1')), at(attr('x2'), attr('y2'))], False)]
+        elif tag in ('polyline', 'polygon'):
+            values = [float(value) for value in _NUMBER.findall(element.get('points') or "")]
+            points = [at(values[i], values[i + 1]) for i in range(0, len(values) - 1, 2)]
+            subpaths = [(points, tag == 'polygon')]
+        elif tag == 'path':
+            subpaths = [
+                ([at(x, y) for x, y in points], closed)
+                for points, closed in _parse_path(element.get('d') or "")
+            ]
+        else:
+            return
+
+        if fill is not None and tag != 'line':
+            canvas.fill_polygon([points for points, _ in subpaths if len(points) > 2], fill, fill_alpha)
+        if stroke is not None:
+            for points, closed in subpaths:
+                if closed and len(points) > 2:
+                    points = [*points, points[0]]
+                for dash in _dashed(points, dashes):
+                    canvas.stroke_polyline(dash, stroke_width, stroke, stroke_alpha)
+
+
+def _tag(element: ElementTree.Element) -> str:
+    """Return an element's tag without its namespace."""
+    return element.tag.rpartition('}')[2]
+
+
+def rasterize(document: bytes) -> Canvas:
+    """Draw an SVG document with the built-in rasterizer."""
+    root = ElementTree.fromstring(document)
+    renderer = _Renderer(root)
+    renderer.render(root)
+    return renderer.canvas
+
+
+def svg_to_png(document: bytes) -> bytes:
+    """Convert an SVG document to PNG.
+
+    CairoSVG is used when it is installed; otherwise, or if it fails on
+    this host, the built-in rasterizer draws the document.
+    """
+    if cairosvg is not None:
+        try:
+            return cairosvg.svg2png(bytestring=document)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("CairoSVG failed, using the built-in rasterizer: %s", err)
+    return rasterize(document).png()
@@ -0,0 +1,229 @@
+"""Parallel render engine for Modern Tides plot and table artifacts."""
+import asyncio
+import logging
+import multiprocessing
+import os
+import pickle
+import runpy
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from homeassistant.util import dt as dt_util
+
+from .artifacts import ArtifactRegistry
+from .const import RENDER_MAX_WORKERS
+from .worker import WORKER_RUN_NAME
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# Errors that mean the process pool itself cannot be used
+_POOL_ERRORS = (BrokenProcessPool, pickle.PicklingError, pickle.UnpicklingError)
+
+# Errors pickle.dumps raises for unpicklable objects besides PicklingError
+_PICKLE_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+
+
+def _worker_initargs(time_zone: Optional[str]) -> Tuple[str, Dict[str, Any], str]:
+    """Return the runpy.run_path arguments that bootstrap a worker."""
+    return (
+        os.path.join(os.path.dirname(__file__), "worker.py"),
+        {
+            "BOOTSTRAP_ARGS": {
+                "package": __package__,
+                "package_dir": os.path.dirname(__file__),
+                "time_zone": time_zone,
+            },
+        },
+        WORKER_RUN_NAME,
+    )
+
+
+def _init_worker(time_zone: str) -> None:
+    """Apply Home Assistant's time zone inside a freshly spawned worker."""
+    tz = dt_util.get_time_zone(time_zone)
+    if tz is not None:
+        dt_util.set_default_time_zone(tz)
+
+
+def _render_chunk(
+    managers: Sequence[Any],
+    tide_data: Dict[str, Any],
+    current_time: Any
+) -> List[Tuple[Optional[Dict[str, bytes]], Optional[str]]]:
+    """Render a group of artifacts sequentially and return each one's documents.
+
+    Documents are keyed by theme; None marks a failed render.
+    """
+    results = []
+    for manager in managers:
+        try:
+            results.append((manager.generate(tide_data, current_time), None))
+        except Exception as err:  # pylint: disable=broad-except
+            results.append((None, str(err)))
+    return results
+
+
+def _pickle_chunk(
+    managers: Sequence[Any],
+    tide_data: Dict[str, Any],
+    current_time: Any
+) -> bytes:
+    """Pickle a chunk's work for a worker process."""
+    return pickle.dumps((managers, tide_data, current_time), pickle.HIGHEST_PROTOCOL)
+
+
+def _render_pickled_chunk(payload: bytes) -> List[Tuple[Optional[Dict[str, bytes]], Optional[str]]]:
+    """Unpickle and render a chunk inside a worker process."""
+    return _render_chunk(*pickle.loads(payload))
+
+
+def _stale_managers(
+    managers: Sequence[Any],
+    tide_data: Dict[str, Any],
+    current_time: Any,
+    registry: ArtifactRegistry
+) -> List[Tuple[Any, Optional[str]]]:
+    """Return the managers whose published artifacts are out of date, with their fingerprint."""
+    stale = []
+    for manager in managers:
+        fingerprint = manager.render_fingerprint(tide_data, current_time)
+        if not manager.is_current(fingerprint, registry):
+            stale.append((manager, fingerprint))
+    return stale
+
+
+class RenderEngine:
+    """Render a station's artifacts as one batch on a bounded worker pool.
+
+    Work runs in separate processes so plots for several stations can use
+    more than one core. If a process pool cannot be used on this host the
+    engine falls back to Home Assistant's executor. Finished documents are
+    published to ``registry``, which cameras and views serve from.
+    """
+
+    def __init__(self, hass, max_workers: Optional[int] = None):
+        """Initialize the render engine."""
+        self._hass = hass
+        self._max_workers = max_workers or max(1, min(RENDER_MAX_WORKERS, os.cpu_count() or 1))
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._use_processes = True
+        self.registry = ArtifactRegistry()
+
+    @property
+    def max_workers(self) -> int:
+        """Return the size of the worker pool."""
+        return self._max_workers
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return the process pool, creating it on first use."""
+        if self._pool is None and self._use_processes:
+            try:
+                # Spawn rather than fork: forking a multi-threaded process is unsafe
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=runpy.run_path,
+                    initargs=_worker_initargs(self._hass.config.time_zone),
+                )
+            except (OSError, ValueError, NotImplementedError) as err:
+                _LOGGER.warning("Render process pool unavailable, using executor threads: %s", err)
+                self._use_processes = False
+        return self._pool
+
+    async def _async_run_chunk(
+        self,
+        managers: Sequence[Any],
+        tide_data: Dict[str, Any],
+        current_time: Any
+    ) -> List[Tuple[Optional[Dict[str, bytes]], Optional[str]]]:
+        """Run one chunk in the process pool, or in the executor as a fallback.
+
+        The work is pickled up front so that unpicklable data, which
+        surfaces as TypeError or AttributeError as well as PicklingError,
+        can be told apart from other failures. Only pickling errors and a
+        broken pool switch the engine to the executor for good; any other
+        error fails the chunk's artifacts for this update.
+        """
+        pool = self._get_pool()
+        payload: Optional[bytes] = None
+        if pool is not None:
+            try:
+                payload = await self._hass.async_add_executor_job(
+                    _pickle_chunk, managers, tide_data, current_time
+                )
+            except _PICKLE_ERRORS as err:
+                self._disable_processes(err)
+
+        if pool is not None and payload is not None:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    pool, _render_pickled_chunk, payload
+                )
+            except _POOL_ERRORS as err:
+                self._disable_processes(err)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.exception("Error rendering %d artifacts in a worker process", len(managers))
+                return [(None, str(err))] * len(managers)
+
+        return await self._hass.async_add_executor_job(
+            _render_chunk, managers, tide_data, current_time
+        )
+
+    async def async_render(
+        self,
+        managers: Sequence[Any],
+        tide_data: Dict[str, Any],
+        current_time: Any
+    ) -> Dict[Any, bool]:
+        """Render every out-of-date artifact in ``managers`` and gather results.
+
+        The batch is split into at most ``max_workers`` chunks so the shared
+        tide data is pickled once per worker rather than once per artifact.
+        """
+        stale = await self._hass.async_add_executor_job(
+            _stale_managers, managers, tide_data, current_time, self.registry
+        )
+        results = {manager: True for manager in managers}
+        if not stale:
+            return results
+
+        chunk_count = min(self._max_workers, len(stale))
+        chunks = [stale[i::chunk_count] for i in range(chunk_count)]
+        chunk_results = await asyncio.gather(*(
+            self._async_run_chunk([manager for manager, _ in chunk], tide_data, current_time)
+            for chunk in chunks
+        ))
+
+        for chunk, outcomes in zip(chunks, chunk_results):
+            for (manager, fingerprint), (documents, error) in zip(chunk, outcomes):
+                results[manager] = documents is not None
+                if documents is not None:
+                    if manager.artifact_id is not None:
+                        for theme, document in documents.items():
+                            self.registry.publish((*manager.artifact_id, theme), document, fingerprint)
+                    manager.mark_rendered(fingerprint)
+                else:
+                    manager.mark_rendered(None)
+                    _LOGGER.warning("Failed to render %r: %s", manager, error or "no output")
+
+        _LOGGER.debug("Rendered %d of %d artifacts in %d chunks",
+                      len(stale), len(managers), chunk_count)
+        return results
+
+    def _disable_processes(self, err: Exception) -> None:
+        """Switch to executor threads for good after the pool failed."""
+        _LOGGER.warning("Render process pool failed, using executor threads: %s", err)
+        self._use_processes = False
+        self._shutdown_pool()
+
+    def _shutdown_pool(self) -> None:
+        """Stop the worker processes without waiting for them."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def async_shutdown(self) -> None:
+        """Shut down the worker pool."""
+        self._shutdown_pool()
@@ -14,7 +14,9 @@ from homeassistant.const import UnitOfLength
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_STATION_ID,
@@ -23,7 +25,9 @@ from .const import (
     CONF_UPDATE_INTERVAL,
     DOMAIN,
     INTERVALS,
+    SENSOR_REFRESH_INTERVAL,
 )
+from .timeline import TIDE_HIGH, TIDE_LOW
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,6 +91,36 @@ class ModernTidesEntity(CoordinatorEntity):
             "model": "Tide Station",
         }
 
+class TideLiveEntity(ModernTidesEntity):
+    """Base entity for sensors read from the timeline at the current time.
+
+    The timeline spans several days, so the values stay right between
+    coordinator refreshes; the state is written every
+    SENSOR_REFRESH_INTERVAL seconds to follow the clock.
+    """
+
+    async def async_added_to_hass(self) -> None:
+        """Start the periodic state writes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_refresh_state,
+                datetime.timedelta(seconds=SENSOR_REFRESH_INTERVAL),
+            )
+        )
+
+    @callback
+    def _async_refresh_state(self, now: datetime.datetime) -> None:
+        """Write the state for the current time."""
+        self.async_write_ha_state()
+
+    def _next_extreme(self, kind: str) -> Optional[Dict[str, Any]]:
+        """Return the next extreme of ``kind`` from now, if known."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.timeline.next_extreme(dt_util.now(), kind)
+
 class TideStationInfoSensor(ModernTidesEntity, SensorEntity):
     """Sensor representing tide station information."""
 
@@ -111,20 +145,17 @@ class TideStationInfoSensor(ModernTidesEntity, SensorEntity):
         attrs = {}
         
         if self.coordinator.data:
-            attrs["station_id"] = self.coordinator.data.get("station_id")
+            attrs["station_id"] = self.coordinator.data.station_id
             
             # Include any metadata from the API response
-            if (
-                "daily" in self.coordinator.data
-                and "mareas" in self.coordinator.data["daily"]
-                and "metadatos" in self.coordinator.data["daily"]["mareas"]
-            ):
-                metadata = self.coordinator.data["daily"]["mareas"]["metadatos"]
-                attrs.update(metadata)
+            attrs.update(self.coordinator.data.metadata)
+
+            # Resident size of the parsed tide data for this station
+            attrs["data_memory_bytes"] = self.coordinator.data.memory_footprint()["total"]
         
         return attrs
 
-class TideCurrentHeightSensor(ModernTidesEntity, SensorEntity):
+class TideCurrentHeightSensor(TideLiveEntity, SensorEntity):
     """Sensor for current tide height."""
 
     def __init__(self, coordinator):
@@ -143,16 +174,17 @@ class TideCurrentHeightSensor(ModernTidesEntity, SensorEntity):
     @property
     def native_value(self) -> Optional[float]:
         """Return the state of the sensor."""
-        if (
-            self.coordinator.data
-            and "current_height" in self.coordinator.data
-            and self.coordinator.data["current_height"] is not None
-        ):
+        if not self.coordinator.data:
+            return None
+
+        # Clamp to the nearest point if now is outside the fetched range
+        current_height = self.coordinator.data.timeline.height_at(dt_util.now(), clamp=True)
+        if current_height is not None:
             # Round to 2 decimal places
-            return round(self.coordinator.data["current_height"], 2)
+            return round(current_height, 2)
         return None
 
-class TideNextHighSensor(ModernTidesEntity, SensorEntity):
+class TideNextHighSensor(TideLiveEntity, SensorEntity):
     """Sensor for next high tide."""
 
     def __init__(self, coordinator):
@@ -183,13 +215,9 @@ class TideNextHighSensor(ModernTidesEntity, SensorEntity):
     def native_value(self) -> Optional[datetime.datetime]:
         """Return the time of the next high tide."""
         try:
-            if (
-                self.coordinator.data
-                and "next_high_tide" in self.coordinator.data
-                and self.coordinator.data["next_high_tide"] is not None
-                and "time" in self.coordinator.data["next_high_tide"]
-            ):
-                return self.coordinator.data["next_high_tide"]["time"]
+            high_tide = self._next_extreme(TIDE_HIGH)
+            if high_tide is not None:
+                return high_tide["time"]
         except Exception as e:
             _LOGGER.error("Error getting next high tide time: %s", e)
         return None
@@ -200,13 +228,8 @@ class TideNextHighSensor(ModernTidesEntity, SensorEntity):
         attrs = {}
         
         try:
-            if (
-                self.coordinator.data
-                and "next_high_tide" in self.coordinator.data
-                and self.coordinator.data["next_high_tide"] is not None
-                and "height" in self.coordinator.data["next_high_tide"]
-            ):
-                high_tide = self.coordinator.data["next_high_tide"]
+            high_tide = self._next_extreme(TIDE_HIGH)
+            if high_tide is not None:
                 attrs["height"] = round(high_tide["height"], 2)
                 attrs["height_m"] = round(high_tide["height"], 2)  # For backwards compatibility
         except Exception as e:
@@ -214,7 +237,7 @@ class TideNextHighSensor(ModernTidesEntity, SensorEntity):
             
         return attrs
 
-class TideNextLowSensor(ModernTidesEntity, SensorEntity):
+class TideNextLowSensor(TideLiveEntity, SensorEntity):
     """Sensor for next low tide."""
 
     def __init__(self, coordinator):
@@ -245,13 +268,9 @@ class TideNextLowSensor(ModernTidesEntity, SensorEntity):
     def native_value(self) -> Optional[datetime.datetime]:
         """Return the time of the next low tide."""
         try:
-            if (
-                self.coordinator.data
-                and "next_low_tide" in self.coordinator.data
-                and self.coordinator.data["next_low_tide"] is not None
-                and "time" in self.coordinator.data["next_low_tide"]
-            ):
-                return self.coordinator.data["next_low_tide"]["time"]
+            low_tide = self._next_extreme(TIDE_LOW)
+            if low_tide is not None:
+                return low_tide["time"]
         except Exception as e:
             _LOGGER.error("Error getting next low tide time: %s", e)
         return None
@@ -262,13 +281,8 @@ class TideNextLowSensor(ModernTidesEntity, SensorEntity):
         attrs = {}
         
         try:
-            if (
-                self.coordinator.data
-                and "next_low_tide" in self.coordinator.data
-                and self.coordinator.data["next_low_tide"] is not None
-                and "height" in self.coordinator.data["next_low_tide"]
-            ):
-                low_tide = self.coordinator.data["next_low_tide"]
+            low_tide = self._next_extreme(TIDE_LOW)
+            if low_tide is not None:
                 attrs["height"] = round(low_tide["height"], 2)
                 attrs["height_m"] = round(low_tide["height"], 2)  # For backwards compatibility
         except Exception as e:
@@ -0,0 +1,102 @@
+"""Compact wire formats for tide series served to client-side renderers.
+
+Two encodings of a TimelineView are produced:
+
+JSON (``application/json``)::
+
+    {"start": <POSIX seconds>, "time_unit": 60, "height_unit": 0.001,
+     "times": [<delta>, ...], "heights": [<quantized>, ...],
+     "extremes": {"times": [<delta>, ...], "heights": [...], "types": "HLHL..."}}
+
+Times are whole ``time_unit`` steps, each relative to the previous point
+(the first relative to ``start``); heights are integers to multiply by
+``height_unit``.
+
+Binary (``application/octet-stream``), little-endian, laid out so every
+array can be wrapped in a JavaScript typed array without copying::
+
+    0   char[4]  magic "MTS1"
+    4   uint32   point count (n)
+    8   uint32   extreme count (m)
+    12  uint32   time unit (seconds)
+    16  float64  start (POSIX seconds)
+    24  uint32[n]  point offsets from start, in time units
+    .   float32[n] point heights
+    .   uint32[m]  extreme offsets from start, in time units
+    .   float32[m] extreme heights
+    .   uint8[m]   extreme types (1 high, 0 low)
+"""
+import json
+import struct
+from typing import List
+
+from .timeline import TIDE_HIGH, TimelineView
+
+SERIES_FORMAT_JSON = "json"
+SERIES_FORMAT_BINARY = "binary"
+SERIES_FORMATS = {
+    SERIES_FORMAT_JSON: "application/json",
+    SERIES_FORMAT_BINARY: "application/octet-stream",
+}
+
+# Predictions fall on whole minutes, and NOAA publishes heights to 3 decimals
+SERIES_TIME_UNIT = 60
+SERIES_HEIGHT_UNIT = 0.001
+
+_BINARY_MAGIC = b"MTS1"
+_BINARY_HEADER = struct.Struct("<4sIIId")
+
+
+def _steps(times, start: float) -> List[int]:
+    """Return ``times`` as whole time units from ``start``."""
+    return [round((timestamp - start) / SERIES_TIME_UNIT) for timestamp in times]
+
+
+def _deltas(steps: List[int]) -> List[int]:
+    """Return each step relative to the one before it (the first to zero)."""
+    return [step - previous for previous, step in zip([0, *steps], steps)]
+
+
+def _series_start(view: TimelineView) -> float:
+    """Return the start the offsets are taken from: the earliest time, on a whole unit."""
+    firsts = [series[0] for series in (view.times, view.extreme_times) if len(series)]
+    first = min(firsts) if firsts else 0.0
+    return first - first % SERIES_TIME_UNIT
+
+
+def encode_json(view: TimelineView) -> bytes:
+    """Encode a view as compact JSON with delta times and quantized heights."""
+    start = _series_start(view)
+    payload = {
+        "start": int(start),
+        "time_unit": SERIES_TIME_UNIT,
+        "height_unit": SERIES_HEIGHT_UNIT,
+        "times": _deltas(_steps(view.times, start)),
+        "heights": [round(height / SERIES_HEIGHT_UNIT) for height in view.heights],
+        "extremes": {
+            "times": _deltas(_steps(view.extreme_times, start)),
+            "heights": [round(height / SERIES_HEIGHT_UNIT) for height in view.extreme_heights],
+            "types": "".join("H" if kind == TIDE_HIGH else "L" for kind in view.extreme_types),
+        },
+    }
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def encode_binary(view: TimelineView) -> bytes:
+    """Encode a view as little-endian typed arrays (see the module docstring)."""
+    start = _series_start(view)
+    count, extreme_count = len(view), view.extreme_count
+    return b"".join((
+        _BINARY_HEADER.pack(_BINARY_MAGIC, count, extreme_count, SERIES_TIME_UNIT, start),
+        struct.pack(f"<{count}I", *_steps(view.times, start)),
+        struct.pack(f"<{count}f", *view.heights),
+        struct.pack(f"<{extreme_count}I", *_steps(view.extreme_times, start)),
+        struct.pack(f"<{extreme_count}f", *view.extreme_heights),
+        bytes(kind == TIDE_HIGH for kind in view.extreme_types),
+    ))
+
+
+SERIES_ENCODERS = {
+    SERIES_FORMAT_JSON: encode_json,
+    SERIES_FORMAT_BINARY: encode_binary,
+}
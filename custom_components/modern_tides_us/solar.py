@@ -0,0 +1,162 @@
+"""Solar ephemeris for Modern Tides daylight bands.
+
+Sunrise and sunset follow the NOAA solar calculator equations (after
+Meeus), computed locally with no network access. Results are memoized per
+(location, date) in a small LRU, and ranges of days are computed in bulk
+with NumPy when it is available.
+"""
+import datetime
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the host install
+    np = None
+
+# Zenith of the sun's center at rise/set: refraction plus the solar radius
+SUNRISE_ZENITH = 90.833
+
+# Days kept per process; a week of plots for a handful of stations fits easily
+SOLAR_CACHE_SIZE = 512
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_JULIAN_UNIX_EPOCH = 2440587.5
+
+# (sunrise, sunset) as POSIX timestamps, None when the sun does not cross
+SunTimes = Tuple[Optional[float], Optional[float]]
+
+# (lat, lon, ordinal date) -> SunTimes, oldest first. Render threads and
+# camera executor jobs share it, so every access holds the lock.
+_cache: "OrderedDict[Tuple[float, float, int], SunTimes]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _solar_terms(julian_century, xp):
+    """Return the declination (radians) and equation of time (minutes).
+
+    ``xp`` is either ``math`` or ``numpy``, so the same equations serve
+    scalar and vectorized callers.
+    """
+    t = julian_century
+    geom_mean_long = xp.radians((280.46646 + t * (36000.76983 + t * 0.0003032)) % 360)
+    geom_mean_anom = xp.radians(357.52911 + t * (35999.05029 - 0.0001537 * t))
+    eccentricity = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+
+    eq_of_center = xp.radians(
+        xp.sin(geom_mean_anom) * (1.914602 - t * (0.004817 + 0.000014 * t))
+        + xp.sin(2 * geom_mean_anom) * (0.019993 - 0.000101 * t)
+        + xp.sin(3 * geom_mean_anom) * 0.000289
+    )
+    true_long = geom_mean_long + eq_of_center
+    omega = xp.radians(125.04 - 1934.136 * t)
+    apparent_long = true_long - xp.radians(0.00569 + 0.00478 * xp.sin(omega))
+
+    mean_obliquity = 23 + (26 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60) / 60
+    obliquity = xp.radians(mean_obliquity + 0.00256 * xp.cos(omega))
+
+    arcsin = getattr(xp, "arcsin", None) or xp.asin
+    declination = arcsin(xp.sin(obliquity) * xp.sin(apparent_long))
+
+    y = xp.tan(obliquity / 2) ** 2
+    eq_of_time = 4 * xp.degrees(
+        y * xp.sin(2 * geom_mean_long)
+        - 2 * eccentricity * xp.sin(geom_mean_anom)
+        + 4 * eccentricity * y * xp.sin(geom_mean_anom) * xp.cos(2 * geom_mean_long)
+        - 0.5 * y * y * xp.sin(4 * geom_mean_long)
+        - 1.25 * eccentricity * eccentricity * xp.sin(2 * geom_mean_anom)
+    )
+    return declination, eq_of_time
+
+
+def _compute(latitude: float, longitude: float, ordinals: Sequence[int]) -> List[SunTimes]:
+    """Compute sunrise and sunset for each proleptic ordinal date.
+
+    Each date is evaluated at the station's approximate solar noon, so the
+    events belong to the local calendar day even when they fall on a
+    different UTC date. Days without a sunrise or sunset (polar day or
+    night) yield ``None``.
+    """
+    lat = math.radians(latitude)
+    cos_zenith = math.cos(math.radians(SUNRISE_ZENITH))
+    epoch_ordinal = _EPOCH.date().toordinal()
+
+    if np is not None:
+        days = np.asarray(ordinals, dtype=float) - epoch_ordinal
+        noon_ts = days * 86400 + (720 - 4 * longitude) * 60
+        century = (noon_ts / 86400 + _JULIAN_UNIX_EPOCH - 2451545.0) / 36525
+        declination, eq_of_time = _solar_terms(century, np)
+        cos_hour_angle = (cos_zenith / (np.cos(lat) * np.cos(declination))
+                          - np.tan(lat) * np.tan(declination))
+        visible = np.abs(cos_hour_angle) <= 1
+        hour_angle = np.degrees(np.arccos(np.clip(cos_hour_angle, -1, 1)))
+        midnight_ts = days * 86400
+        sunrise = midnight_ts + (720 - 4 * (longitude + hour_angle) - eq_of_time) * 60
+        sunset = midnight_ts + (720 - 4 * (longitude - hour_angle) - eq_of_time) * 60
+        return [
+            (float(rise), float(set_)) if ok else (None, None)
+            for rise, set_, ok in zip(sunrise.tolist(), sunset.tolist(), visible.tolist())
+        ]
+
+    results = []
+    for ordinal in ordinals:
+        midnight_ts = (ordinal - epoch_ordinal) * 86400
+        noon_ts = midnight_ts + (720 - 4 * longitude) * 60
+        century = (noon_ts / 86400 + _JULIAN_UNIX_EPOCH - 2451545.0) / 36525
+        declination, eq_of_time = _solar_terms(century, math)
+        cos_hour_angle = (cos_zenith / (math.cos(lat) * math.cos(declination))
+                          - math.tan(lat) * math.tan(declination))
+        if abs(cos_hour_angle) > 1:
+            results.append((None, None))
+            continue
+        hour_angle = math.degrees(math.acos(cos_hour_angle))
+        results.append((
+            midnight_ts + (720 - 4 * (longitude + hour_angle) - eq_of_time) * 60,
+            midnight_ts + (720 - 4 * (longitude - hour_angle) - eq_of_time) * 60,
+        ))
+    return results
+
+
+def sun_times_range(
+    latitude: float,
+    longitude: float,
+    start: datetime.date,
+    days: int
+) -> List[SunTimes]:
+    """Return (sunrise, sunset) timestamps for ``days`` dates from ``start``.
+
+    Cached dates are reused and the missing ones are computed in one
+    vectorized pass, then added to the LRU.
+    """
+    location = (round(latitude, 4), round(longitude, 4))
+    ordinals = [start.toordinal() + offset for offset in range(days)]
+
+    found: Dict[int, SunTimes] = {}
+    missing = []
+    with _cache_lock:
+        for ordinal in ordinals:
+            key = (*location, ordinal)
+            if key in _cache:
+                _cache.move_to_end(key)
+                found[ordinal] = _cache[key]
+            else:
+                missing.append(ordinal)
+
+    if missing:
+        # Computed outside the lock; a concurrent caller may store the same days
+        computed = _compute(latitude, longitude, missing)
+        with _cache_lock:
+            for ordinal, times in zip(missing, computed):
+                found[ordinal] = times
+                _cache[(*location, ordinal)] = times
+            while len(_cache) > SOLAR_CACHE_SIZE:
+                _cache.popitem(last=False)
+
+    return [found[ordinal] for ordinal in ordinals]
+
+
+def sun_times(latitude: float, longitude: float, day: datetime.date) -> SunTimes:
+    """Return the (sunrise, sunset) timestamps for one local date."""
+    return sun_times_range(latitude, longitude, day, 1)[0]
@@ -0,0 +1,114 @@
+"""Canonical per-station data store for Modern Tides."""
+import datetime
+import logging
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from .const import STORE_MEMORY_BUDGET
+from .envelope import TideEnvelope
+from .timeline import TideTimeline
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StationStore:
+    """Single copy of a station's tide data, with views for each consumer.
+
+    The raw API payloads are parsed once into compact timelines and then
+    dropped, so the store's size depends only on the number of points.
+    Sensors look the current height and next extremes up in ``timeline``
+    when they are read, renderers read ``render_payload()``.
+    """
+
+    __slots__ = (
+        "station_id",
+        "station_name",
+        "timeline",
+        "monthly",
+        "envelope",
+        "metadata",
+        "location",
+    )
+
+    def __init__(
+        self,
+        station_id: str,
+        station_name: str,
+        timeline: TideTimeline,
+        monthly: Optional[TideTimeline] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        location: Optional[Tuple[float, float]] = None,
+        envelope: Optional[TideEnvelope] = None,
+    ):
+        """Initialize the store."""
+        self.station_id = station_id
+        self.station_name = station_name
+        self.timeline = timeline
+        self.monthly = monthly
+        self.metadata = metadata or {}
+        self.location = location
+        self.envelope = envelope
+
+    @classmethod
+    def from_api(
+        cls,
+        station_id: str,
+        station_name: str,
+        all_daily_data: List[Dict[str, Any]],
+        monthly_data: Optional[Dict[str, Any]],
+        tz: datetime.tzinfo,
+        location: Optional[Tuple[float, float]] = None,
+        envelope: Optional[TideEnvelope] = None,
+    ) -> "StationStore":
+        """Build the store from the per-day and monthly API payloads.
+
+        ``location`` is the station's (latitude, longitude), used for
+        sunrise and sunset. ``envelope`` is the long-horizon envelope the
+        coordinator keeps across updates.
+        """
+        metadata = {}
+        if all_daily_data:
+            metadata = dict(all_daily_data[0]["data"].get("mareas", {}).get("metadatos", {}))
+
+        return cls(
+            station_id,
+            station_name,
+            TideTimeline.from_daily_data(all_daily_data, tz),
+            TideTimeline.from_monthly_events(monthly_data, tz) if monthly_data else None,
+            metadata,
+            location,
+            envelope,
+        )
+
+    def render_payload(self) -> Dict[str, Any]:
+        """Return the data the plot, table and calendar renderers need."""
+        return {
+            "timeline": self.timeline,
+            "location": self.location,
+            "monthly": self.monthly,
+            "envelope": self.envelope,
+        }
+
+    def memory_footprint(self) -> Dict[str, int]:
+        """Return the approximate bytes held by each part of the store."""
+        footprint = {
+            "timeline": self.timeline.memory_footprint(),
+            "monthly": self.monthly.memory_footprint() if self.monthly is not None else 0,
+            "envelope": self.envelope.memory_footprint() if self.envelope is not None else 0,
+            "metadata": sys.getsizeof(self.metadata) + sum(
+                sys.getsizeof(key) + sys.getsizeof(value) for key, value in self.metadata.items()
+            ),
+            "state": sys.getsizeof(self),
+        }
+        footprint["total"] = sum(footprint.values())
+        return footprint
+
+    def check_memory_budget(self) -> int:
+        """Log the store size, warning if it exceeds the per-station budget."""
+        total = self.memory_footprint()["total"]
+        if total > STORE_MEMORY_BUDGET:
+            _LOGGER.warning("Tide data for station %s uses %d bytes, above the %d byte budget",
+                            self.station_id, total, STORE_MEMORY_BUDGET)
+        else:
+            _LOGGER.debug("Tide data for station %s uses %d bytes", self.station_id, total)
+        return total
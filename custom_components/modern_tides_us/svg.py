@@ -0,0 +1,217 @@
+"""Minimal streaming SVG writer shared by the Modern Tides renderers."""
+import contextlib
+import gzip
+import io
+import os
+import tempfile
+from typing import Any, Dict, Iterable, Optional, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+
+# Suffix of precompressed siblings, as aiohttp's static file handler expects
+GZIP_SUFFIX = ".gz"
+
+# File mode of written artifacts, and the block size used to compare them
+ARTIFACT_MODE = 0o644
+COMPARE_CHUNK_SIZE = 64 * 1024
+
+# Font stack used for every label, applied once from the <style> block
+FONT_FAMILY = "'Courier New',Courier,monospace"
+
+# Decimal places kept for coordinates; a tenth of a pixel is invisible
+DEFAULT_PRECISION = 1
+
+
+def format_number(value: float, precision: int = DEFAULT_PRECISION) -> str:
+    """Format a number in its shortest form at ``precision`` decimals.
+
+    Trailing zeros and leading integer zeros are dropped, so ``15.0``
+    becomes ``15`` and ``-0.25`` at two decimals becomes ``-.25``.
+    """
+    text = repr(round(float(value), precision))
+    if text.endswith(".0"):
+        text = text[:-2]
+    if text.startswith("0."):
+        text = text[1:]
+    elif text.startswith("-0."):
+        text = "-" + text[2:]
+    return "0" if text == "-0" else text
+
+
+def format_numbers(values: Iterable[float], precision: int = DEFAULT_PRECISION) -> str:
+    """Format a run of numbers for path data with minimal separators.
+
+    A minus sign already separates two numbers, so no space precedes it.
+    """
+    return " ".join(format_number(value, precision) for value in values).replace(" -", "-")
+
+
+def _attributes(attrs: Optional[Dict[str, Any]], precision: int) -> str:
+    """Serialize attributes, dropping those whose value is None."""
+    if not attrs:
+        return ""
+    return "".join(
+        f" {name}={quoteattr(format_number(value, precision) if isinstance(value, float) else str(value))}"
+        for name, value in attrs.items() if value is not None
+    )
+
+
+class SvgWriter:
+    """Append SVG markup to a text stream without intermediate strings.
+
+    Elements are written compactly, with no indentation or newlines, and
+    float attributes are rounded to ``precision`` decimals. By default the
+    writer buffers into an ``io.StringIO``; pass an open file to stream
+    straight to disk.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, precision: int = DEFAULT_PRECISION):
+        """Initialize the writer."""
+        self._stream = stream if stream is not None else io.StringIO()
+        self._write = self._stream.write
+        self.precision = precision
+
+    def open(self, tag: str, attrs: Optional[Dict[str, Any]] = None) -> None:
+        """Write an opening tag."""
+        self._write(f"<{tag}{_attributes(attrs, self.precision)}>")
+
+    def close(self, tag: str) -> None:
+        """Write a closing tag."""
+        self._write(f"</{tag}>")
+
+    def element(
+        self,
+        tag: str,
+        attrs: Optional[Dict[str, Any]] = None,
+        text: Optional[str] = None
+    ) -> None:
+        """Write a complete element, self-closing when it has no text."""
+        if text is None:
+            self._write(f"<{tag}{_attributes(attrs, self.precision)}/>")
+        else:
+            self._write(f"<{tag}{_attributes(attrs, self.precision)}>{escape(text)}</{tag}>")
+
+    def raw(self, markup: str) -> None:
+        """Write pre-serialized markup as is."""
+        self._write(markup)
+
+    def getvalue(self) -> str:
+        """Return everything written so far (StringIO-backed writers only)."""
+        return self._stream.getvalue()
+
+
+def _temp_file(target: str):
+    """Open a binary temp file next to ``target`` so os.replace stays atomic."""
+    handle = tempfile.NamedTemporaryFile(
+        "wb", dir=os.path.dirname(target) or ".",
+        prefix=f".{os.path.basename(target)}.", suffix=".tmp", delete=False,
+    )
+    # Same permissions a plain open() would normally give
+    os.chmod(handle.name, ARTIFACT_MODE)
+    return handle
+
+
+def _has_contents(filename: str, data: bytes) -> bool:
+    """Return True if ``filename`` exists and holds exactly ``data``."""
+    try:
+        if os.path.getsize(filename) != len(data):
+            return False
+        with open(filename, "rb") as existing:
+            offset = 0
+            while True:
+                chunk = existing.read(COMPARE_CHUNK_SIZE)
+                if chunk != data[offset:offset + len(chunk)]:
+                    return False
+                if not chunk:
+                    return True
+                offset += len(chunk)
+    except FileNotFoundError:
+        return False
+
+
+def _replace_file(filename: str, data: bytes) -> None:
+    """Write ``data`` to a temp file and move it over ``filename``."""
+    handle = _temp_file(filename)
+    try:
+        with handle:
+            handle.write(data)
+        os.replace(handle.name, filename)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(handle.name)
+
+
+def _write_document(
+    writer: SvgWriter,
+    width: int,
+    height: int,
+    style: str,
+    body: str,
+    view_box: Optional[str] = None
+) -> None:
+    """Write the root element around a style block and body."""
+    writer.open("svg", {
+        "width": width, "height": height, "viewBox": view_box, "xmlns": SVG_NAMESPACE,
+    })
+    writer.raw(style)
+    writer.raw(body)
+    writer.close("svg")
+
+
+def svg_document(
+    width: int,
+    height: int,
+    style: str,
+    body: str,
+    view_box: Optional[str] = None
+) -> bytes:
+    """Return a complete SVG document as UTF-8 bytes.
+
+    ``view_box`` lets a body laid out at one size be served at another.
+    """
+    writer = SvgWriter()
+    _write_document(writer, width, height, style, body, view_box)
+    return writer.getvalue().encode("utf-8")
+
+
+def write_artifact(filename: str, document: bytes, precompress: bool = False) -> bool:
+    """Write a finished document to ``filename`` atomically.
+
+    The bytes go to a temp file that replaces the target with os.replace,
+    so readers never see a partial file; if they match the existing file
+    it is left untouched, keeping its mtime. With ``precompress`` a gzip
+    sibling (``<filename>.gz``) is kept in step; Home Assistant's static
+    file handler serves it to clients that accept gzip. Without it, any
+    stale sibling is removed so it cannot shadow the new file.
+
+    Returns True if the file on disk changed.
+    """
+    gz_filename = filename + GZIP_SUFFIX
+    changed = not _has_contents(filename, document)
+    if changed:
+        _replace_file(filename, document)
+
+    if precompress:
+        if changed or not os.path.exists(gz_filename):
+            # mtime=0 keeps the output identical for identical documents
+            _replace_file(gz_filename, gzip.compress(document, compresslevel=9, mtime=0))
+    else:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(gz_filename)
+
+    return changed
+
+
+def splice_overlay(document: bytes, overlay: str) -> bytes:
+    """Insert ``overlay`` markup just before the closing tag of ``document``.
+
+    Used at serve time to draw layers that change faster than the base
+    image, such as the now-marker.
+    """
+    if not overlay:
+        return document
+    end = document.rfind(b"</svg>")
+    if end < 0:
+        return document
+    return document[:end] + overlay.encode("utf-8") + document[end:]
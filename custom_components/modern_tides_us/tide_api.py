@@ -2,14 +2,16 @@
 import datetime
 import logging
 import traceback
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
 from .const import (
     API_PREDICTIONS, 
     API_HILO_PREDICTIONS, 
+    API_HOURLY_PREDICTIONS,
     API_STATION_LIST_URL,
+    API_STATION_METADATA_URL,
     DEFAULT_STATION_ID,
     DEFAULT_STATION_NAME
 )
@@ -60,6 +62,21 @@ class TideApiClient:
                 "puerto": DEFAULT_STATION_NAME
             }]
 
+    def get_station_location(self, station_id: str) -> Optional[Tuple[float, float]]:
+        """Get a station's (latitude, longitude) from the NOAA metadata API."""
+        try:
+            response = self.session.get(API_STATION_METADATA_URL.format(station_id=station_id), timeout=10)
+            response.raise_for_status()
+            stations = response.json().get("stations") or []
+            if stations:
+                return float(stations[0]["lat"]), float(stations[0]["lng"])
+
+            _LOGGER.warning("No metadata returned for NOAA station %s", station_id)
+            return None
+        except Exception as err:
+            _LOGGER.warning("Error fetching location of NOAA station %s: %s", station_id, err)
+            return None
+
     def get_daily_tides(self, station_id: str, date: Optional[str] = None) -> Dict[str, Any]:
         """Get tide predictions for a specific day from NOAA."""
         if date is None:
@@ -155,6 +172,38 @@ class TideApiClient:
             _LOGGER.debug("Failed monthly URL: %s", hilo_url)
             return {}
     
+    def get_range_predictions(self, station_id: str, begin_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """Get hourly and high/low predictions from NOAA for a range of days.
+
+        Dates are 'YYYYMMDD', both inclusive. Returns the raw NOAA points
+        (``{"t": "YYYY-MM-DD HH:MM", "v": "1.23", ...}``) of both series,
+        or an empty list on error.
+        """
+        urls = [
+            url.format(station_id=station_id, begin_date=begin_date, end_date=end_date)
+            for url in (API_HOURLY_PREDICTIONS, API_HILO_PREDICTIONS)
+        ]
+
+        predictions = []
+        try:
+            for url in urls:
+                _LOGGER.debug("Fetching NOAA predictions for station %s, %s to %s", station_id, begin_date, end_date)
+                response = self.session.get(url, timeout=20)
+                response.raise_for_status()
+                predictions.extend(response.json().get("predictions", []))
+        except requests.RequestException as err:
+            _LOGGER.error("Error fetching tide predictions from NOAA for station %s (%s to %s): %s",
+                          station_id, begin_date, end_date, err)
+            return []
+        except ValueError as err:
+            _LOGGER.error("Invalid tide predictions from NOAA for station %s (%s to %s): %s",
+                          station_id, begin_date, end_date, err)
+            return []
+
+        _LOGGER.debug("NOAA API returned %d hourly and high/low points for station %s",
+                      len(predictions), station_id)
+        return predictions
+
     def _convert_noaa_to_legacy_format(self, predictions_data: Dict, hilo_data: Dict, station_id: str, date: datetime.datetime) -> Dict[str, Any]:
         """Convert NOAA API response to format expected by existing Modern Tides code."""
         try:
@@ -163,8 +212,9 @@ class TideApiClient:
             if "predictions" in predictions_data:
                 for pred in predictions_data["predictions"]:
                     # NOAA format: {"t": "2024-01-01 00:00", "v": "2.45"}
-                    time_str = pred["t"].split()[1]  # Extract time part (HH:MM)
+                    date_str, time_str = pred["t"].split()[:2]  # Date (YYYY-MM-DD) and time (HH:MM)
                     marea_points.append({
+                        "fecha": date_str,
                         "hora": time_str,
                         "altura": pred["v"]
                     })
@@ -176,30 +226,32 @@ class TideApiClient:
             if "predictions" in hilo_data:
                 for pred in hilo_data["predictions"]:
                     tide_type = pred.get("type", "").upper()
-                    time_str = pred["t"].split()[1]
+                    date_str, time_str = pred["t"].split()[:2]
                     # Use lowercase for compatibility with existing code
                     tipo = "pleamar" if tide_type == "H" else "bajamar"
                     
                     # Add to combined points with type info
                     combined_points.append({
+                        "fecha": date_str,
                         "hora": time_str,
                         "altura": pred["v"],
                         "tipo": tipo
                     })
                     
                     high_low_events.append({
+                        "fecha": date_str,
                         "hora": time_str,
                         "altura": pred["v"],
                         "tipo": tipo
                     })
             
-            # Sort combined points by time for consistency
+            # Sort combined points by date and time for consistency
             def sort_key(point):
                 try:
                     hour, minute = point["hora"].split(":")
-                    return int(hour) * 60 + int(minute)
+                    return (point.get("fecha", ""), int(hour) * 60 + int(minute))
                 except:
-                    return 0
+                    return ("", 0)
             
             combined_points.sort(key=sort_key)
             
@@ -0,0 +1,414 @@
+"""Sorted tide timeline with logarithmic-time lookups for Modern Tides."""
+import bisect
+import datetime
+import hashlib
+import logging
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# Extreme types as produced by the API client
+TIDE_HIGH = "pleamar"
+TIDE_LOW = "bajamar"
+
+_KIND_ALIASES = {
+    "high": TIDE_HIGH,
+    "low": TIDE_LOW,
+    TIDE_HIGH: TIDE_HIGH,
+    TIDE_LOW: TIDE_LOW,
+}
+
+
+def _normalize_kind(kind: Optional[str]) -> Optional[str]:
+    """Map 'high'/'low' (or the API names) to the API extreme type."""
+    if kind is None:
+        return None
+    try:
+        return _KIND_ALIASES[kind.lower()]
+    except KeyError as err:
+        raise ValueError(f"Unknown tide extreme kind: {kind}") from err
+
+
+class TideTimeline:
+    """Time-sorted tide series and extremes spanning every fetched day.
+
+    Times are stored as POSIX timestamps in flat arrays so that lookups are
+    binary searches instead of linear scans over lists of dicts.
+    """
+
+    def __init__(
+        self,
+        times: Iterable[float],
+        heights: Iterable[float],
+        extreme_times: Iterable[float],
+        extreme_heights: Iterable[float],
+        extreme_types: Iterable[str],
+        tz: datetime.tzinfo,
+        days: Iterable[str] = (),
+    ):
+        """Initialize the timeline from already sorted, deduplicated series.
+
+        ``days`` lists the fetched dates ('YYYYMMDD') in order; day windows
+        are measured from the first of them.
+        """
+        self._times = array("d", times)
+        self._heights = array("d", heights)
+        self._ext_times = array("d", extreme_times)
+        self._ext_heights = array("d", extreme_heights)
+        self._ext_types = tuple(extreme_types)
+        self._tz = tz
+        self._days = tuple(days)
+        self._fingerprint: Optional[str] = None
+        # Extreme dicts, built once and shared by every view
+        self._ext_records: Optional[Tuple[Dict[str, Any], ...]] = None
+
+        # Per-kind index of extremes so next_extreme() never scans
+        self._ext_by_kind: Dict[str, array] = {TIDE_HIGH: array("l"), TIDE_LOW: array("l")}
+        self._ext_times_by_kind: Dict[str, array] = {TIDE_HIGH: array("d"), TIDE_LOW: array("d")}
+        for idx, tide_type in enumerate(self._ext_types):
+            if tide_type in self._ext_by_kind:
+                self._ext_by_kind[tide_type].append(idx)
+                self._ext_times_by_kind[tide_type].append(self._ext_times[idx])
+
+    @classmethod
+    def from_daily_data(
+        cls, all_daily_data: List[Dict[str, Any]], tz: datetime.tzinfo
+    ) -> "TideTimeline":
+        """Build a timeline from the per-day API payloads.
+
+        Each entry is ``{'date': 'YYYYMMDD', 'data': <converted payload>}``.
+        Points carry local ``hora`` times; an optional ``fecha`` overrides the
+        day they belong to. Duplicate timestamps keep the first value seen.
+        """
+        series: Dict[float, float] = {}
+        extremes: Dict[float, Any] = {}
+        days: List[str] = []
+
+        for day_info in all_daily_data or []:
+            day_data = day_info.get("data") or {}
+            try:
+                day_date = datetime.datetime.strptime(day_info["date"], "%Y%m%d").date()
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.debug("Skipping day without a valid date: %s", day_info.get("date"))
+                continue
+            days.append(day_info["date"])
+
+            marea = day_data.get("mareas", {}).get("datos", {}).get("marea", [])
+            for point in marea:
+                if "hora" not in point or "altura" not in point:
+                    continue
+                try:
+                    point_date = day_date
+                    if point.get("fecha"):
+                        point_date = datetime.datetime.strptime(point["fecha"], "%Y-%m-%d").date()
+                    hours, minutes = point["hora"].split(":")[:2]
+                    local_time = datetime.datetime(
+                        point_date.year, point_date.month, point_date.day,
+                        int(hours), int(minutes), tzinfo=tz
+                    )
+                    timestamp = local_time.timestamp()
+                    height = float(point["altura"])
+                except (ValueError, TypeError, AttributeError) as e:
+                    _LOGGER.debug("Skipping invalid tide point %s: %s", point, e)
+                    continue
+
+                series.setdefault(timestamp, height)
+                if point.get("tipo") in (TIDE_HIGH, TIDE_LOW):
+                    extremes.setdefault(timestamp, (height, point["tipo"]))
+
+        times = sorted(series)
+        ext_times = sorted(extremes)
+        return cls(
+            times,
+            (series[t] for t in times),
+            ext_times,
+            (extremes[t][0] for t in ext_times),
+            (extremes[t][1] for t in ext_times),
+            tz,
+            days,
+        )
+
+    @classmethod
+    def from_monthly_events(
+        cls, monthly_data: Dict[str, Any], tz: datetime.tzinfo
+    ) -> "TideTimeline":
+        """Build an extremes-only timeline from the monthly high/low payload.
+
+        Events look like ``{'datetime': 'YYYY-MM-DD HH:MM', 'altura': ...,
+        'tipo': 'PLEAMAR'|'BAJAMAR'}``.
+        """
+        extremes: Dict[float, Any] = {}
+        for event in (monthly_data or {}).get("monthly_events", []):
+            try:
+                local_time = datetime.datetime.strptime(event["datetime"], "%Y-%m-%d %H:%M")
+                timestamp = local_time.replace(tzinfo=tz).timestamp()
+                tide_type = _normalize_kind(event["tipo"])
+                extremes.setdefault(timestamp, (float(event["altura"]), tide_type))
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                _LOGGER.debug("Skipping invalid monthly event %s: %s", event, e)
+
+        ext_times = sorted(extremes)
+        return cls(
+            (),
+            (),
+            ext_times,
+            (extremes[t][0] for t in ext_times),
+            (extremes[t][1] for t in ext_times),
+            tz,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of points in the series."""
+        return len(self._times)
+
+    @property
+    def extreme_count(self) -> int:
+        """Return the number of high/low extremes."""
+        return len(self._ext_times)
+
+    def memory_footprint(self) -> int:
+        """Return the approximate number of bytes held by this timeline."""
+        arrays = (
+            self._times, self._heights, self._ext_times, self._ext_heights,
+            *self._ext_by_kind.values(), *self._ext_times_by_kind.values(),
+        )
+        return (
+            sys.getsizeof(self)
+            + sum(sys.getsizeof(values) for values in arrays)
+            + sys.getsizeof(self._ext_types)
+            + sys.getsizeof(self._days)
+            + sum(sys.getsizeof(day) for day in self._days)
+        )
+
+    @property
+    def tz(self) -> datetime.tzinfo:
+        """Return the time zone used for returned datetimes."""
+        return self._tz
+
+    @property
+    def days(self) -> Tuple[str, ...]:
+        """Return the fetched dates ('YYYYMMDD') in order."""
+        return self._days
+
+    @property
+    def start(self) -> Optional[datetime.datetime]:
+        """Return the time of the first point."""
+        return self._to_datetime(self._times[0]) if self._times else None
+
+    @property
+    def end(self) -> Optional[datetime.datetime]:
+        """Return the time of the last point."""
+        return self._to_datetime(self._times[-1]) if self._times else None
+
+    @property
+    def fingerprint(self) -> str:
+        """Return a content hash of the series and extremes."""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(self._times.tobytes())
+            digest.update(self._heights.tobytes())
+            digest.update(self._ext_times.tobytes())
+            digest.update(self._ext_heights.tobytes())
+            digest.update("|".join(self._ext_types).encode())
+            digest.update(str(self._tz).encode())
+            digest.update("|".join(self._days).encode())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def _to_datetime(self, timestamp: float) -> datetime.datetime:
+        """Convert a stored timestamp to a local aware datetime."""
+        return datetime.datetime.fromtimestamp(timestamp, self._tz)
+
+    def _extreme(self, idx: int) -> Dict[str, Any]:
+        """Return extreme ``idx`` in the dict shape used by the renderers."""
+        return {
+            "time": self._to_datetime(self._ext_times[idx]),
+            "height": self._ext_heights[idx],
+            "type": self._ext_types[idx],
+        }
+
+    def _extreme_records(self) -> Tuple[Dict[str, Any], ...]:
+        """Return every extreme as a renderer dict, built on first use.
+
+        The dicts are shared by all views of this timeline, so every table
+        and plot slices the same records; callers must not modify them.
+        """
+        if self._ext_records is None:
+            self._ext_records = tuple(self._extreme(idx) for idx in range(len(self._ext_times)))
+        return self._ext_records
+
+    def height_at(self, when: datetime.datetime, clamp: bool = False) -> Optional[float]:
+        """Return the linearly interpolated height at ``when``.
+
+        Outside the series this returns None, or the nearest endpoint height
+        when ``clamp`` is set.
+        """
+        times = self._times
+        if not times:
+            return None
+
+        ts = when.timestamp()
+        idx = bisect.bisect_right(times, ts)
+        if idx == 0 or idx == len(times):
+            if idx == len(times) and ts == times[-1]:
+                return self._heights[-1]
+            if not clamp:
+                return None
+            return self._heights[0] if idx == 0 else self._heights[-1]
+
+        t1, t2 = times[idx - 1], times[idx]
+        h1, h2 = self._heights[idx - 1], self._heights[idx]
+        if t2 == t1:
+            return h1
+        return h1 + (h2 - h1) * (ts - t1) / (t2 - t1)
+
+    def next_extreme(
+        self, when: datetime.datetime, kind: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the first extreme at or after ``when``, optionally of ``kind``.
+
+        ``kind`` is 'high'/'low' (or 'pleamar'/'bajamar'); None matches both.
+        """
+        kind = _normalize_kind(kind)
+        ts = when.timestamp()
+
+        if kind is None:
+            idx = bisect.bisect_left(self._ext_times, ts)
+            return self._extreme(idx) if idx < len(self._ext_times) else None
+
+        kind_times = self._ext_times_by_kind[kind]
+        pos = bisect.bisect_left(kind_times, ts)
+        if pos >= len(kind_times):
+            return None
+        return self._extreme(self._ext_by_kind[kind][pos])
+
+    def extremes_between(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> List[Dict[str, Any]]:
+        """Return all extremes with ``start <= time <= end`` in time order."""
+        lo = bisect.bisect_left(self._ext_times, start.timestamp())
+        hi = bisect.bisect_right(self._ext_times, end.timestamp())
+        return [self._extreme(idx) for idx in range(lo, hi)]
+
+    def points_between(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> List[Dict[str, Any]]:
+        """Return series points with ``start <= time <= end`` as dicts."""
+        lo = bisect.bisect_left(self._times, start.timestamp())
+        hi = bisect.bisect_right(self._times, end.timestamp())
+        return [
+            {"time": self._to_datetime(self._times[idx]), "height": self._heights[idx]}
+            for idx in range(lo, hi)
+        ]
+
+    def window(self, start: datetime.datetime, end: datetime.datetime) -> "TimelineView":
+        """Return a view of the points and extremes with ``start <= time <= end``."""
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        return TimelineView(
+            self,
+            bisect.bisect_left(self._times, start_ts),
+            bisect.bisect_right(self._times, end_ts),
+            bisect.bisect_left(self._ext_times, start_ts),
+            bisect.bisect_right(self._ext_times, end_ts),
+        )
+
+    def day_window(self, days: int) -> "TimelineView":
+        """Return a view of the first ``days`` fetched days, midnight to midnight."""
+        if not self._days:
+            return TimelineView(self, 0, 0, 0, 0)
+        first_day = datetime.datetime.strptime(self._days[0], "%Y%m%d")
+        start = first_day.replace(tzinfo=self._tz)
+        return self.window(start, start + datetime.timedelta(days=days))
+
+
+class TimelineView:
+    """Read-only window onto a TideTimeline.
+
+    Views hold index bounds into the parent's arrays; ``times`` and
+    ``heights`` are zero-copy read-only memoryview slices.
+    """
+
+    __slots__ = ("_timeline", "_lo", "_hi", "_ext_lo", "_ext_hi")
+
+    def __init__(self, timeline: TideTimeline, lo: int, hi: int, ext_lo: int, ext_hi: int):
+        """Initialize the view."""
+        self._timeline = timeline
+        self._lo = lo
+        self._hi = max(lo, hi)
+        self._ext_lo = ext_lo
+        self._ext_hi = max(ext_lo, ext_hi)
+
+    def __len__(self) -> int:
+        """Return the number of points in the view."""
+        return self._hi - self._lo
+
+    @property
+    def timeline(self) -> TideTimeline:
+        """Return the timeline this view belongs to."""
+        return self._timeline
+
+    @property
+    def times(self) -> memoryview:
+        """Return point timestamps (POSIX seconds)."""
+        return memoryview(self._timeline._times).toreadonly()[self._lo:self._hi]
+
+    @property
+    def heights(self) -> memoryview:
+        """Return point heights."""
+        return memoryview(self._timeline._heights).toreadonly()[self._lo:self._hi]
+
+    @property
+    def start(self) -> Optional[datetime.datetime]:
+        """Return the time of the first point in the view."""
+        return self._timeline._to_datetime(self._timeline._times[self._lo]) if len(self) else None
+
+    @property
+    def end(self) -> Optional[datetime.datetime]:
+        """Return the time of the last point in the view."""
+        return self._timeline._to_datetime(self._timeline._times[self._hi - 1]) if len(self) else None
+
+    @property
+    def extreme_count(self) -> int:
+        """Return the number of extremes inside the view."""
+        return self._ext_hi - self._ext_lo
+
+    @property
+    def extreme_times(self) -> memoryview:
+        """Return extreme timestamps (POSIX seconds)."""
+        return memoryview(self._timeline._ext_times).toreadonly()[self._ext_lo:self._ext_hi]
+
+    @property
+    def extreme_heights(self) -> memoryview:
+        """Return extreme heights."""
+        return memoryview(self._timeline._ext_heights).toreadonly()[self._ext_lo:self._ext_hi]
+
+    @property
+    def extreme_types(self) -> Tuple[str, ...]:
+        """Return extreme types (TIDE_HIGH or TIDE_LOW)."""
+        return self._timeline._ext_types[self._ext_lo:self._ext_hi]
+
+    @property
+    def extremes(self) -> List[Dict[str, Any]]:
+        """Return the extremes inside the view in time order."""
+        return list(self._timeline._extreme_records()[self._ext_lo:self._ext_hi])
+
+    def upcoming_extremes(self, when: datetime.datetime) -> List[Dict[str, Any]]:
+        """Return the extremes inside the view at or after ``when``.
+
+        The cutoff is a binary search within the view's bounds.
+        """
+        start = bisect.bisect_left(
+            self._timeline._ext_times, when.timestamp(), self._ext_lo, self._ext_hi
+        )
+        return list(self._timeline._extreme_records()[start:self._ext_hi])
+
+    def height_at(self, when: datetime.datetime) -> Optional[float]:
+        """Return the interpolated height at ``when``, or None outside the view."""
+        if not len(self):
+            return None
+        ts = when.timestamp()
+        if not self._timeline._times[self._lo] <= ts <= self._timeline._times[self._hi - 1]:
+            return None
+        return self._timeline.height_at(when)
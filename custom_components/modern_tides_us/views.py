@@ -0,0 +1,224 @@
+"""HTTP views for Modern Tides."""
+import datetime
+import logging
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Any, Optional, Tuple
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .artifacts import content_etag
+from .const import (
+    DOMAIN,
+    IMAGE_CACHE_SIZE,
+    IMAGE_IMMUTABLE_MAX_AGE,
+    IMAGE_URL,
+    SERIES_CACHE_SIZE,
+    SERIES_MAX_AGE,
+    SERIES_URL,
+)
+from .series import SERIES_ENCODERS, SERIES_FORMAT_JSON, SERIES_FORMATS
+from .timeline import TideTimeline, TimelineView
+
+_LOGGER = logging.getLogger(__name__)
+
+# Content type of the rendered artifacts; PNG rasters are only made for cameras
+IMAGE_CONTENT_TYPE = "image/svg+xml"
+
+
+def find_coordinator(hass: HomeAssistant, station_id: str) -> Optional[Any]:
+    """Return the coordinator of ``station_id`` from any config entry."""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if isinstance(entry_data, dict) and station_id in entry_data.get("coordinators", {}):
+            return entry_data["coordinators"][station_id]
+    return None
+
+
+def etag_matches(request: web.Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match names ``etag``."""
+    header = request.headers.get(hdrs.IF_NONE_MATCH)
+    if not header:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in header.split(","))
+
+
+def _parse_time(value: str) -> datetime.datetime:
+    """Parse an ISO 8601 time, taken as local if it has no offset."""
+    parsed = dt_util.parse_datetime(value)
+    if parsed is None:
+        raise ValueError(f"Invalid time: {value}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return parsed
+
+
+def _requested_view(
+    timeline: TideTimeline, query: Any
+) -> Tuple[Tuple[Any, ...], TimelineView]:
+    """Return (cache key, view) for the range in ``query``.
+
+    ``days`` selects whole days from the first fetched one; ``start`` and
+    ``end`` (ISO 8601) an explicit range, each defaulting to the end of
+    the timeline. Raises ValueError for an invalid range.
+    """
+    if "days" in query:
+        days = int(query["days"])
+        if not 1 <= days <= len(timeline.days):
+            raise ValueError(f"days must be between 1 and {len(timeline.days)}")
+        return ("days", days), timeline.day_window(days)
+
+    start = _parse_time(query["start"]) if "start" in query else timeline.start
+    end = _parse_time(query["end"]) if "end" in query else timeline.end
+    if start > end:
+        raise ValueError("start must not be after end")
+    return ("range", start.timestamp(), end.timestamp()), timeline.window(start, end)
+
+
+class TideSeriesView(HomeAssistantView):
+    """Serve a station's prepared timeline for client-side rendering.
+
+    ``GET /api/modern_tides_us/series/<station_id>?format=json|binary``
+    with an optional ``days`` or ``start``/``end`` range. Encoded bodies
+    are cached per timeline fingerprint, so repeated requests only serve
+    bytes; the ETag is the body's content hash and a matching
+    If-None-Match gets 304.
+    """
+
+    url = SERIES_URL
+    name = "api:modern_tides_us:series"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the view."""
+        self._hass = hass
+        # (station, fingerprint, range, format) -> (etag, body)
+        self._cache: "OrderedDict[Tuple[Any, ...], Tuple[str, bytes]]" = OrderedDict()
+
+    async def get(self, request: web.Request, station_id: str) -> web.Response:
+        """Return the encoded series of ``station_id``."""
+        coordinator = find_coordinator(self._hass, station_id)
+        if coordinator is None or coordinator.data is None:
+            return self.json_message("Unknown station", HTTPStatus.NOT_FOUND)
+
+        series_format = request.query.get("format", SERIES_FORMAT_JSON)
+        if series_format not in SERIES_ENCODERS:
+            return self.json_message(
+                f"format must be one of {', '.join(SERIES_ENCODERS)}", HTTPStatus.BAD_REQUEST
+            )
+
+        timeline = coordinator.data.timeline
+        if not len(timeline):
+            return self.json_message("No tide data", HTTPStatus.NOT_FOUND)
+        try:
+            range_key, view = _requested_view(timeline, request.query)
+        except ValueError as err:
+            return self.json_message(str(err), HTTPStatus.BAD_REQUEST)
+
+        key = (station_id, timeline.fingerprint, range_key, series_format)
+        cached = self._cache.get(key)
+        if cached is None:
+            body = await self._hass.async_add_executor_job(SERIES_ENCODERS[series_format], view)
+            cached = (content_etag(body), body)
+            self._cache[key] = cached
+            while len(self._cache) > SERIES_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            _LOGGER.debug("Encoded %s series for station %s (%d bytes)",
+                          series_format, station_id, len(body))
+        else:
+            self._cache.move_to_end(key)
+
+        etag, body = cached
+        headers = {
+            hdrs.ETAG: etag,
+            hdrs.CACHE_CONTROL: f"private, max-age={SERIES_MAX_AGE}",
+        }
+        if etag_matches(request, etag):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        return web.Response(body=body, content_type=SERIES_FORMATS[series_format], headers=headers)
+
+
+class TideImageView(HomeAssistantView):
+    """Serve a station's rendered images with conditional responses.
+
+    ``GET /api/modern_tides_us/image/<station_id>/<file name>`` serves one
+    of the station's artifacts, named like its file in ``www``, from the
+    render engine's registry. Plots get their now-marker spliced in for
+    the current minute, cached per base image and minute. The ETag is the
+    hash of the served document and Last-Modified the time it last
+    changed. Matching If-None-Match or If-Modified-Since headers get 304.
+    Adding ``?v=<hash>`` makes the URL immutable: with the current hash it
+    is cached privately for a year. Plain URLs are revalidated on every
+    use and point at their immutable form with Content-Location.
+
+    Requests must be authenticated like any other API call; plain <img>
+    tags can use the camera proxy or a path signed with async_sign_path.
+    """
+
+    url = IMAGE_URL
+    name = "api:modern_tides_us:image"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the view."""
+        self._hass = hass
+        # (registry key, base etag, minute) -> (etag, body, last modified)
+        self._cache: "OrderedDict[Tuple[Any, ...], Tuple[str, bytes, float]]" = OrderedDict()
+
+    def _served_image(self, coordinator: Any, key: Tuple[Any, ...], artifact: Any) -> Tuple[str, bytes, float]:
+        """Return (etag, body, last modified) of an artifact as served now."""
+        minute = dt_util.now().replace(second=0, microsecond=0)
+        cache_key = (key, artifact.etag, minute)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+
+        body = coordinator.compose_artifact(key, artifact.body, minute)
+        if body is artifact.body:
+            cached = (artifact.etag, body, artifact.rendered_at)
+        else:
+            cached = (content_etag(body), body, max(artifact.rendered_at, minute.timestamp()))
+        self._cache[cache_key] = cached
+        while len(self._cache) > IMAGE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return cached
+
+    async def get(self, request: web.Request, station_id: str, filename: str) -> web.Response:
+        """Return the image ``filename`` of ``station_id``."""
+        coordinator = find_coordinator(self._hass, station_id)
+        key = coordinator.artifact_names().get(filename) if coordinator is not None else None
+        artifact = coordinator.render_engine.registry.get(key) if key is not None else None
+        if artifact is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        etag, body, last_modified = self._served_image(coordinator, key, artifact)
+        version = etag.strip('"')
+        if request.query.get("v") == version:
+            cache_control = f"private, max-age={IMAGE_IMMUTABLE_MAX_AGE}, immutable"
+        else:
+            cache_control = "private, no-cache"
+        headers = {
+            hdrs.ETAG: etag,
+            hdrs.CACHE_CONTROL: cache_control,
+            hdrs.CONTENT_LOCATION: f"{request.path}?v={version}",
+        }
+
+        # If-None-Match takes precedence; HTTP dates have whole seconds
+        if hdrs.IF_NONE_MATCH in request.headers:
+            not_modified = etag_matches(request, etag)
+        else:
+            since = request.if_modified_since
+            not_modified = since is not None and int(last_modified) <= since.timestamp()
+
+        response = web.Response(
+            status=HTTPStatus.NOT_MODIFIED if not_modified else HTTPStatus.OK,
+            body=None if not_modified else body,
+            content_type=None if not_modified else IMAGE_CONTENT_TYPE,
+            headers=headers,
+        )
+        response.last_modified = last_modified
+        return response
@@ -0,0 +1,31 @@
+"""Start-up of Modern Tides render worker processes.
+
+This module only imports the standard library. The render engine runs it
+by path in each spawned worker, before anything is unpickled, so it must
+not depend on the package being importable.
+"""
+import importlib
+import sys
+import types
+from typing import Optional
+
+# run_name the render engine executes this file under
+WORKER_RUN_NAME = "__modern_tides_worker__"
+
+
+def _bootstrap_worker(package: str, package_dir: str, time_zone: Optional[str]) -> None:
+    """Make ``package``'s rendering modules importable without its __init__.
+
+    Importing the package normally runs its __init__, which pulls in all
+    of Home Assistant; registering a bare package module first makes the
+    worker import only the modules it unpickles.
+    """
+    module = types.ModuleType(package)
+    module.__path__ = [package_dir]
+    sys.modules.setdefault(package, module)
+    if time_zone:
+        importlib.import_module(f"{package}.render_engine")._init_worker(time_zone)
+
+
+if __name__ == WORKER_RUN_NAME:
+    _bootstrap_worker(**globals()["BOOTSTRAP_ARGS"])
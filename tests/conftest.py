@@ -0,0 +1,17 @@
+"""Test setup for the Modern Tides pure modules.
+
+The package __init__ imports Home Assistant. Registering a bare package
+module first, as render workers do, lets the tests import the rendering
+and data modules on their own.
+"""
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "custom_components.modern_tides_us"
+
+sys.path.insert(0, ROOT)
+_package = types.ModuleType(PACKAGE)
+_package.__path__ = [os.path.join(ROOT, "custom_components", "modern_tides_us")]
+sys.modules.setdefault(PACKAGE, _package)
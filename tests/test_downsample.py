@@ -0,0 +1,55 @@
+"""Tests for the shape-preserving curve downsampling."""
+import math
+
+from custom_components.modern_tides_us.downsample import downsample_curve
+
+
+def _curve(count=2000, period=745.0):
+    """Return a sampled sine with a period of ``period`` samples."""
+    times = [float(i) for i in range(count)]
+    heights = [math.sin(2 * math.pi * t / period) for t in times]
+    return times, heights
+
+
+def test_small_curves_are_returned_unchanged():
+    times, heights = [0.0, 1.0, 2.0], [0.5, 1.0, 0.5]
+    assert downsample_curve(times, heights, 800) == (times, heights)
+
+
+def test_reduces_to_the_pixel_budget():
+    times, heights = _curve()
+    out_times, out_heights = downsample_curve(times, heights, 400)
+
+    assert len(out_times) == len(out_heights)
+    # Two pixels per point, with a little slack for the segment end points
+    assert len(out_times) <= 400 // 2 + 2
+    assert out_times[0] == times[0]
+    assert out_times[-1] == times[-1]
+    assert out_times == sorted(out_times)
+
+
+def test_lttb_keeps_the_extremes():
+    times, heights = _curve()
+    heights[333] = 3.0
+    heights[1337] = -3.0
+    out_times, out_heights = downsample_curve(times, heights, 200)
+
+    # Single-sample extremes survive without anchors, unlike a fixed stride
+    assert 333.0 in out_times and max(out_heights) == 3.0
+    assert 1337.0 in out_times and min(out_heights) == -3.0
+
+
+def test_anchors_are_kept_exactly():
+    times, heights = _curve()
+    anchors = [(186.25, 1.0), (558.75, -1.0), (1000.0, 0.42)]
+    out_times, out_heights = downsample_curve(times, heights, 100, anchors)
+
+    points = dict(zip(out_times, out_heights))
+    for anchor_ts, anchor_height in anchors:
+        assert points[anchor_ts] == anchor_height
+
+
+def test_anchors_outside_the_curve_are_ignored():
+    times, heights = _curve(count=50)
+    out_times, _ = downsample_curve(times, heights, 800, [(-10.0, 1.0), (100.0, 1.0)])
+    assert out_times == times
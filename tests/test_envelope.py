@@ -0,0 +1,171 @@
+"""Tests for the multi-resolution tide envelope."""
+import datetime
+import math
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.modern_tides_us.envelope import (
+    ENVELOPE_BIN_SECONDS,
+    ENVELOPE_LEVELS,
+    TideEnvelope,
+)
+
+TZ = ZoneInfo("America/New_York")
+HOUR = 3600
+
+
+def _midnight(year, month, day):
+    return datetime.datetime(year, month, day, tzinfo=TZ).timestamp()
+
+
+def _samples(start_ts, hours, step=900):
+    """Return a semidiurnal tide sampled every ``step`` seconds."""
+    times = [start_ts + i * step for i in range(int(hours * HOUR / step))]
+    heights = [1.5 + 1.2 * math.sin(2 * math.pi * t / (12.42 * HOUR)) for t in times]
+    return times, heights
+
+
+def _filled(values):
+    return [value for value in values if value == value]
+
+
+def _assert_levels_consistent(envelope):
+    """Every coarser level must equal the min/max of its finest bins."""
+    base_mins, base_maxs = envelope._mins[0], envelope._maxs[0]
+    for level, factor in enumerate(ENVELOPE_LEVELS[1:], 1):
+        mins, maxs = envelope._mins[level], envelope._maxs[level]
+        assert len(mins) == -(-len(base_mins) // factor)
+        for idx in range(len(mins)):
+            chunk_mins = _filled(base_mins[idx * factor:(idx + 1) * factor])
+            chunk_maxs = _filled(base_maxs[idx * factor:(idx + 1) * factor])
+            if chunk_mins:
+                assert mins[idx] == min(chunk_mins)
+                assert maxs[idx] == max(chunk_maxs)
+            else:
+                assert mins[idx] != mins[idx]
+
+
+def _bins_by_time(envelope):
+    """Return {bin start: (min, max)} for the finest level."""
+    return {
+        envelope.origin + idx * ENVELOPE_BIN_SECONDS: (low, high)
+        for idx, (low, high) in enumerate(zip(envelope._mins[0], envelope._maxs[0]))
+        if low == low
+    }
+
+
+@pytest.fixture
+def envelope():
+    """Ten days of samples from local midnight on 2026-04-05."""
+    envelope = TideEnvelope()
+    envelope.start_at(_midnight(2026, 4, 5), TZ)
+    envelope.add(*_samples(_midnight(2026, 4, 5), 240))
+    return envelope
+
+
+def test_add_bins_samples_hourly(envelope):
+    times, heights = _samples(_midnight(2026, 4, 5), 240)
+
+    assert len(envelope) == 240
+    first_hour = heights[:HOUR // 900]
+    assert envelope._mins[0][0] == min(first_hour)
+    assert envelope._maxs[0][0] == max(first_hour)
+    _assert_levels_consistent(envelope)
+
+
+def test_add_only_touches_new_bins(envelope):
+    before = envelope.fingerprint
+    touched = envelope.add(*_samples(_midnight(2026, 4, 15), 2))
+
+    assert touched == 2
+    assert len(envelope) == 242
+    assert envelope.fingerprint != before
+    _assert_levels_consistent(envelope)
+
+
+def test_samples_before_the_origin_are_ignored(envelope):
+    assert envelope.add([_midnight(2026, 4, 4)], [9.0]) == 0
+    assert max(_filled(envelope._maxs[0])) < 9.0
+
+
+def test_copy_is_independent(envelope):
+    copy = envelope.copy()
+    copy.add(*_samples(_midnight(2026, 4, 15), 24))
+    copy.start_at(_midnight(2026, 4, 7), TZ)
+
+    assert len(envelope) == 240
+    assert envelope.origin == _midnight(2026, 4, 5)
+    assert copy.fingerprint != envelope.fingerprint
+
+
+def test_start_at_the_same_day_keeps_everything(envelope):
+    envelope.start_at(_midnight(2026, 4, 5) + 20 * HOUR, TZ)
+    assert envelope.origin == _midnight(2026, 4, 5)
+    assert len(envelope) == 240
+
+
+def test_start_at_drops_whole_days(envelope):
+    envelope.start_at(_midnight(2026, 4, 7) + 9 * HOUR, TZ)
+
+    assert envelope.origin == _midnight(2026, 4, 7)
+    assert len(envelope) == 240 - 48
+    _assert_levels_consistent(envelope)
+
+
+@pytest.mark.parametrize("start, days, new_start", [
+    # 2026-03-08 is 23 hours long in New York
+    ((2026, 3, 7), 4, (2026, 3, 9)),
+    # 2026-11-01 is 25 hours long
+    ((2026, 10, 31), 4, (2026, 11, 2)),
+])
+def test_start_at_across_a_dst_change(start, days, new_start):
+    envelope = TideEnvelope()
+    envelope.start_at(_midnight(*start), TZ)
+    envelope.add(*_samples(_midnight(*start), days * 24 + 1))
+    kept = {ts: bins for ts, bins in _bins_by_time(envelope).items() if ts >= _midnight(*new_start)}
+
+    envelope.start_at(_midnight(*new_start) + 6 * HOUR, TZ)
+
+    # The origin lands on local midnight, so the dropped hours are 47 or 49
+    assert envelope.origin == _midnight(*new_start)
+    assert _bins_by_time(envelope) == kept
+    _assert_levels_consistent(envelope)
+
+
+def test_columns_respect_the_budget(envelope):
+    start, end = _midnight(2026, 4, 5), _midnight(2026, 4, 15)
+    for max_columns in (500, 100, 30, 5):
+        times, mins, maxs = envelope.columns(start, end, max_columns)
+        # The coarsest level is the floor, one column per day
+        assert 0 < len(times) <= max(max_columns, math.ceil((end - start) / (ENVELOPE_LEVELS[-1] * HOUR)))
+        assert len(times) == len(mins) == len(maxs)
+        assert all(start <= t <= end for t in times)
+        assert all(low <= high for low, high in zip(mins, maxs))
+
+
+def test_columns_take_the_window_around_each_bin(envelope):
+    start, end = _midnight(2026, 4, 5), _midnight(2026, 4, 15)
+    times, mins, maxs = envelope.columns(start, end, 1000, window=5 * HOUR)
+
+    # Finest level: one column per hour, each over the two bins either side
+    assert len(times) == 240
+    base_mins, base_maxs = envelope._mins[0], envelope._maxs[0]
+    for idx in (0, 1, 100, 239):
+        around = slice(max(0, idx - 2), min(240, idx + 3))
+        assert mins[idx] == min(base_mins[around])
+        assert maxs[idx] == max(base_maxs[around])
+
+
+def test_columns_skip_empty_bins_and_ranges():
+    envelope = TideEnvelope()
+    origin = _midnight(2026, 4, 5)
+    envelope.start_at(origin, TZ)
+    envelope.add([origin + 0.5 * HOUR, origin + 5.5 * HOUR], [1.0, 2.0])
+
+    times, mins, maxs = envelope.columns(origin, origin + 6 * HOUR, 100, window=HOUR)
+    assert list(times) == [origin + 0.5 * HOUR, origin + 5.5 * HOUR]
+    assert list(mins) == [1.0, 2.0]
+
+    assert len(envelope.columns(origin, origin, 100)[0]) == 0
+    assert len(TideEnvelope().columns(origin, origin + HOUR, 100)[0]) == 0
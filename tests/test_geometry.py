@@ -0,0 +1,79 @@
+"""Tests for the plot geometry and SVG path builders."""
+import re
+
+import pytest
+
+from custom_components.modern_tides_us.geometry import (
+    PlotGeometry,
+    band_path,
+    smooth_path,
+    to_pixels,
+)
+
+_NUMBER = re.compile(r"-?(?:\d+\.?\d*|\.\d+)")
+
+
+def _numbers(path):
+    """Return every number in ``path`` in order."""
+    return [float(value) for value in _NUMBER.findall(path)]
+
+
+def _line_vertices(path):
+    """Return the absolute vertices of an ``M x,y l dx dy ...`` path."""
+    values = _numbers(path)
+    x, y = values[0], values[1]
+    vertices = [(x, y)]
+    for i in range(2, len(values), 2):
+        x, y = x + values[i], y + values[i + 1]
+        vertices.append((x, y))
+    return vertices
+
+
+def test_to_pixels_maps_time_right_and_height_up():
+    xs, ys = to_pixels([100.0, 200.0], [0.0, 2.0], 100.0, 60.0, 0.5, 0.0, 340.0, 10.0)
+    assert list(xs) == [60.0, 110.0]
+    assert list(ys) == [340.0, 320.0]
+
+
+def test_plot_geometry_matches_bulk_mapping():
+    geometry = PlotGeometry(1000.0, 4600.0, 60.0, 0.2, -0.5, 340.0, 50.0)
+    xs, ys = geometry.pixels([1000.0, 2800.0], [-0.5, 1.5])
+
+    assert list(xs) == [geometry.x(1000.0), geometry.x(2800.0)]
+    assert list(ys) == [geometry.y(-0.5), geometry.y(1.5)]
+    assert geometry.contains(4600.0)
+    assert not geometry.contains(4600.5)
+
+
+def test_smooth_path_short_series_are_lines():
+    assert smooth_path([], []) == ""
+    assert smooth_path([1.25], [2.0]) == "M1.2,2"
+
+    path = smooth_path([0.0, 10.0, 20.0], [5.0, 0.0, 5.0])
+    assert path == "M0,5l10-5 10 5"
+
+
+def test_smooth_path_ends_on_the_last_point():
+    xs = [60.0 + i * 7.3 for i in range(200)]
+    ys = [200.0 + (i % 17) * 3.1 for i in range(200)]
+    path = smooth_path(xs, ys)
+
+    assert path.startswith("M60,200c")
+    values = _numbers(path)
+    # Each segment is dx1 dy1 dx2 dy2 dx dy; the end points add up exactly
+    # because the points are rounded before the offsets are taken
+    end_x = values[0] + sum(values[2 + 4::6])
+    end_y = values[1] + sum(values[2 + 5::6])
+    assert end_x == pytest.approx(round(xs[-1], 1), abs=1e-6)
+    assert end_y == pytest.approx(round(ys[-1], 1), abs=1e-6)
+
+
+def test_band_path_outlines_both_curves():
+    path = band_path([0.0, 10.0, 20.0], [1.0, 2.0, 3.0], [5.0, 6.0, 7.0])
+
+    assert path.endswith("z")
+    assert _line_vertices(path[:-1]) == [
+        (0.0, 1.0), (10.0, 2.0), (20.0, 3.0),
+        (20.0, 7.0), (10.0, 6.0), (0.0, 5.0),
+    ]
+    assert band_path([], [], []) == ""
@@ -0,0 +1,85 @@
+"""Tests for the built-in PNG rasterizer."""
+import struct
+import zlib
+
+from custom_components.modern_tides_us.raster import Canvas, encode_png, rasterize
+
+SVG = (
+    b'<svg width="40" height="20" xmlns="http://www.w3.org/2000/svg">'
+    b'<style>.bg{fill:#FFFFFF}.hi{fill:#DC143C}.curve{fill:none;stroke:#000000;stroke-width:2}</style>'
+    b'<rect class="bg" width="40" height="20"/>'
+    b'<circle class="hi" cx="10" cy="10" r="4"/>'
+    b'<path class="curve" d="M20,2l0 16"/>'
+    b'</svg>'
+)
+
+
+def _decode_png(data):
+    """Return (width, height, rgba) of an unfiltered 8-bit RGBA PNG, checking CRCs."""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    offset, chunks = 8, {}
+    while offset < len(data):
+        (length,) = struct.unpack_from(">I", data, offset)
+        kind = data[offset + 4:offset + 8]
+        body = data[offset + 8:offset + 8 + length]
+        (crc,) = struct.unpack_from(">I", data, offset + 8 + length)
+        assert crc == zlib.crc32(kind + body) & 0xFFFFFFFF
+        chunks[kind] = body
+        offset += 12 + length
+
+    width, height, depth, color_type = struct.unpack_from(">IIBB", chunks[b"IHDR"])
+    assert (depth, color_type) == (8, 6)
+    raw = zlib.decompress(chunks[b"IDAT"])
+    stride = width * 4 + 1
+    assert all(raw[y * stride] == 0 for y in range(height))
+    rgba = b"".join(raw[y * stride + 1:(y + 1) * stride] for y in range(height))
+    return width, height, rgba
+
+
+def _pixel(canvas, x, y):
+    start = (y * canvas.width + x) * 4
+    return tuple(canvas.pixels[start:start + 4])
+
+
+def test_encode_png_round_trip():
+    rgba = bytes(range(256)) * 3
+    assert _decode_png(encode_png(16, 12, rgba)) == (16, 12, rgba)
+
+
+def test_fill_span_clips_and_blends():
+    canvas = Canvas(4, 2)
+    canvas.fill_span(0, -5, 2, (255, 0, 0))
+    canvas.fill_span(5, 0, 4, (255, 0, 0))
+    canvas.fill_span(1, 0, 4, (0, 0, 255), alpha=0.5)
+
+    assert _pixel(canvas, 0, 0) == (255, 0, 0, 255)
+    assert _pixel(canvas, 2, 0) == (0, 0, 0, 0)
+    assert _pixel(canvas, 3, 1) == (0, 0, 128, 128)
+
+
+def test_rasterize_draws_styled_shapes():
+    canvas = rasterize(SVG)
+
+    assert (canvas.width, canvas.height) == (40, 20)
+    assert _pixel(canvas, 35, 2) == (255, 255, 255, 255)
+    assert _pixel(canvas, 10, 10) == (0xDC, 0x14, 0x3C, 255)
+    assert _pixel(canvas, 20, 10) == (0, 0, 0, 255)
+    # An unfilled path only paints its stroke
+    assert _pixel(canvas, 24, 10) == (255, 255, 255, 255)
+
+
+def test_rasterize_png_matches_the_canvas():
+    canvas = rasterize(SVG)
+    assert _decode_png(canvas.png()) == (40, 20, bytes(canvas.pixels))
+
+
+def test_text_is_drawn_with_the_bitmap_font():
+    document = (
+        b'<svg width="60" height="20" xmlns="http://www.w3.org/2000/svg">'
+        b'<text x="30" y="14" fill="#000000" text-anchor="middle">HI 1.2m</text></svg>'
+    )
+    canvas = rasterize(document)
+    inked = [x for x in range(60) for y in range(20) if _pixel(canvas, x, y)[3]]
+    assert inked
+    # Centred on x=30
+    assert abs((min(inked) + max(inked)) / 2 - 30) <= 2
@@ -0,0 +1,100 @@
+"""Tests for the tide series wire formats."""
+import datetime
+import json
+import struct
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.modern_tides_us.series import (
+    SERIES_ENCODERS,
+    SERIES_FORMATS,
+    SERIES_HEIGHT_UNIT,
+    SERIES_TIME_UNIT,
+    encode_binary,
+    encode_json,
+)
+from custom_components.modern_tides_us.timeline import TIDE_HIGH, TIDE_LOW, TideTimeline
+
+TZ = ZoneInfo("America/New_York")
+START = datetime.datetime(2026, 7, 4, tzinfo=TZ).timestamp()
+
+
+@pytest.fixture
+def view():
+    """A day of 6-minute points with four extremes."""
+    times = [START + i * 360 for i in range(240)]
+    heights = [round(1.0 + (i % 60) * 0.0173, 3) for i in range(240)]
+    extreme_times = [START + 3 * 3600, START + 9 * 3600 + 360, START + 15 * 3600, START + 21 * 3600]
+    return TideTimeline(
+        times, heights,
+        extreme_times, [2.1, -0.125, 2.3, 0.05], [TIDE_HIGH, TIDE_LOW, TIDE_HIGH, TIDE_LOW],
+        TZ, ["20260704"],
+    ).day_window(1)
+
+
+def _decode_binary(payload):
+    """Decode an MTS1 payload, checking each array is aligned for typed arrays."""
+    magic, count, extreme_count, time_unit, start = struct.unpack_from("<4sIIId", payload)
+    assert magic == b"MTS1"
+    offset = 24
+    arrays = []
+    for code, length in (("I", count), ("f", count), ("I", extreme_count), ("f", extreme_count)):
+        assert offset % 4 == 0
+        arrays.append(struct.unpack_from(f"<{length}{code}", payload, offset))
+        offset += 4 * length
+    types = payload[offset:offset + extreme_count]
+    assert offset + extreme_count == len(payload)
+    steps, heights, extreme_steps, extreme_heights = arrays
+    return {
+        "times": [start + step * time_unit for step in steps],
+        "heights": heights,
+        "extreme_times": [start + step * time_unit for step in extreme_steps],
+        "extreme_heights": extreme_heights,
+        "extreme_types": [TIDE_HIGH if kind else TIDE_LOW for kind in types],
+    }
+
+
+def test_binary_round_trip(view):
+    decoded = _decode_binary(encode_binary(view))
+
+    assert decoded["times"] == list(view.times)
+    assert decoded["heights"] == pytest.approx(list(view.heights), abs=1e-6)
+    assert decoded["extreme_times"] == list(view.extreme_times)
+    assert decoded["extreme_heights"] == pytest.approx(list(view.extreme_heights), abs=1e-6)
+    assert decoded["extreme_types"] == list(view.extreme_types)
+
+
+def test_json_round_trip(view):
+    payload = json.loads(encode_json(view))
+    assert payload["time_unit"] == SERIES_TIME_UNIT
+
+    def absolute(deltas):
+        times, step = [], 0
+        for delta in deltas:
+            step += delta
+            times.append(payload["start"] + step * payload["time_unit"])
+        return times
+
+    assert absolute(payload["times"]) == list(view.times)
+    assert [h * payload["height_unit"] for h in payload["heights"]] == pytest.approx(list(view.heights))
+    extremes = payload["extremes"]
+    assert absolute(extremes["times"]) == list(view.extreme_times)
+    assert [h * SERIES_HEIGHT_UNIT for h in extremes["heights"]] == pytest.approx([2.1, -0.125, 2.3, 0.05])
+    assert extremes["types"] == "HLHL"
+
+
+def test_json_deltas_are_small(view):
+    payload = json.loads(encode_json(view))
+    assert payload["times"][0] == 0
+    assert set(payload["times"][1:]) == {6}
+
+
+def test_empty_view_encodes():
+    empty = TideTimeline([], [], [], [], [], TZ).day_window(1)
+    assert _decode_binary(encode_binary(empty))["times"] == []
+    assert json.loads(encode_json(empty))["times"] == []
+
+
+def test_every_format_has_an_encoder():
+    assert set(SERIES_ENCODERS) == set(SERIES_FORMATS)
@@ -0,0 +1,88 @@
+"""Tests for the local sunrise and sunset ephemeris."""
+import datetime
+import threading
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.modern_tides_us import solar
+from custom_components.modern_tides_us.solar import SOLAR_CACHE_SIZE, sun_times, sun_times_range
+
+TZ = ZoneInfo("America/New_York")
+BOSTON = (42.3601, -71.0589)
+HONOLULU = (21.3069, -157.8583)
+TROMSO = (69.6492, 18.9553)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test with an empty ephemeris cache."""
+    solar._cache.clear()
+    yield
+    solar._cache.clear()
+
+
+def _local(timestamp, tz=TZ):
+    return datetime.datetime.fromtimestamp(timestamp, tz)
+
+
+def test_matches_the_noaa_calculator():
+    sunrise, sunset = sun_times(*BOSTON, datetime.date(2026, 6, 21))
+
+    # NOAA solar calculator: 05:07 and 20:25 EDT
+    tolerance = datetime.timedelta(minutes=2)
+    assert abs(_local(sunrise) - datetime.datetime(2026, 6, 21, 5, 7, tzinfo=TZ)) < tolerance
+    assert abs(_local(sunset) - datetime.datetime(2026, 6, 21, 20, 25, tzinfo=TZ)) < tolerance
+
+
+def test_events_belong_to_the_local_day():
+    # Honolulu's sunset is after midnight UTC
+    tz = ZoneInfo("Pacific/Honolulu")
+    day = datetime.date(2026, 12, 21)
+    sunrise, sunset = sun_times(*HONOLULU, day)
+    assert _local(sunrise, tz).date() == day
+    assert _local(sunset, tz).date() == day
+    assert datetime.datetime.fromtimestamp(sunset, datetime.timezone.utc).date() > day
+
+
+def test_polar_day_has_no_events():
+    assert sun_times(*TROMSO, datetime.date(2026, 6, 21)) == (None, None)
+    assert sun_times(*TROMSO, datetime.date(2026, 12, 21)) == (None, None)
+
+
+def test_range_matches_single_days():
+    start = datetime.date(2026, 3, 1)
+    days = sun_times_range(*BOSTON, start, 10)
+
+    solar._cache.clear()
+    assert days == [sun_times(*BOSTON, start + datetime.timedelta(days=i)) for i in range(10)]
+
+
+def test_cache_is_bounded():
+    sun_times_range(*BOSTON, datetime.date(2026, 1, 1), SOLAR_CACHE_SIZE + 50)
+    assert len(solar._cache) == SOLAR_CACHE_SIZE
+
+
+def test_concurrent_callers_agree():
+    start = datetime.date(2026, 1, 1)
+    expected = sun_times_range(*BOSTON, start, 400)
+    solar._cache.clear()
+
+    results, errors = [], []
+
+    def worker(offset):
+        try:
+            for i in range(20):
+                results.append(sun_times_range(*BOSTON, start, 400 - (offset * 20 + i) % 300))
+        except Exception as err:  # pylint: disable=broad-except
+            errors.append(err)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert all(result == expected[:len(result)] for result in results)
+    assert len(solar._cache) <= SOLAR_CACHE_SIZE
@@ -0,0 +1,98 @@
+"""Tests for the SVG writer helpers and artifact writes."""
+import gzip
+import os
+
+import pytest
+
+from custom_components.modern_tides_us import svg
+from custom_components.modern_tides_us.svg import (
+    GZIP_SUFFIX,
+    SvgWriter,
+    format_number,
+    format_numbers,
+    splice_overlay,
+    write_artifact,
+)
+
+DOCUMENT = b'<svg xmlns="http://www.w3.org/2000/svg"><rect width="10" height="10"/></svg>'
+
+
+@pytest.mark.parametrize("value, precision, expected", [
+    (15.0, 1, "15"),
+    (0.25, 2, ".25"),
+    (-0.25, 2, "-.25"),
+    (-0.01, 1, "0"),
+    (3.14159, 3, "3.142"),
+])
+def test_format_number_is_shortest(value, precision, expected):
+    assert format_number(value, precision) == expected
+
+
+def test_format_numbers_uses_minus_as_separator():
+    assert format_numbers([1.0, -2.5, 3.0, 0.5]) == "1-2.5 3 .5"
+
+
+def test_writer_rounds_floats_and_drops_none():
+    writer = SvgWriter(precision=1)
+    writer.element("circle", {"cx": 1.234, "cy": 5, "r": None, "class": "now"})
+    writer.element("text", {"x": 2.0}, "a < b")
+    assert writer.getvalue() == '<circle cx="1.2" cy="5" class="now"/><text x="2">a &lt; b</text>'
+
+
+def test_splice_overlay_goes_before_the_closing_tag():
+    assert splice_overlay(DOCUMENT, '<g id="x"/>').endswith(b'<g id="x"/></svg>')
+    assert splice_overlay(DOCUMENT, "") is DOCUMENT
+
+
+def test_write_artifact_skips_identical_documents(tmp_path):
+    target = tmp_path / "plot.svg"
+
+    assert write_artifact(str(target), DOCUMENT) is True
+    assert target.read_bytes() == DOCUMENT
+    os.utime(target, (1, 1))
+    inode = target.stat().st_ino
+
+    assert write_artifact(str(target), DOCUMENT) is False
+    assert target.stat().st_mtime == 1
+    assert target.stat().st_ino == inode
+
+    assert write_artifact(str(target), DOCUMENT.replace(b"10", b"20")) is True
+    assert target.read_bytes() == DOCUMENT.replace(b"10", b"20")
+    assert sorted(os.listdir(tmp_path)) == ["plot.svg"]
+
+
+def test_write_artifact_is_atomic(tmp_path, monkeypatch):
+    target = tmp_path / "plot.svg"
+    write_artifact(str(target), DOCUMENT)
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(svg.os, "replace", fail)
+    with pytest.raises(OSError):
+        write_artifact(str(target), b"<svg/>")
+
+    # The old file is intact and the temp file is cleaned up
+    assert target.read_bytes() == DOCUMENT
+    assert sorted(os.listdir(tmp_path)) == ["plot.svg"]
+
+
+def test_write_artifact_keeps_gzip_sibling_in_step(tmp_path):
+    target = tmp_path / "plot.svg"
+    gz_target = tmp_path / ("plot.svg" + GZIP_SUFFIX)
+
+    write_artifact(str(target), DOCUMENT, precompress=True)
+    compressed = gz_target.read_bytes()
+    assert gzip.decompress(compressed) == DOCUMENT
+
+    # Recreated when missing, byte-identical for the same document
+    gz_target.unlink()
+    assert write_artifact(str(target), DOCUMENT, precompress=True) is False
+    assert gz_target.read_bytes() == compressed
+
+    write_artifact(str(target), b"<svg/>", precompress=True)
+    assert gzip.decompress(gz_target.read_bytes()) == b"<svg/>"
+
+    # A stale sibling is removed once precompression is off
+    write_artifact(str(target), DOCUMENT)
+    assert not gz_target.exists()
@@ -0,0 +1,106 @@
+"""Tests for the tide timeline lookups."""
+import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.modern_tides_us.timeline import TIDE_HIGH, TIDE_LOW, TideTimeline
+
+TZ = ZoneInfo("America/New_York")
+
+
+def _day(date, points):
+    """Return one per-day API payload with ``(hora, altura, tipo)`` points."""
+    marea = [
+        {"hora": hora, "altura": str(altura), **({"tipo": tipo} if tipo else {})}
+        for hora, altura, tipo in points
+    ]
+    return {"date": date, "data": {"mareas": {"datos": {"marea": marea}}}}
+
+
+@pytest.fixture
+def timeline():
+    """Two days of hourly-ish points with extremes either side of midnight."""
+    return TideTimeline.from_daily_data([
+        _day("20260310", [
+            ("00:00", 1.0, None),
+            ("06:00", 0.2, TIDE_LOW),
+            ("12:00", 2.0, TIDE_HIGH),
+            ("18:00", 1.0, None),
+            ("23:30", 0.1, TIDE_LOW),
+        ]),
+        _day("20260311", [
+            ("00:30", 0.4, None),
+            ("05:45", 2.1, TIDE_HIGH),
+            ("12:00", 0.3, TIDE_LOW),
+        ]),
+    ], TZ)
+
+
+def test_parses_days_and_extremes(timeline):
+    assert len(timeline) == 8
+    assert timeline.extreme_count == 5
+    assert timeline.days == ("20260310", "20260311")
+    assert timeline.start == datetime.datetime(2026, 3, 10, 0, 0, tzinfo=TZ)
+
+
+def test_next_extreme_across_midnight(timeline):
+    evening = datetime.datetime(2026, 3, 10, 23, 45, tzinfo=TZ)
+
+    high = timeline.next_extreme(evening, TIDE_HIGH)
+    assert high["time"] == datetime.datetime(2026, 3, 11, 5, 45, tzinfo=TZ)
+    assert high["height"] == 2.1
+
+    low = timeline.next_extreme(evening, "low")
+    assert low["time"] == datetime.datetime(2026, 3, 11, 12, 0, tzinfo=TZ)
+    assert low["type"] == TIDE_LOW
+
+    assert timeline.next_extreme(evening)["type"] == TIDE_HIGH
+
+
+def test_next_extreme_includes_now_and_ends(timeline):
+    at_high = datetime.datetime(2026, 3, 10, 12, 0, tzinfo=TZ)
+    assert timeline.next_extreme(at_high, "high")["time"] == at_high
+
+    after = datetime.datetime(2026, 3, 12, tzinfo=TZ)
+    assert timeline.next_extreme(after) is None
+    assert timeline.next_extreme(after, "high") is None
+
+
+def test_next_extreme_rejects_unknown_kind(timeline):
+    with pytest.raises(ValueError):
+        timeline.next_extreme(datetime.datetime(2026, 3, 10, tzinfo=TZ), "slack")
+
+
+def test_height_at_interpolates(timeline):
+    assert timeline.height_at(datetime.datetime(2026, 3, 10, 9, 0, tzinfo=TZ)) == pytest.approx(1.1)
+    assert timeline.height_at(datetime.datetime(2026, 3, 10, 12, 0, tzinfo=TZ)) == 2.0
+
+
+def test_height_at_clamps_outside_the_series(timeline):
+    before = datetime.datetime(2026, 3, 9, 22, 0, tzinfo=TZ)
+    after = datetime.datetime(2026, 3, 11, 18, 0, tzinfo=TZ)
+
+    assert timeline.height_at(before) is None
+    assert timeline.height_at(after) is None
+    assert timeline.height_at(before, clamp=True) == 1.0
+    assert timeline.height_at(after, clamp=True) == 0.3
+    assert timeline.height_at(datetime.datetime(2026, 3, 11, 12, 0, tzinfo=TZ)) == 0.3
+
+
+def test_day_window_is_midnight_to_midnight(timeline):
+    view = timeline.day_window(1)
+    assert len(view) == 5
+    assert view.extreme_count == 3
+    assert view.end == datetime.datetime(2026, 3, 10, 23, 30, tzinfo=TZ)
+
+
+def test_fingerprint_follows_content(timeline):
+    def build(height):
+        return TideTimeline.from_daily_data([
+            _day("20260310", [("00:00", 1.0, None), ("06:00", height, TIDE_LOW)]),
+        ], TZ)
+
+    assert build(0.2).fingerprint == build(0.2).fingerprint
+    assert build(0.2).fingerprint != build(0.3).fingerprint
+    assert build(0.2).fingerprint != timeline.fingerprint
@@ -0,0 +1,32 @@
+"""Tests for the render worker bootstrap."""
+import os
+import subprocess
+import sys
+import textwrap
+
+from conftest import PACKAGE, ROOT
+
+from custom_components.modern_tides_us.worker import WORKER_RUN_NAME
+
+PACKAGE_DIR = os.path.join(ROOT, "custom_components", "modern_tides_us")
+
+
+def test_bootstrap_imports_modules_without_the_package_init():
+    # Run the bootstrap the way the process pool does, in a fresh interpreter
+    script = textwrap.dedent(f"""
+        import runpy, sys
+        sys.path.insert(0, {ROOT!r})
+        runpy.run_path(
+            {os.path.join(PACKAGE_DIR, "worker.py")!r},
+            {{"BOOTSTRAP_ARGS": {{"package": {PACKAGE!r}, "package_dir": {PACKAGE_DIR!r}, "time_zone": None}}}},
+            {WORKER_RUN_NAME!r},
+        )
+        from {PACKAGE}.timeline import TideTimeline
+        assert not hasattr(sys.modules[{PACKAGE!r}], "__file__")
+        assert "homeassistant" not in sys.modules
+        print(TideTimeline.__module__)
+    """)
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=False)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == f"{PACKAGE}.timeline"